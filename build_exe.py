@@ -62,6 +62,22 @@ a = Analysis(
     datas=[('quarterly sheets', 'quarterly sheets')] if os.path.exists('quarterly sheets') else [],
     hiddenimports=[
         'daily_summary_generator',
+        'project_list_snapshot',
+        'sheet_cache',
+        'vendor_scanner',
+        'xlsx_reader',
+        'network_mirror',
+        'file_locator',
+        'project_list_schema',
+        'date_columns',
+        'invoice_index',
+        'invoice_cube',
+        'ytd_index',
+        'run_manifest',
+        'report_writer',
+        'report_templates',
+        'xlsx_patcher',
+        'log_config',
         'pandas',
         'pandas.core.common',
         'pandas.core.ops',
@@ -86,6 +86,22 @@ def build_exe():
         "--noconfirm",
         "--clean",
         "--hidden-import=daily_summary_generator",
+        "--hidden-import=project_list_snapshot",
+        "--hidden-import=sheet_cache",
+        "--hidden-import=vendor_scanner",
+        "--hidden-import=xlsx_reader",
+        "--hidden-import=network_mirror",
+        "--hidden-import=file_locator",
+        "--hidden-import=project_list_schema",
+        "--hidden-import=date_columns",
+        "--hidden-import=invoice_index",
+        "--hidden-import=invoice_cube",
+        "--hidden-import=ytd_index",
+        "--hidden-import=run_manifest",
+        "--hidden-import=report_writer",
+        "--hidden-import=report_templates",
+        "--hidden-import=xlsx_patcher",
+        "--hidden-import=log_config",
         "daily_summary_gui.py"
     ]
     
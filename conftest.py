@@ -0,0 +1,113 @@
+"""
+Shared pytest fixtures: synthetic Project List workbooks and a sheet dump
+for comparing workbooks written by different code paths.
+"""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+from openpyxl import Workbook, load_workbook
+from openpyxl.styles import PatternFill
+
+import project_list_snapshot
+import sheet_cache
+
+PROJECT_LIST_HEADER = ['ACGI #', 'Dept', 'Project Number/Name', 'Type', 'Client / PO #', 'Line # ',
+                       'PO Date', 'Amount', 'Invoice Date', 'Amount Invoiced', 'Balance',
+                       'Completion Date', 'Receivable', 'Comments', 'Note1', 'Note2', 'Note3',
+                       'Note4', 'Note5', 'Note6', 'Note7', 'Vendor V', 'Vendor W']
+CYAN = PatternFill(start_color='FF03FFFF', end_color='FF03FFFF', fill_type='solid')
+CYAN_RGB = PatternFill(start_color='00FFFF', end_color='00FFFF', fill_type='solid')
+YELLOW = PatternFill(start_color='FFFFFF00', end_color='FFFFFF00', fill_type='solid')
+
+
+def build_project_list(path, year, rows=120, seed=0):
+    """
+    Write a Project List workbook like the real ones: title rows, the header
+    on row 6, invoice rows (some with text dates, blank rows and split invoice
+    comments), cyan and yellow vendor payment cells, and the footer rows.
+    """
+    rnd = random.Random(seed)
+    wb = Workbook()
+    ws = wb.active
+    ws.title = str(year)
+    wb.create_sheet('Other')
+    ws['A1'] = f'{year} Project List'
+    ws['B2'] = 'prepared by finance'
+    for column, name in enumerate(PROJECT_LIST_HEADER, 1):
+        ws.cell(row=6, column=column, value=name)
+
+    vendor_column = 22 if str(year) in ('2023', '2024') else 23
+    base = datetime(2025, 10, 1)
+    row = 7
+    for i in range(rows):
+        amount = round(rnd.uniform(100, 5000), 2)
+        invoiced = base + timedelta(days=rnd.randint(-40, 40))
+        split = rnd.random() < 0.1
+        values = [f'{str(year)[2:]}-{rnd.randint(1, 3000):04d}', rnd.choice(['ENG', 'FAB', 'QA']), f'P{i} name',
+                  rnd.choice(['Completion', 'Partial']), f'CL-{i}', rnd.randint(1, 9),
+                  invoiced - timedelta(days=30), amount,
+                  invoiced if rnd.random() < 0.9 else invoiced.strftime('%m/%d/%Y'),
+                  round(amount / 2, 2) if split else amount, None, invoiced]
+        for column, value in enumerate(values, 1):
+            ws.cell(row=row, column=column, value=value)
+        if split:
+            rest = invoiced + timedelta(days=20)
+            ws.cell(row=row, column=14, value=f'Invoiced at 50% on {invoiced:%m/%d/%Y}. Invoiced rest on {rest:%m/%d/%Y}')
+        if rnd.random() < 0.3:
+            cell = ws.cell(row=row, column=vendor_column, value=round(rnd.uniform(10, 900), 2))
+            cell.fill = rnd.choice([CYAN, CYAN_RGB, YELLOW])
+        row += 2 if rnd.random() < 0.03 else 1  # The odd blank row inside the data
+
+    row += 1
+    ws.cell(row=row, column=7, value='Totals')
+    for column in (8, 10, 11, 13):
+        ws.cell(row=row, column=column, value=round(rnd.uniform(1e5, 1e6), 2))
+    ws.cell(row=row + 1, column=7, value='To Invoice')
+    ws.cell(row=row + 1, column=8, value=1234.5)
+    ws.cell(row=row + 1, column=13, value=4321.25)
+    ws.cell(row=row + 2, column=7, value='Less hold')
+    ws.cell(row=row + 2, column=8, value=999.75)
+    wb.save(path)
+    return path
+
+
+def dump_sheet(path):
+    """Values, styles, merged ranges, column widths and size of a workbook's active sheet"""
+    wb = load_workbook(path)
+    ws = wb.active
+    cells = []
+    for row in ws.iter_rows():
+        for cell in row:
+            if cell.value is None and not cell.has_style:
+                continue
+            cells.append((cell.coordinate, cell.value, cell.number_format, cell.font.b,
+                          cell.font.color.rgb if cell.font.color else None, cell.fill.fgColor.rgb,
+                          cell.border.left.style, cell.border.top.style, cell.alignment.horizontal))
+    widths = {key: dimension.width for key, dimension in sorted(ws.column_dimensions.items())}
+    dump = {'title': ws.title, 'cells': cells, 'merged': sorted(str(r) for r in ws.merged_cells.ranges),
+            'widths': widths, 'max_row': ws.max_row}
+    wb.close()
+    return dump
+
+
+@pytest.fixture
+def project_list(tmp_path):
+    """Factory writing a Project List for a year into tmp_path"""
+    def make(year, rows=120, seed=0):
+        return str(build_project_list(tmp_path / f'{year} Project List.xlsx', year, rows, seed))
+    return make
+
+
+@pytest.fixture
+def sheet_dump():
+    return dump_sheet
+
+
+@pytest.fixture(autouse=True)
+def isolated_project_lists(tmp_path, monkeypatch):
+    """Give each test its own sheet cache, column declarations and snapshot store"""
+    monkeypatch.setattr(sheet_cache, '_sheet_cache', sheet_cache.SheetCache(str(tmp_path / 'sheet cache')))
+    monkeypatch.setattr(project_list_snapshot, '_column_requirements', {})
+    monkeypatch.setattr(project_list_snapshot, '_snapshots', {})
@@ -6,12 +6,37 @@ Generates daily invoicing summaries and updates quarterly YTD tracking.
 
 import pandas as pd
 from datetime import datetime, timedelta
+import logging
 import os
 import argparse
+import re
 import sys
+import time
 from openpyxl import load_workbook
 from openpyxl.styles.colors import Color
 from openpyxl.cell.cell import MergedCell
+import multiprocessing
+from project_list_snapshot import (get_project_list_snapshot, prefetch_project_list_snapshots,
+                                   require_invoice_columns, set_reader_engine)
+from xlsx_reader import READER_ENGINES
+from sheet_cache import SheetCache, configure_sheet_cache, print_cache_info
+from network_mirror import configure_network_mirror, get_network_mirror, seconds_until
+from file_locator import get_file_locator
+from invoice_index import InvoiceIndex
+from invoice_cube import InvoiceCube
+from log_config import SECTION, configure_logging
+from run_manifest import RunManifest
+from report_templates import DAILY_SUMMARY_TEMPLATE
+from report_writer import MergedRangeIndex, ReportSheet, register_report_styles, write_template_row
+from xlsx_patcher import XlsxRowAppender
+from ytd_index import YtdDateBlockIndex
+
+logger = logging.getLogger(__name__)
+
+# Project List columns read by the daily summary (header names) and the quarter collection (schema fields)
+INVOICE_COLUMNS = ['acgi', 'dept', 'project', 'type', 'client', 'line', 'po_date', 'amount', 'invoice_date',
+                   'amount_invoiced', 'completion_date']
+require_invoice_columns('daily_summary_generator', INVOICE_COLUMNS)
 
 def get_quarter_from_date(date):
     """Determine which quarter a date falls into"""
@@ -30,21 +55,34 @@ def get_quarter_name(quarter_num):
     quarter_names = {1: "1st", 2: "2nd", 3: "3rd", 4: "4th"}
     return quarter_names.get(quarter_num, str(quarter_num))
 
+# Row where the date tables of a YTD sheet start (after the monthly summary rows and empty rows)
+YTD_TABLES_FIRST_ROW = 5
+
+def get_ytd_filename(year, quarter_num):
+    """File name of the YTD sheet for a year and quarter"""
+    return f"{year} {get_quarter_name(quarter_num)} Quarter YTD.xlsx"
+
+def local_ytd_paths(target_date):
+    """Local locations the daily table for target_date can be written to (reports, then quarterly sheets)"""
+    ytd_filename = get_ytd_filename(target_date.year, get_quarter_from_date(target_date))
+    return [os.path.join('reports', ytd_filename), os.path.join('quarterly sheets', ytd_filename)]
+
 def find_ytd_sheet(year, quarter_num):
     """Find the YTD sheet for the given year and quarter with new priority flow"""
-    quarter_name = get_quarter_name(quarter_num)
-    ytd_filename = f"{year} {quarter_name} Quarter YTD.xlsx"
+    ytd_filename = get_ytd_filename(year, quarter_num)
+    
+    locator = get_file_locator()
     
     # Step 1: Check reports folder first
     reports_path = os.path.join('reports', ytd_filename)
-    if os.path.exists(reports_path):
-        print(f"✓ Found YTD sheet in reports folder: {reports_path}")
+    if locator.exists(reports_path):
+        logger.info("✓ Found YTD sheet in reports folder: %s", reports_path)
         return reports_path
     
     # Step 2: Not in reports, check N: drive and copy to quarterly sheets if found
-    n_drive_path = os.path.join(rf'N:\Project List\{year} Project List', ytd_filename)
-    if os.path.exists(n_drive_path):
-        print(f"✓ Found YTD sheet on N: drive: {n_drive_path}")
+    n_drive_path = os.path.join(locator.year_folder(year), ytd_filename)
+    if locator.exists(n_drive_path):
+        logger.info("✓ Found YTD sheet on N: drive: %s", n_drive_path)
         
         # Create quarterly sheets directory if it doesn't exist
         quarterly_sheets_dir = 'quarterly sheets'
@@ -52,218 +90,302 @@ def find_ytd_sheet(year, quarter_num):
         
         # Copy from N: drive to quarterly sheets
         quarterly_sheets_path = os.path.join(quarterly_sheets_dir, ytd_filename)
+        mirror = get_network_mirror()
+        if mirror is not None:
+            # Only copied again when the N: drive file changed since the last copy
+            local_path = mirror.fetch(n_drive_path, local_path=quarterly_sheets_path)
+            locator.invalidate(quarterly_sheets_dir)
+            if local_path:
+                logger.info("✓ Using local copy of YTD sheet: %s", local_path)
+            return local_path
         try:
             import shutil
             shutil.copy2(n_drive_path, quarterly_sheets_path)
-            print(f"✓ Copied YTD sheet from N: drive to quarterly sheets: {quarterly_sheets_path}")
+            locator.invalidate(quarterly_sheets_dir)
+            logger.info("✓ Copied YTD sheet from N: drive to quarterly sheets: %s", quarterly_sheets_path)
             return quarterly_sheets_path
         except Exception as e:
-            print(f"✗ Failed to copy YTD sheet from N: drive: {e}")
+            logger.error("Failed to copy YTD sheet from N: drive: %s", e)
             return None
     
     # Step 3: Check quarterly sheets as final fallback (in case it was already there)
     quarterly_sheets_path = os.path.join('quarterly sheets', ytd_filename)
-    if os.path.exists(quarterly_sheets_path):
-        print(f"✓ Found YTD sheet in quarterly sheets folder: {quarterly_sheets_path}")
+    if locator.exists(quarterly_sheets_path):
+        logger.info("✓ Found YTD sheet in quarterly sheets folder: %s", quarterly_sheets_path)
         return quarterly_sheets_path
     
-    print(f"⚠ YTD sheet not found in any location: {ytd_filename}")
+    logger.warning("YTD sheet not found in any location: %s", ytd_filename)
     return None
 
 def update_ytd_sheet_with_daily_table(target_date, daily_invoices_df):
     """Update the quarterly YTD sheet with the daily invoice table"""
     if daily_invoices_df.empty:
-        print("No daily invoices to add to YTD sheet")
+        logger.info("No daily invoices to add to YTD sheet")
         return True
-        
-    year = target_date.year
-    quarter_num = get_quarter_from_date(target_date)
+    return update_ytd_sheet(target_date.year, get_quarter_from_date(target_date),
+                            [(target_date, daily_invoices_df)])
+
+def update_ytd_sheet_with_daily_tables(daily_tables):
+    """
+    Update the quarterly YTD sheets with several days' invoice tables.
+    daily_tables is a list of (target_date, daily invoices) in date order; each
+    quarter's YTD sheet is opened and saved once. Returns {target_date: success}.
+    """
+    results = {}
+    quarters = {}
+    for target_date, daily_invoices_df in daily_tables:
+        if daily_invoices_df.empty:
+            logger.info("No daily invoices to add to YTD sheet for %s", target_date)
+            results[target_date] = True
+            continue
+        quarter = (target_date.year, get_quarter_from_date(target_date))
+        quarters.setdefault(quarter, []).append((target_date, daily_invoices_df))
     
-    print(f"\n[INFO] Attempting to update YTD sheet for {year} Q{quarter_num}...")
+    for (year, quarter_num), tables in quarters.items():
+        success = update_ytd_sheet(year, quarter_num, tables)
+        for target_date, _ in tables:
+            results[target_date] = success
+    return results
+
+def update_ytd_sheet(year, quarter_num, daily_tables):
+    """Write (target_date, daily invoices) tables into one quarter's YTD sheet with a single save"""
+    logger.info("Attempting to update YTD sheet for %s Q%s...", year, quarter_num, extra=SECTION)
     
     # Find the YTD sheet
     ytd_file_path = find_ytd_sheet(year, quarter_num)
     if not ytd_file_path:
-        print(f"[ERROR] YTD sheet not found for {year} Q{quarter_num}. Aborting update.")
+        logger.error("YTD sheet not found for %s Q%s. Aborting update.", year, quarter_num)
         return False
     else:
-        print(f"[INFO] YTD sheet found: {ytd_file_path}")
+        logger.info("YTD sheet found: %s", ytd_file_path)
+    
+    # New days after the last table of an indexed sheet are appended without loading the workbook
+    if append_daily_tables(ytd_file_path, daily_tables):
+        print_ytd_update(ytd_file_path, daily_tables, {target_date: False for target_date, _ in daily_tables})
+        return True
     
     try:
-        print(f"[DEBUG] Loading workbook: {ytd_file_path}")
+        logger.debug("Loading workbook: %s", ytd_file_path)
         wb = load_workbook(ytd_file_path)
         ws = wb.active
-        print(f"[DEBUG] Worksheet loaded. Max row: {ws.max_row}, Max column: {ws.max_column}")
-        
-        # Find where the date tables start (after the monthly summary rows and empty row)
-        date_section_start = 5  # Start looking from row 5
-        target_date_str = target_date.strftime('%A %m-%d-%Y')
-        print(f"[DEBUG] Looking for date string: {target_date_str}")
+        logger.debug("Worksheet loaded. Max row: %s, Max column: %s", ws.max_row, ws.max_column)
         
-        # Check if this date already exists
-        existing_date_row = None
-        current_row = date_section_start
-        while current_row <= ws.max_row:
-            cell_value = ws.cell(row=current_row, column=1).value
-            print(f"[DEBUG] Row {current_row} Col 1 value: {cell_value}")
-            if cell_value and target_date_str in str(cell_value):
-                existing_date_row = current_row
-                print(f"[INFO] Found existing date at row {current_row}")
-                break
-            current_row += 1
-        
-        if existing_date_row:
-            # Replace existing table
-            table_end_row = existing_date_row + 1
-            while table_end_row <= ws.max_row:
-                next_cell = ws.cell(row=table_end_row, column=1).value
-                print(f"[DEBUG] Checking end of table at row {table_end_row}: {next_cell}")
-                if next_cell and any(day in str(next_cell) for day in ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']):
-                    break
-                if not next_cell and table_end_row > existing_date_row + 3:
-                    break
-                table_end_row += 1
-            print(f"[INFO] Replacing table for {target_date_str} (rows {existing_date_row}-{table_end_row-1})")
-            # Unmerge any merged cells in the range to be cleared
-            print(f"[DEBUG] All merged ranges before clearing: {[str(rng) for rng in ws.merged_cells.ranges]}")
-            
-            # Direct approach: unmerge any merged range that contains the rows we want to clear
-            for merged_range in list(ws.merged_cells.ranges):
-                min_row, min_col, max_row, max_col = merged_range.bounds
-                # If this merged range overlaps with any row we want to clear, unmerge it
-                if min_row <= table_end_row and max_row >= existing_date_row:
-                    print(f"[DEBUG] Unmerging merged range {str(merged_range)} (rows {min_row}-{max_row})")
-                    try:
-                        ws.unmerge_cells(str(merged_range))
-                        print(f"[DEBUG] Successfully unmerged {str(merged_range)}")
-                    except Exception as unmerge_err:
-                        print(f"[ERROR] Failed to unmerge {str(merged_range)}: {unmerge_err}")
-            
-            # Print merged ranges after unmerging
-            print(f"[DEBUG] All merged ranges after unmerging: {[str(rng) for rng in ws.merged_cells.ranges]}")
-            
-            # Force worksheet state update by reloading the worksheet object
-            ws = wb.active
-            for row in range(existing_date_row, table_end_row):
-                for col in range(1, 11):
-                    cell = ws.cell(row=row, column=col)
-                    if isinstance(cell, MergedCell):
-                        print(f"[ERROR] About to clear a MergedCell at row {row}, col {col} (should have been unmerged!)")
-                        # Skip this cell and continue with the next one
-                        continue
-                    print(f"[DEBUG] Clearing cell at row {row}, col {col}")
-                    try:
-                        ws.cell(row=row, column=col).value = None
-                    except Exception as clear_err:
-                        print(f"[ERROR] Failed to clear cell at row {row}, col {col}: {clear_err}")
-            insert_row = existing_date_row
+        # Date block row ranges: from the sidecar if the workbook is unchanged, else one pass over the sheet
+        index = YtdDateBlockIndex.load(ytd_file_path)
+        if index is None:
+            index = YtdDateBlockIndex.scan(ytd_file_path, ws)
+            logger.debug("Indexed %s date blocks from the sheet", len(index.blocks))
         else:
-            insert_row = ws.max_row + 1
-            while insert_row > date_section_start and not any(ws.cell(row=insert_row-1, column=col).value for col in range(1, 11)):
-                insert_row -= 1
-            if insert_row > date_section_start:
-                insert_row += 2
-            print(f"[INFO] Adding new table for {target_date_str} at row {insert_row}")
+            logger.debug("Loaded date block index (%s date blocks)", len(index.blocks))
+        merged_ranges = MergedRangeIndex(ws)
+        
+        replaced = {}
+        for target_date, daily_invoices_df in daily_tables:
+            replaced[target_date] = write_daily_table(wb, index, merged_ranges, target_date, daily_invoices_df) is not None
         
-        # Define styles for the table
-        from openpyxl.styles import Font, PatternFill, Border, Side, Alignment
-        day_style = Font(bold=True, color="FFFFFF")
-        day_fill = PatternFill(start_color="00AA00", end_color="00AA00", fill_type="solid")
-        header_style = Font(bold=True)
-        header_fill = PatternFill(start_color="D3D3D3", end_color="D3D3D3", fill_type="solid")
-        total_style = Font(bold=True, color="FF0000")
-        regular_border = Border(
-            left=Side(border_style="thin", color="000000"),
-            right=Side(border_style="thin", color="000000"),
-            top=Side(border_style="thin", color="000000"),
-            bottom=Side(border_style="thin", color="000000")
-        )
-        center_align = Alignment(horizontal='center', vertical='center')
-        current_row = insert_row
-        # Add date header
-        date_header = f"{target_date_str} (Invoice Date)"
-        date_cell = ws.cell(row=current_row, column=1, value=date_header)
-        date_cell.font = day_style
-        date_cell.fill = day_fill
-        date_cell.alignment = center_align
-        date_cell.border = regular_border
-        ws.merge_cells(f'A{current_row}:J{current_row}')
-        print(f"[DEBUG] Wrote date header at row {current_row}")
-        current_row += 1
-        # Add column headers
-        headers = ["ACGI Project / Invoice #", "Dept", "Project Number / Name", "Type", 
-                  "Client / PO #", "Line #", "PO Date", "Amount", "Invoice Date", "Amount Invoiced"]
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=current_row, column=col, value=header)
-            cell.font = header_style
-            cell.fill = header_fill
-            cell.alignment = center_align
-            cell.border = regular_border
-            print(f"[DEBUG] Wrote header '{header}' at row {current_row}, col {col}")
-        current_row += 1
-        # Add data rows
-        daily_total = 0
-        for idx, (_, row) in enumerate(daily_invoices_df.iterrows()):
-            values = [
-                str(row.get('ACGI #', '')),
-                str(row.get('Dept', '')),
-                str(row.get('Project Number/Name', '')),
-                str(row.get('Type', '')),
-                str(row.get('Client / PO #', '')),
-                str(row.get('Line # ', '')),
-                row['PO Date'].strftime('%m/%d/%y') if pd.notna(row.get('PO Date')) else '',
-                float(row.get('Amount', 0)) if pd.notna(row.get('Amount', 0)) else 0,
-                row['Invoice Date'].strftime('%m/%d/%y') if pd.notna(row.get('Invoice Date')) else '',
-                float(row.get('Amount Invoiced', 0)) if pd.notna(row.get('Amount Invoiced', 0)) else 0
-            ]
-            for col, value in enumerate(values, 1):
-                cell = ws.cell(row=current_row, column=col, value=value)
-                cell.border = regular_border
-                if col in [8, 10] and isinstance(value, (int, float)):
-                    cell.number_format = '"$"#,##0.00'
-                    if col == 10:
-                        daily_total += value
-                print(f"[DEBUG] Wrote data at row {current_row}, col {col}: {value}")
-            current_row += 1
-        # Add total row
-        total_cell = ws.cell(row=current_row, column=1, value="Total")
-        total_cell.font = total_style
-        total_cell.border = regular_border
-        for col in range(2, 10):
-            cell = ws.cell(row=current_row, column=col, value="")
-            cell.border = regular_border
-        amount_total_cell = ws.cell(row=current_row, column=10, value=daily_total)
-        amount_total_cell.font = total_style
-        amount_total_cell.number_format = '"$"#,##0.00'
-        amount_total_cell.border = regular_border
-        print(f"[DEBUG] Wrote total row at {current_row}, total: {daily_total}")
         # Save with conditional backup logic
         # Only create backup if file is NOT in reports folder
-        is_in_reports = os.path.dirname(ytd_file_path).endswith('reports')
+        backup_file = ytd_backup_file(ytd_file_path)
         
         try:
-            if not is_in_reports:
+            if backup_file:
                 # Create backup for files in quarterly sheets folder
-                backup_file = ytd_file_path.replace('.xlsx', f'_backup_{datetime.now().strftime("%Y%m%d_%H%M%S")}.xlsx')
                 wb.save(backup_file)
-                print(f"[INFO] Backup saved: {backup_file}")
+                logger.info("Backup saved: %s", backup_file)
             else:
-                print(f"[INFO] File in reports folder - no backup needed")
+                logger.info("File in reports folder - no backup needed")
             
             wb.save(ytd_file_path)
-            print(f"[SUCCESS] YTD sheet updated and saved: {ytd_file_path}")
+            logger.info("✓ YTD sheet updated and saved: %s", ytd_file_path)
         except Exception as save_err:
-            print(f"[ERROR] Failed to save YTD sheet: {save_err}")
+            logger.error("Failed to save YTD sheet: %s", save_err)
             return False
-        action = "Updated existing" if existing_date_row else "Added new"
-        print(f"[SUCCESS] {action} daily table in YTD sheet: {ytd_file_path}")
-        print(f"  Date: {target_date_str}")
-        print(f"  Records: {len(daily_invoices_df)}")
+        try:
+            index.save()
+        except OSError as index_err:
+            logger.error("Failed to save date block index: %s", index_err)
+        print_ytd_update(ytd_file_path, daily_tables, replaced)
         return True
     except Exception as e:
-        print(f"[ERROR] Exception while updating YTD sheet: {e}")
+        logger.error("Exception while updating YTD sheet: %s", e)
         return False
 
+def ytd_backup_file(ytd_file_path):
+    """Path of the backup written before saving a YTD sheet, or None for files in the reports folder"""
+    if os.path.dirname(ytd_file_path).endswith('reports'):
+        return None
+    return ytd_file_path.replace('.xlsx', f'_backup_{datetime.now().strftime("%Y%m%d_%H%M%S")}.xlsx')
+
+def print_ytd_update(ytd_file_path, daily_tables, replaced):
+    """Report the day tables written into a YTD sheet (replaced is {target_date: table was replaced})"""
+    for target_date, daily_invoices_df in daily_tables:
+        action = "Updated existing" if replaced[target_date] else "Added new"
+        logger.info("✓ %s daily table in YTD sheet: %s", action, ytd_file_path)
+        logger.info("  Date: %s", target_date.strftime('%A %m-%d-%Y'))
+        logger.info("  Records: %s", len(daily_invoices_df))
+
+def append_daily_tables(ytd_file_path, daily_tables):
+    """
+    Append days that have no table yet after the last table of a YTD sheet by patching
+    the sheet XML, without loading the workbook. Only used while the sheet's date block
+    index is current; returns False (nothing written) if the sheet needs a full load and save.
+    """
+    index = YtdDateBlockIndex.load(ytd_file_path)
+    if index is None:
+        return False
+    if any(index.find(target_date.strftime('%A %m-%d-%Y')) for target_date, _ in daily_tables):
+        return False
+    
+    logger.debug("Appending %s table(s) to the sheet XML without loading the workbook", len(daily_tables))
+    try:
+        appender = XlsxRowAppender(ytd_file_path)
+        if register_report_styles(appender.workbook):
+            raise ValueError("the workbook has no report styles yet")
+        for target_date, daily_invoices_df in daily_tables:
+            target_date_str = target_date.strftime('%A %m-%d-%Y')
+            insert_row = index.append_row(YTD_TABLES_FIRST_ROW)
+            logger.info("Adding new table for %s at row %s", target_date_str, insert_row)
+            last_row = write_daily_table_rows(appender.worksheet, insert_row, target_date_str, daily_invoices_df)
+            index.record(target_date_str, insert_row, last_row)
+        
+        backup_file = ytd_backup_file(ytd_file_path)
+        if backup_file:
+            appender.save(backup_file)
+            logger.info("Backup saved: %s", backup_file)
+        else:
+            logger.info("File in reports folder - no backup needed")
+        appender.save(ytd_file_path)
+    except Exception as e:
+        logger.info("Could not append to the sheet XML (%s), loading the workbook instead", e)
+        return False
+    
+    logger.info("✓ YTD sheet updated and saved: %s", ytd_file_path)
+    try:
+        index.save()
+    except OSError as index_err:
+        logger.error("Failed to save date block index: %s", index_err)
+    return True
+
+def write_daily_table(wb, index, merged_ranges, target_date, daily_invoices_df):
+    """
+    Add or replace one day's invoice table in a loaded YTD workbook; returns the replaced table's row or None.
+    index and merged_ranges are the sheet's YtdDateBlockIndex and MergedRangeIndex, updated for the rows written.
+    """
+    ws = wb.active
+    
+    target_date_str = target_date.strftime('%A %m-%d-%Y')
+    logger.debug("Looking for date string: %s", target_date_str)
+    
+    # Check if this date already exists
+    existing_date_row = None
+    block = index.find(target_date_str)
+    table_rows = len(daily_invoices_df) + 3  # date header, column headers, invoices, total
+    
+    if block:
+        # Replace existing table
+        existing_date_row, old_last_row = block
+        logger.info("Found existing date at row %s", existing_date_row)
+        logger.info("Replacing table for %s (rows %s-%s)", target_date_str, existing_date_row, old_last_row)
+        # Unmerge the merged ranges that overlap the rows to be cleared
+        for bounds in merged_ranges.overlapping(existing_date_row, old_last_row):
+            coord = MergedRangeIndex.coord(bounds)
+            logger.debug("Unmerging merged range %s (rows %s-%s)", coord, bounds[0], bounds[1])
+            try:
+                merged_ranges.unmerge(bounds)
+                logger.debug("Successfully unmerged %s", coord)
+            except Exception as unmerge_err:
+                logger.error("Failed to unmerge %s: %s", coord, unmerge_err)
+        
+        # Force worksheet state update by reloading the worksheet object
+        ws = wb.active
+        for row in range(existing_date_row, old_last_row + 1):
+            for col in range(1, 11):
+                cell = ws.cell(row=row, column=col)
+                if isinstance(cell, MergedCell):
+                    logger.error("About to clear a MergedCell at row %s, col %s (should have been unmerged!)", row, col)
+                    # Skip this cell and continue with the next one
+                    continue
+                logger.debug("Clearing cell at row %s, col %s", row, col)
+                try:
+                    ws.cell(row=row, column=col).value = None
+                except Exception as clear_err:
+                    logger.error("Failed to clear cell at row %s, col %s: %s", row, col, clear_err)
+        
+        # A table that grew or shrank moves everything below it instead of overwriting it
+        delta = existing_date_row + table_rows - 1 - old_last_row
+        if index.last_row <= old_last_row:
+            index.last_row = existing_date_row + table_rows - 1
+        elif delta:
+            shift_rows_below(ws, index, merged_ranges, old_last_row, delta)
+        insert_row = existing_date_row
+    else:
+        insert_row = index.append_row(YTD_TABLES_FIRST_ROW)
+        logger.info("Adding new table for %s at row %s", target_date_str, insert_row)
+    
+    # Table rows use the daily summary's invoice table layout
+    register_report_styles(wb)
+    current_row = write_daily_table_rows(ws, insert_row, target_date_str, daily_invoices_df, merged_ranges)
+    index.record(target_date_str, insert_row, current_row)
+    return existing_date_row
+
+def write_daily_table_rows(ws, insert_row, target_date_str, daily_invoices_df, merged_ranges=None):
+    """Write a day's table (date header, column headers, invoices, total) from insert_row; returns its last row"""
+    current_row = insert_row
+    # Add date header
+    date_header = f"{target_date_str} (Invoice Date)"
+    write_template_row(ws, current_row, DAILY_SUMMARY_TEMPLATE, 'table title', [date_header],
+                       merged_ranges=merged_ranges)
+    logger.debug("Wrote date header at row %s", current_row)
+    current_row += 1
+    # Add column headers
+    headers = ["ACGI Project / Invoice #", "Dept", "Project Number / Name", "Type", 
+              "Client / PO #", "Line #", "PO Date", "Amount", "Invoice Date", "Amount Invoiced"]
+    write_template_row(ws, current_row, DAILY_SUMMARY_TEMPLATE, 'header', headers)
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        for col, header in enumerate(headers, 1):
+            logger.debug("Wrote header '%s' at row %s, col %s", header, current_row, col)
+    current_row += 1
+    # Add data rows
+    daily_total = 0
+    for idx, (_, row) in enumerate(daily_invoices_df.iterrows()):
+        values = [
+            str(row.get('ACGI #', '')),
+            str(row.get('Dept', '')),
+            str(row.get('Project Number/Name', '')),
+            str(row.get('Type', '')),
+            str(row.get('Client / PO #', '')),
+            str(row.get('Line # ', '')),
+            row['PO Date'].strftime('%m/%d/%y') if pd.notna(row.get('PO Date')) else '',
+            float(row.get('Amount', 0)) if pd.notna(row.get('Amount', 0)) else 0,
+            row['Invoice Date'].strftime('%m/%d/%y') if pd.notna(row.get('Invoice Date')) else '',
+            float(row.get('Amount Invoiced', 0)) if pd.notna(row.get('Amount Invoiced', 0)) else 0
+        ]
+        write_template_row(ws, current_row, DAILY_SUMMARY_TEMPLATE, 'invoice', values)
+        daily_total += values[9]
+        if debug:
+            for col, value in enumerate(values, 1):
+                logger.debug("Wrote data at row %s, col %s: %s", current_row, col, value)
+        current_row += 1
+    # Add total row
+    write_template_row(ws, current_row, DAILY_SUMMARY_TEMPLATE, 'invoice total', ["Total"] + [""] * 8 + [daily_total])
+    logger.debug("Wrote total row at %s, total: %s", current_row, daily_total)
+    return current_row
+
+def shift_rows_below(ws, index, merged_ranges, after_row, delta):
+    """Move the rows below after_row by delta rows (re-merging their merged ranges) and update the indexes"""
+    moved = merged_ranges.below(after_row)
+    for bounds in moved:
+        merged_ranges.unmerge(bounds)
+    if delta > 0:
+        ws.insert_rows(after_row + 1, delta)
+    else:
+        ws.delete_rows(after_row + 1 + delta, -delta)
+    for min_row, max_row, min_col, max_col in moved:
+        merged_ranges.merge(min_row + delta, min_col, max_row + delta, max_col)
+    index.shift(after_row, delta)
+    logger.info("Moved the rows below row %s by %s", after_row, delta)
+
 def get_user_input():
     """Get user input for date and other parameters"""
     print("=" * 60)
@@ -300,39 +422,61 @@ def get_user_input():
     
     return target_date, output_dir
 
-def scan_available_project_files(start_year=2023, end_year=2030):
+def scan_available_project_files(start_year=None, end_year=None):
     """
-    Scan for available Project List files from start_year to end_year.
+    Scan for available Project List files. Years are discovered from the
+    folder and file names in each location, optionally limited to start_year-end_year.
+    Files are not copied into the network mirror while scanning.
     Returns a list of tuples (year, filepath) for files that exist.
     """
     available_files = []
     
-    for year in range(start_year, end_year + 1):
-        year_str = str(year)
+    for year_str in get_file_locator().project_list_years():
+        if (start_year and int(year_str) < start_year) or (end_year and int(year_str) > end_year):
+            continue
         filename = f"{year_str} Project List.xlsx"
-        file_path = find_file_in_locations(filename)
+        file_path = find_file_in_locations(filename, use_mirror=False)
         
         if file_path:
             available_files.append((year_str, file_path))
-            print(f"✓ Found {year_str} Project List")
+            logger.info("✓ Found %s Project List", year_str)
         else:
-            print(f"✗ {year_str} Project List not found")
+            logger.error("%s Project List not found", year_str)
     
     return available_files
 
-def find_file_in_locations(filename):
+def network_project_list_path(year, filename):
+    """Path of a Project List workbook on the N: drive"""
+    return os.path.join(get_file_locator().year_folder(year), filename)
+
+def sync_network_mirror(years):
+    """
+    Refresh the local mirror copies of the N: drive Project Lists for years,
+    copying changed files concurrently. Returns {N: drive path: local path}.
+    """
+    mirror = get_network_mirror()
+    if mirror is None:
+        return {}
+    remote_paths = []
+    for year in years:
+        for ext in ['.xlsx', '.xlsm']:
+            n_drive_path = network_project_list_path(year, f"{year} Project List{ext}")
+            if get_file_locator().exists(n_drive_path):
+                remote_paths.append(n_drive_path)
+    return mirror.fetch_many(remote_paths)
+
+def find_file_in_locations(filename, use_mirror=True):
     """
     Find a file in N:\Project List\, quarterly sheets folder, or reports folder.
-    Tries both .xlsx and .xlsm extensions.
+    Tries both .xlsx and .xlsm extensions. With use_mirror N: drive files are read
+    through the local network mirror, which is used on its own when the N: drive is offline.
     Returns the full path if found, or None if not found in any location.
     """
+    locator = get_file_locator()
+    
     # Extract year from filename to build proper path structure
-    year = None
-    # Handle years 2023-2030
-    for y in range(2023, 2031):
-        if str(y) in filename:
-            year = str(y)
-            break
+    match = re.search(r'(\d{4})', filename)
+    year = match.group(1) if match else None
     
     # Try both .xlsx and .xlsm extensions
     base_filename = filename.replace('.xlsx', '').replace('.xlsm', '')
@@ -342,34 +486,47 @@ def find_file_in_locations(filename):
     if year:
         for ext in extensions:
             test_filename = base_filename + ext
-            n_drive_path = os.path.join(rf'N:\Project List\{year} Project List', test_filename)
-            if os.path.exists(n_drive_path):
-                print(f"✓ Found {test_filename} in N:\\Project List\\{year} Project List\\")
+            n_drive_path = network_project_list_path(year, test_filename)
+            if locator.exists(n_drive_path):
+                logger.info("✓ Found %s in N:\\Project List\\%s Project List\\", test_filename, year)
+                mirror = get_network_mirror() if use_mirror else None
+                if mirror is not None:
+                    return mirror.fetch(n_drive_path) or n_drive_path
                 return n_drive_path
+        
+        # N: drive unavailable: fall back to the last mirrored copy
+        mirror = get_network_mirror()
+        if mirror is not None:
+            for ext in extensions:
+                mirrored_path = mirror.cached_copy(network_project_list_path(year, base_filename + ext))
+                if mirrored_path:
+                    logger.warning("N: drive copy not available, using mirrored %s", os.path.basename(mirrored_path))
+                    return mirrored_path
     
     # Check local quarterly sheets folder
     for ext in extensions:
         test_filename = base_filename + ext
         local_path = os.path.join('quarterly sheets', test_filename)
-        if os.path.exists(local_path):
-            print(f"✓ Found {test_filename} in quarterly sheets folder")
+        if locator.exists(local_path):
+            logger.info("✓ Found %s in quarterly sheets folder", test_filename)
             return local_path
     
     # Check reports folder as backup
     for ext in extensions:
         test_filename = base_filename + ext
         reports_path = os.path.join('reports', test_filename)
-        if os.path.exists(reports_path):
-            print(f"✓ Found {test_filename} in reports folder")
+        if locator.exists(reports_path):
+            logger.info("✓ Found %s in reports folder", test_filename)
             return reports_path
     
     # Not found in any location
-    print(f"✗ {base_filename}.xlsx/.xlsm not found in N:\\Project List\\{year} Project List\\, quarterly sheets folder, or reports folder")
+    logger.error("%s.xlsx/.xlsm not found in N:\\Project List\\%s Project List\\, quarterly sheets folder, or reports folder", base_filename, year)
     return None
 
-def collect_completion_data_for_quarter(base_dir, quarter_year=2025, quarter_num=2, selected_years=None):
+def collect_completion_data_for_quarter(base_dir, quarter_year=2025, quarter_num=2, selected_years=None, workers=1):
     """
     Collect completion data for a specific quarter from all project lists.
+    workers > 1 parses uncached Project Lists in parallel processes.
     """
     # Use selected years if provided, otherwise default to 2023-2025
     if selected_years is None:
@@ -379,13 +536,14 @@ def collect_completion_data_for_quarter(base_dir, quarter_year=2025, quarter_num
     for year in selected_years:
         project_files.append((year, f'{year} Project List.xlsx'))
     
+    sync_network_mirror(selected_years)
     project_lists = []
     for year, filename in project_files:
         file_path = find_file_in_locations(filename)
         if file_path:
             project_lists.append((year, file_path))
         else:
-            print(f"Warning: Could not find {filename} for quarter data collection")
+            logger.warning("Could not find %s for quarter data collection", filename)
             continue
     
     # Define quarter date ranges
@@ -397,27 +555,22 @@ def collect_completion_data_for_quarter(base_dir, quarter_year=2025, quarter_num
     }
     
     if quarter_num not in quarter_ranges:
-        print(f"Invalid quarter number: {quarter_num}")
+        logger.info("Invalid quarter number: %s", quarter_num)
         return pd.DataFrame()
     
     q_start, q_end = quarter_ranges[quarter_num]
-    print(f"Collecting completion data for Q{quarter_num} {quarter_year} ({q_start.strftime('%Y-%m-%d')} to {q_end.strftime('%Y-%m-%d')})...")
+    logger.info("Collecting completion data for Q%s %s (%s to %s)...", quarter_num, quarter_year, q_start.strftime('%Y-%m-%d'), q_end.strftime('%Y-%m-%d'))
     
     all_completion_data = []
+    prefetch_project_list_snapshots(project_lists, workers)
     
     for year, file_path in project_lists:
         try:
-            df = pd.read_excel(file_path, sheet_name=year, header=5)
-            
-            # Get the correct column names (handle variations)
-            acgi_col = None
-            for col in df.columns:
-                if 'acgi' in str(col).lower() and '#' in str(col):
-                    acgi_col = col
-                    break
+            snapshot = get_project_list_snapshot(year, file_path)
+            df = snapshot.invoices
             
-            if acgi_col is None:
-                acgi_col = df.columns[0]  # Use first column as fallback
+            # ACGI column name varies by year (schema falls back to the first column)
+            acgi_col = snapshot.schema.column('acgi')
             
             completion_data = df[['Completion Date', 'Amount Invoiced', acgi_col, 'Project Number/Name', 'Client / PO #']].copy()
             completion_data = completion_data.rename(columns={acgi_col: 'ACGI #'})
@@ -436,10 +589,10 @@ def collect_completion_data_for_quarter(base_dir, quarter_year=2025, quarter_num
             if not quarter_data.empty:
                 quarter_data['Source_Year'] = year
                 all_completion_data.append(quarter_data)
-                print(f"Found {len(quarter_data)} Q{quarter_num} {quarter_year} completion records from {year}")
+                logger.info("Found %s Q%s %s completion records from %s", len(quarter_data), quarter_num, quarter_year, year)
             
         except Exception as e:
-            print(f"Error processing {year} Project List: {e}")
+            logger.error("Could not process %s Project List: %s", year, e)
     
     if all_completion_data:
         combined_data = pd.concat(all_completion_data, ignore_index=True)
@@ -454,7 +607,7 @@ def update_quarterly_ytd_file(base_dir, completion_data, quarter_year=2025, quar
     quarterly_file = os.path.join(base_dir, f'{quarter_year} {quarter_num}{"nd" if quarter_num == 2 else ("st" if quarter_num == 1 else ("rd" if quarter_num == 3 else "th"))} Quarter YTD.xlsx')
     
     if not os.path.exists(quarterly_file):
-        print(f"Quarterly file not found: {quarterly_file}")
+        logger.info("Quarterly file not found: %s", quarterly_file)
         return False
     
     try:
@@ -463,8 +616,8 @@ def update_quarterly_ytd_file(base_dir, completion_data, quarter_year=2025, quar
         
         # Calculate monthly totals
         if not completion_data.empty:
-            completion_data['Month'] = completion_data['Completion Date'].dt.month
-            monthly_totals = completion_data.groupby('Month')['Amount Invoiced'].sum()
+            cube = InvoiceCube.build(completion_data, date_column='Completion Date')
+            monthly_totals = {month.month: total for month, count, total in cube.by_month('Amount Invoiced')}
             
             # Map months to column numbers (assuming standard layout)
             month_columns = {1: 1, 2: 2, 3: 3, 4: 4, 5: 5, 6: 6, 7: 7, 8: 8, 9: 9, 10: 10, 11: 11, 12: 12}
@@ -501,22 +654,18 @@ def update_quarterly_ytd_file(base_dir, completion_data, quarter_year=2025, quar
         wb.save(backup_file)
         wb.save(quarterly_file)
         
-        print(f"✓ Updated quarterly YTD file: {quarterly_file}")
+        logger.info("✓ Updated quarterly YTD file: %s", quarterly_file)
         return True
         
     except Exception as e:
-        print(f"Error updating quarterly YTD file: {e}")
+        logger.error("Could not update quarterly YTD file: %s", e)
         return False
 
 
 
-def generate_summary(target_date, output_dir, selected_years=None):
-    """Generate the daily summary report"""
-    
-    print(f"\nGenerating summary for {target_date}...")
-    
-    # --- Configuration with Fallback Logic ---
-    print("Locating required files...")
+def locate_project_lists(selected_years=None):
+    """Find the Project List of each selected year; returns [(year, path)], or None if one is missing"""
+    logger.info("Locating required files...")
     
     # Find project list files with fallback
     invoice_sources = []
@@ -529,68 +678,35 @@ def generate_summary(target_date, output_dir, selected_years=None):
     for year in selected_years:
         project_files.append((year, f'{year} Project List.xlsx'))
     
+    sync_network_mirror(selected_years)
     for year, filename in project_files:
         file_path = find_file_in_locations(filename)
         if file_path:
             invoice_sources.append((year, file_path))
         else:
-            print(f"Error: Could not find {filename}")
-            return False
-    
-    # Create output directory
-    os.makedirs(output_dir, exist_ok=True)
-    print(f"✓ Output directory ready: {output_dir}")
-    
+            logger.error("Could not find %s", filename)
+            return None
+    return invoice_sources
+
+def load_summary_data(invoice_sources, workers=1):
+    """
+    Load everything the daily summaries need that does not depend on the
+    target date: the Project List snapshots, the invoice index and cube, and
+    the receivables / vendor payments by year. Returns a dict, or None on error.
+    """
+    selected_years = [year for year, path in invoice_sources]
     try:
         # --- 1) Load and combine all Amount Invoiced entries for date-based totals ---
-        print("Loading invoice data...")
-        inv_dfs = []
+        logger.info("Loading invoice data...")
+        snapshots = {}
+        prefetch_project_list_snapshots(invoice_sources, workers)
         for year, path in invoice_sources:
-            df = pd.read_excel(path, sheet_name=year, header=5)
-            df['Invoice Date'] = pd.to_datetime(df['Invoice Date'], errors='coerce').dt.date
-            inv_dfs.append(df)
-        invoices = pd.concat(inv_dfs, ignore_index=True)
-        
-        # --- 2) Compute periods ---
-        week_start  = target_date - timedelta(days=target_date.weekday())
-        month_start = target_date.replace(day=1)
-        
-        today_total = invoices.loc[invoices['Invoice Date']==target_date, 'Amount'].sum()
-        invoice_total = invoices.loc[invoices['Invoice Date']==target_date, 'Amount Invoiced'].sum()
-        week_total  = invoices.loc[(invoices['Invoice Date']>=week_start) & (invoices['Invoice Date']<=target_date), 'Amount Invoiced'].sum()
-        month_total = invoices.loc[(invoices['Invoice Date']>=month_start) & (invoices['Invoice Date']<=target_date), 'Amount Invoiced'].sum()
-        
-        # --- 3) Load vendor payments from the Project List for the target year ---
-        print("Loading vendor payment data from Project List...")
-
-        target_year = str(target_date.year)
-        project_file_dict = {year: path for year, path in invoice_sources}
-
-        if target_year not in project_file_dict:
-            print(f"Error: Project List file for year {target_year} not found.")
-            return False
-
-        # Read the Project List file for the target year
-        try:
-            df = pd.read_excel(project_file_dict[target_year], sheet_name=target_year, header=None)
-            # Find the last two non-empty rows in column G
-            non_empty_rows = []
-            for idx in range(len(df)):
-                if pd.notna(df.iloc[idx, 6]) and str(df.iloc[idx, 6]).strip():
-                    non_empty_rows.append(idx)
-            if len(non_empty_rows) < 2:
-                print(f"Error: Could not find enough non-empty rows in {target_year} Project List.")
-                return False
-            to_invoice_row = non_empty_rows[-2]
-            # Get vendor payment value from column M (index 12)
-            target_year_vendor_payment = float(df.iloc[to_invoice_row, 12])
-            print(f"Vendor payments for {target_year} (to invoice row): ${target_year_vendor_payment:,.2f}")
-        except Exception as e:
-            print(f"Error reading vendor payments from {target_year} Project List: {e}")
-            return False
+            snapshots[year] = get_project_list_snapshot(year, path)
+        invoices = InvoiceIndex.from_snapshots(snapshots)
+        cube = InvoiceCube.build(invoices.invoices)
         
-        # --- 4) Get receivables data from Project List files ---
-        print("Processing project list files for receivables data...")
+        # --- 2) Get receivables data from Project List files ---
+        logger.info("Processing project list files for receivables data...")
         years = selected_years
         recv_by_year = []
         pay_by_year = []
@@ -601,114 +717,44 @@ def generate_summary(target_date, output_dir, selected_years=None):
         
         for year in years:
             if year not in project_file_dict:
-                print(f"Warning: {year} project list not available for receivables processing")
+                logger.warning("%s project list not available for receivables processing", year)
                 recv_by_year.append(0)
                 pay_by_year.append(0)
                 continue
-                
-            file_path = project_file_dict[year]
-            df = pd.read_excel(file_path, sheet_name=year, header=None)
             
-            # Find the last two non-empty rows in column G
-            non_empty_rows = []
-            for idx in range(len(df)):
-                if pd.notna(df.iloc[idx, 6]) and str(df.iloc[idx, 6]).strip():
-                    non_empty_rows.append(idx)
+            snapshot = snapshots[year]
+            footer = snapshot.footer
+        
+            if footer is not None:
+                logger.info("Found rows in %s:", year)
+                logger.info("  Totals row %s: %s", footer.totals_row, footer.label('totals'))
+                logger.info("  To Invoice row %s: %s", footer.to_invoice_row, footer.label('to_invoice'))
+                logger.info("  Less hold row %s: %s", footer.less_hold_row, footer.label('less_hold'))
+            
+                year_data[year] = footer
             
-            if len(non_empty_rows) >= 2:
-                to_invoice_row = non_empty_rows[-2]
-                less_hold_row = non_empty_rows[-1]
-                totals_row = to_invoice_row - 1
-                
-                print(f"Found rows in {year}:")
-                print(f"  Totals row {totals_row}: {str(df.iloc[totals_row, 6]).strip()}")
-                print(f"  To Invoice row {to_invoice_row}: {str(df.iloc[to_invoice_row, 6]).strip()}")
-                print(f"  Less hold row {less_hold_row}: {str(df.iloc[less_hold_row, 6]).strip()}")
-                
-                year_data[year] = {
-                    'totals_row': totals_row,
-                    'to_invoice_row': to_invoice_row,
-                    'less_hold_row': less_hold_row
-                }
-                
                 try:
-                    recv_amount = float(df.iloc[totals_row, 12])  # Column M - one row higher than to_invoice_row
-                    
+                    recv_amount = float(footer.value('totals', 12))  # Column M - one row higher than to_invoice_row
+                
                     # Sum all amounts in vendor payment column for vendors to be paid - ONLY light blue/aqua colored cells
                     # 2023 & 2024 use Column V (22), 2025 uses Column W (23)
-                    pay_amount = 0
-                    colored_cells_count = 0
-                    
-                    # Use openpyxl to check cell colors
-                    
-                    wb = load_workbook(file_path)
-                    ws = wb[year] if year in wb.sheetnames else wb.active
-                    
-                    # Determine which column to use based on year
-                    if year in ['2023', '2024']:
-                        vendor_column = 22  # Column V (1-indexed for openpyxl)
-                        column_name = 'V'
-                    else:  # 2025 and later
-                        vendor_column = 23  # Column W (1-indexed for openpyxl)
-                        column_name = 'W'
-                    
-                    print(f"  {year} - Using Column {column_name} for vendor payments")
-                    
-                    for row_num in range(1, ws.max_row + 1):
-                        cell = ws.cell(row=row_num, column=vendor_column)
-                        cell_value = cell.value
-                        
-                        if cell_value is not None and str(cell_value).strip():
-                            # Check if cell has a fill color
-                            if cell.fill and cell.fill.start_color and cell.fill.start_color.rgb:
-                                color_rgb = cell.fill.start_color.rgb
-                                
-                                # Define the target cyan/aqua color: rgb(3,255,255) = 03FFFF
-                                # and similar cyan/aqua variations
-                                target_cyan_colors = [
-                                    '03FFFF',  # rgb(3,255,255) - Target color
-                                    '00FFFF',  # rgb(0,255,255) - Pure Cyan
-                                    '01FFFF',  # rgb(1,255,255) 
-                                    '02FFFF',  # rgb(2,255,255)
-                                    '04FFFF',  # rgb(4,255,255)
-                                    '05FFFF',  # rgb(5,255,255)
-                                    '06FFFF',  # rgb(6,255,255)
-                                    '07FFFF',  # rgb(7,255,255)
-                                    '08FFFF',  # rgb(8,255,255)
-                                    '09FFFF',  # rgb(9,255,255)
-                                    '0AFFFF',  # rgb(10,255,255)
-                                ]
-                                
-                                # Check if the cell color matches the target cyan color or close variants
-                                color_match = False
-                                if color_rgb.upper() in [color.upper() for color in target_cyan_colors]:
-                                    color_match = True
-                                elif color_rgb.upper().startswith('FF') and len(color_rgb) == 8:
-                                    # Handle ARGB format (FF + RGB)
-                                    rgb_part = color_rgb[2:]
-                                    if rgb_part.upper() in [color.upper() for color in target_cyan_colors]:
-                                        color_match = True
-                                
-                                if color_match:
-                                    try:
-                                        numeric_value = float(cell_value)
-                                        pay_amount += numeric_value
-                                        colored_cells_count += 1
-                                        print(f"    Added {year} Row {row_num} (color {color_rgb}): ${numeric_value:,.2f}")
-                                    except (ValueError, TypeError):
-                                        continue  # Skip non-numeric values
-                    
-                    wb.close()
-                    print(f"  {year} - Column {column_name} cyan cells total: ${pay_amount:,.2f} ({colored_cells_count} cells)")
-                    
+                    vendor_payments = snapshot.vendor_payments
+                    logger.info("  %s - Using Column %s for vendor payments", year, vendor_payments.column_name)
+                
+                    for row_num, numeric_value, color_rgb in vendor_payments.hits:
+                        logger.debug("    Added %s Row %s (color %s): $%s", year, row_num, color_rgb, format(numeric_value, ",.2f"))
+                
+                    pay_amount = vendor_payments.total
+                    logger.info("  %s - Column %s cyan cells total: $%s (%s cells)", year, vendor_payments.column_name, format(pay_amount, ",.2f"), vendor_payments.count)
+                
                     recv_by_year.append(recv_amount)
                     pay_by_year.append(pay_amount)
                 except Exception as e:
-                    print(f"Warning: Error reading data for {year}: {e}")
+                    logger.warning("Could not read data for %s: %s", year, e)
                     recv_by_year.append(0)
                     pay_by_year.append(0)
             else:
-                print(f"Warning: Could not find enough non-empty rows in {year} Project List")
+                logger.warning("Could not find enough non-empty rows in %s Project List", year)
                 recv_by_year.append(0)
                 pay_by_year.append(0)
         
@@ -717,55 +763,193 @@ def generate_summary(target_date, output_dir, selected_years=None):
         total_pay = sum(pay_by_year)
         net_receivables = total_rec - total_pay
         
-        # --- 5) Create Excel file with all tables in one sheet ---
-        print("Creating Excel file with tables...")
-        excel_file = os.path.join(output_dir, f'daily_summary_tables_{target_date.strftime("%Y%m%d")}.xlsx')
-        
-        # Import openpyxl components
-        from openpyxl import Workbook
-        from openpyxl.styles import Font, PatternFill, Border, Side, Alignment
-        from openpyxl.utils import get_column_letter
-        
-        # Create new workbook
-        wb = Workbook()
-        ws = wb.active
-        ws.title = 'Daily Summary Tables'
-        
-        # Define styles (same as quarterly_ytd_updater)
-        # Header style (bold, gray background)
-        header_style = Font(bold=True)
-        header_fill = PatternFill(start_color="D3D3D3", end_color="D3D3D3", fill_type="solid")
-        
-        # Title style (bold, green background)
-        title_style = Font(bold=True, color="FFFFFF")
-        title_fill = PatternFill(start_color="00AA00", end_color="00AA00", fill_type="solid")
+        return {
+            'years': years,
+            'invoice_sources': invoice_sources,
+            'project_file_dict': project_file_dict,
+            'snapshots': snapshots,
+            'invoices': invoices,
+            'cube': cube,
+            'recv_by_year': recv_by_year,
+            'pay_by_year': pay_by_year,
+            'year_data': year_data,
+            'total_rec': total_rec,
+            'total_pay': total_pay,
+            'net_receivables': net_receivables,
+        }
+    except Exception as e:
+        logger.error("Could not load summary data: %s", str(e))
+        return None
+
+def generate_summary(target_date, output_dir, selected_years=None, workers=1, force=False):
+    """
+    Generate the daily summary report (workers > 1 parses Project Lists in parallel).
+    If the Project Lists, YTD sheet, years and code are unchanged since the last
+    run for target_date, the existing report is reused unless force is set.
+    """
+    
+    logger.info("Generating summary for %s...", target_date, extra=SECTION)
+    
+    invoice_sources = locate_project_lists(selected_years)
+    if invoice_sources is None:
+        return False
+    selected_years = [year for year, path in invoice_sources]
+    
+    manifest = RunManifest(output_dir)
+    ytd_paths = local_ytd_paths(target_date)
+    if not force:
+        results = manifest.lookup(target_date, RunManifest.inputs(target_date, selected_years, invoice_sources, ytd_paths))
+        if results is not None:
+            logger.info("✓ Inputs unchanged since the last run - reusing the existing summary (use --force to regenerate)")
+            print_summary_results(results)
+            return True
+    
+    data = load_summary_data(invoice_sources, workers)
+    if data is None:
+        return False
+    
+    # Create output directory
+    os.makedirs(output_dir, exist_ok=True)
+    logger.info("✓ Output directory ready: %s", output_dir)
+    
+    results = write_daily_summary(target_date, output_dir, data)
+    if results is None:
+        return False
+    
+    # Recorded after the run, so the YTD sheet fingerprints include this run's own update
+    try:
+        manifest.record(target_date, RunManifest.inputs(target_date, selected_years, invoice_sources, ytd_paths),
+                        results, [results['excel_file']])
+    except Exception as e:
+        logger.warning("Could not update run manifest: %s", e)
+    return True
+
+def batch_dates(start_date, end_date, invoices):
+    """Business days from start_date to end_date, plus any weekend day with invoices"""
+    dates = []
+    day = start_date
+    while day <= end_date:
+        if day.weekday() < 5 or len(invoices.on(day)):
+            dates.append(day)
+        day += timedelta(days=1)
+    return dates
+
+def generate_summaries(start_date, end_date, output_dir, selected_years=None, workers=1):
+    """
+    Generate the daily summary reports for a range of dates (e.g. catching up after
+    an outage). The Project Lists are loaded once, and each affected quarterly YTD
+    sheet is opened and saved once with all of its day tables.
+    """
+    logger.info("Generating summaries from %s to %s...", start_date, end_date, extra=SECTION)
+    
+    invoice_sources = locate_project_lists(selected_years)
+    if invoice_sources is None:
+        return False
+    data = load_summary_data(invoice_sources, workers)
+    if data is None:
+        return False
+    
+    os.makedirs(output_dir, exist_ok=True)
+    logger.info("✓ Output directory ready: %s", output_dir)
+    
+    dates = batch_dates(start_date, end_date, data['invoices'])
+    logger.info("Generating %s daily summaries...", len(dates))
+    failed = []
+    for target_date in dates:
+        logger.info("--- %s ---", target_date.strftime('%A %m-%d-%Y'), extra=SECTION)
+        if write_daily_summary(target_date, output_dir, data, update_ytd=False) is None:
+            failed.append(target_date)
+    
+    # --- Update the quarterly YTD sheets, one open/save per quarter ---
+    logger.info("=" * 50, extra=SECTION)
+    logger.info("UPDATING QUARTERLY YTD SHEETS")
+    logger.info("=" * 50)
+    daily_tables = [(target_date, data['invoices'].on(target_date)) for target_date in dates if target_date not in failed]
+    ytd_results = update_ytd_sheet_with_daily_tables(daily_tables)
+    ytd_failed = [target_date for target_date, success in ytd_results.items() if not success]
+    
+    logger.info("✓ Generated %s of %s daily summaries in %s", len(dates) - len(failed), len(dates), output_dir, extra=SECTION)
+    for target_date in failed:
+        logger.error("Daily summary failed: %s", target_date)
+    for target_date in ytd_failed:
+        logger.warning("YTD sheet update failed or skipped: %s", target_date)
+    return not failed
+
+def print_summary_results(results):
+    """Print the closing summary of a daily report"""
+    logger.info("✓ Summary generated successfully!", extra=SECTION)
+    logger.info("  Excel File (with summary and tables): %s", results['excel_file'])
+    if results['ytd_success']:
+        target_date = datetime.strptime(results['date'], '%Y-%m-%d').date()
+        quarter_num = get_quarter_from_date(target_date)
+        logger.info("  YTD Sheet: Updated %s Q%s Quarter YTD", target_date.year, quarter_num)
+    logger.info("  Date: %s", results['date'])
+    logger.info("  Today's Total: $%s", format(results['today_total'], ",.2f"))
+    logger.info("  Total Payments Received: $%s", format(results['daily_total'], ",.2f"))
+    logger.info("  Week Total: $%s", format(results['week_total'], ",.2f"))
+    logger.info("  Month Total: $%s", format(results['month_total'], ",.2f"))
+
+def write_daily_summary(target_date, output_dir, data, update_ytd=True):
+    """
+    Write one day's summary workbook from loaded summary data (and its YTD day table if update_ytd).
+    Returns the report's results (file, totals), or None on error.
+    """
+    invoices = data['invoices']
+    cube = data['cube']
+    snapshots = data['snapshots']
+    years = data['years']
+    project_file_dict = data['project_file_dict']
+    recv_by_year = data['recv_by_year']
+    pay_by_year = data['pay_by_year']
+    year_data = data['year_data']
+    total_rec = data['total_rec']
+    total_pay = data['total_pay']
+    net_receivables = data['net_receivables']
+    
+    try:
+        # --- 3) Compute periods ---
+        week_start  = target_date - timedelta(days=target_date.weekday())
+        month_start = target_date.replace(day=1)
         
-        # Total style (bold, red font)
-        total_style = Font(bold=True, color="FF0000")
+        today_total = cube.total('Amount', target_date, target_date)
+        invoice_total = cube.total('Amount Invoiced', target_date, target_date)
+        week_total  = cube.total('Amount Invoiced', week_start, target_date)
+        month_total = cube.total('Amount Invoiced', month_start, target_date)
         
-        # Regular border
-        regular_border = Border(
-            left=Side(border_style="thin", color="000000"),
-            right=Side(border_style="thin", color="000000"),
-            top=Side(border_style="thin", color="000000"),
-            bottom=Side(border_style="thin", color="000000")
-        )
+        # --- 4) Load vendor payments from the Project List for the target year ---
+        logger.info("Loading vendor payment data from Project List...")
+
+        target_year = str(target_date.year)
+        if target_year not in project_file_dict:
+            logger.error("Project List file for year %s not found.", target_year)
+            return None
+
+        # Read the Project List file for the target year
+        try:
+            # Footer rows are located once per file (last two non-empty rows in column G)
+            footer = snapshots[target_year].footer
+            if footer is None:
+                logger.error("Could not find enough non-empty rows in %s Project List.", target_year)
+                return None
+            # Get vendor payment value from column M (index 12)
+            target_year_vendor_payment = float(footer.value('to_invoice', 12))
+            logger.info("Vendor payments for %s (to invoice row): $%s", target_year, format(target_year_vendor_payment, ",.2f"))
+        except Exception as e:
+            logger.error("Could not read vendor payments from %s Project List: %s", target_year, e)
+            return None
         
-        # Center alignment
-        center_align = Alignment(horizontal='center', vertical='center')
+        # --- 5) Create Excel file with all tables in one sheet ---
+        logger.info("Creating Excel file with tables...")
+        excel_file = os.path.join(output_dir, f'daily_summary_tables_{target_date.strftime("%Y%m%d")}.xlsx')
         
-        current_row = 1
+        # Build the sheet row by row; it is streamed into a write-only workbook on save
+        sheet = ReportSheet('Daily Summary Tables', DAILY_SUMMARY_TEMPLATE)
         
         # --- ADD SUMMARY SECTION AT TOP ---
         # Main title
         summary_title = f"Daily Invoicing Summary - {target_date.strftime('%A, %B %d, %Y')}"
-        title_cell = ws.cell(row=current_row, column=1, value=summary_title)
-        title_cell.font = Font(bold=True, size=16, color="FFFFFF")
-        title_cell.fill = PatternFill(start_color="003366", end_color="003366", fill_type="solid")
-        title_cell.alignment = center_align
-        title_cell.border = regular_border
-        ws.merge_cells(f'A{current_row}:J{current_row}')
-        current_row += 2
+        sheet.write('summary title', [summary_title])
+        sheet.skip()
         
         # Summary data rows
         summary_data = [
@@ -779,67 +963,41 @@ def generate_summary(target_date, output_dir, selected_years=None):
         ]
         
         for label, value in summary_data:
-            # Label in column A
-            label_cell = ws.cell(row=current_row, column=1, value=label)
-            label_cell.font = Font(bold=True)
-            label_cell.border = regular_border
-            
-            # Value in column B
-            value_cell = ws.cell(row=current_row, column=2, value=value)
-            value_cell.font = Font(bold=True, color="0000AA")
-            value_cell.border = regular_border
-            
-            # Empty cells for formatting consistency
-            for col in range(3, 11):
-                ws.cell(row=current_row, column=col, value="").border = regular_border
-            
-            current_row += 1
+            # Label in column A, value in column B, empty cells for formatting consistency
+            sheet.write('summary', [label, value] + [""] * 8)
         
         # Add spacing after summary
-        current_row += 3
+        sheet.skip(3)
         
         # Table 1: Invoice Details
-        daily_inv = invoices[invoices['Invoice Date']==target_date]
+        daily_inv = invoices.on(target_date)
         
-        # --- Update YTD Sheet with Daily Table ---
-        print("\n" + "="*50)
-        print("UPDATING QUARTERLY YTD SHEET")
-        print("="*50)
-        
-        ytd_success = update_ytd_sheet_with_daily_table(target_date, daily_inv)
-        if ytd_success:
-            print("✓ YTD sheet updated successfully")
-        else:
-            print("⚠ YTD sheet update failed or skipped")
-        
-        print("="*50)
-        print("CONTINUING WITH DAILY SUMMARY GENERATION")
-        print("="*50 + "\n")
+        # --- Update YTD Sheet with Daily Table (batch mode updates it once at the end) ---
+        ytd_success = False
+        if update_ytd:
+            logger.info("=" * 50, extra=SECTION)
+            logger.info("UPDATING QUARTERLY YTD SHEET")
+            logger.info("=" * 50)
+            
+            ytd_success = update_ytd_sheet_with_daily_table(target_date, daily_inv)
+            if ytd_success:
+                logger.info("✓ YTD sheet updated successfully")
+            else:
+                logger.warning("YTD sheet update failed or skipped")
+            
+            logger.info("=" * 50)
+            logger.info("CONTINUING WITH DAILY SUMMARY GENERATION")
+            logger.info("=" * 50)
         
-        # Title row
-        ws.cell(row=current_row, column=1, value=f"Invoices for {target_date.strftime('%A %m-%d-%Y')}")
-        title_cell = ws.cell(row=current_row, column=1)
-        title_cell.font = title_style
-        title_cell.fill = title_fill
-        title_cell.alignment = center_align
-        title_cell.border = regular_border
-        # Merge title across columns
-        ws.merge_cells(f'A{current_row}:J{current_row}')
-        current_row += 1
+        # Title row (merged across the table)
+        sheet.write('table title', [f"Invoices for {target_date.strftime('%A %m-%d-%Y')}"])
         
         # Column headers
         headers = ["ACGI Project / Invoice #", "Dept", "Project Number / Name", "Type", 
                   "Client / PO #", "Line #", "PO Date", "Amount", "Invoice Date", "Amount Invoiced"]
+        sheet.write('header', headers)
         
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=current_row, column=col, value=header)
-            cell.font = header_style
-            cell.fill = header_fill
-            cell.alignment = center_align
-            cell.border = regular_border
-        current_row += 1
-        
-        # Data rows
+        # Data rows (Amount and Amount Invoiced with currency formatting)
         daily_total = 0
         
         for _, row in daily_inv.iterrows():
@@ -856,217 +1014,96 @@ def generate_summary(target_date, output_dir, selected_years=None):
                 row['Invoice Date'].strftime('%m/%d/%y') if pd.notna(row.get('Invoice Date')) else '',
                 float(row.get('Amount Invoiced', 0)) if pd.notna(row.get('Amount Invoiced')) else 0
             ]
-            
-            for col, value in enumerate(values, 1):
-                cell = ws.cell(row=current_row, column=col, value=value)
-                cell.border = regular_border
-                # Format currency columns
-                if col in [8, 10] and isinstance(value, (int, float)):
-                    cell.number_format = '"$"#,##0.00'
-                    daily_total += value if col == 10 else 0
-            
-            current_row += 1
+            sheet.write('invoice', values)
+            daily_total += values[9]
         
         # Total row
-        total_cell = ws.cell(row=current_row, column=1, value="Total")
-        total_cell.font = total_style
-        total_cell.border = regular_border
-        
-        for col in range(2, 10):
-            cell = ws.cell(row=current_row, column=col, value="")
-            cell.border = regular_border
-        
-        amount_total_cell = ws.cell(row=current_row, column=10, value=daily_total)
-        amount_total_cell.font = total_style
-        amount_total_cell.number_format = '"$"#,##0.00'
-        amount_total_cell.border = regular_border
-        
-        current_row += 1
-        print("✓ Added Invoice Details table")
+        sheet.write('invoice total', ["Total"] + [""] * 8 + [daily_total])
+        logger.info("✓ Added Invoice Details table")
         
         # Add spacing between tables
-        current_row += 3
+        sheet.skip(3)
         
         # Table 2: Receivables vs Vendors
-        # Title row
-        ws.cell(row=current_row, column=1, value="Receivables vs. Vendors to be Paid by Year")
-        title_cell = ws.cell(row=current_row, column=1)
-        title_cell.font = title_style
-        title_cell.fill = title_fill
-        title_cell.alignment = center_align
-        title_cell.border = regular_border
-        ws.merge_cells(f'A{current_row}:C{current_row}')
-        current_row += 1
-        
-        # Headers
-        headers = ['Year', 'Receivables', 'Vendors to be paid']
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=current_row, column=col, value=header)
-            cell.font = header_style
-            cell.fill = header_fill
-            cell.alignment = center_align
-            cell.border = regular_border
-        current_row += 1
+        sheet.write('receivables title', ["Receivables vs. Vendors to be Paid by Year"])
+        sheet.write('header', ['Year', 'Receivables', 'Vendors to be paid'])
         
         # Data rows
         for yr, rcv, pay in zip(years, recv_by_year, pay_by_year):
-            ws.cell(row=current_row, column=1, value=str(yr)).border = regular_border
-            
-            rcv_cell = ws.cell(row=current_row, column=2, value=rcv)
-            rcv_cell.number_format = '"$"#,##0.00'
-            rcv_cell.border = regular_border
-            
-            pay_cell = ws.cell(row=current_row, column=3, value=pay)
-            pay_cell.number_format = '"$"#,##0.00'
-            pay_cell.border = regular_border
-            
-            current_row += 1
+            sheet.write('receivables', [str(yr), rcv, pay])
         
         # Total row
-        total_cell = ws.cell(row=current_row, column=1, value="Total")
-        total_cell.font = total_style
-        total_cell.border = regular_border
-        
-        total_rcv_cell = ws.cell(row=current_row, column=2, value=total_rec)
-        total_rcv_cell.font = total_style
-        total_rcv_cell.number_format = '"$"#,##0.00'
-        total_rcv_cell.border = regular_border
-        
-        total_pay_cell = ws.cell(row=current_row, column=3, value=total_pay)
-        total_pay_cell.font = total_style
-        total_pay_cell.number_format = '"$"#,##0.00'
-        total_pay_cell.border = regular_border
-        
-        current_row += 1
-        print("✓ Added Receivables vs Vendors table")
+        sheet.write('receivables total', ["Total", total_rec, total_pay])
+        logger.info("✓ Added Receivables vs Vendors table")
         
         # Table 3-5: Year Details
         for year in ['2023', '2024', '2025']:
             if year not in year_data or year not in project_file_dict:
-                print(f"⚠ Skipping {year} Details - data not available")
+                logger.warning("Skipping %s Details - data not available", year)
                 continue
                 
             # Add spacing between tables
-            current_row += 3
+            sheet.skip(3)
             
             # Title row
-            ws.cell(row=current_row, column=1, value=f'{year} Details')
-            title_cell = ws.cell(row=current_row, column=1)
-            title_cell.font = title_style
-            title_cell.fill = title_fill
-            title_cell.alignment = center_align
-            title_cell.border = regular_border
-            ws.merge_cells(f'A{current_row}:G{current_row}')
-            current_row += 1
+            sheet.write('details title', [f'{year} Details'])
             
-            file_path = project_file_dict[year]
             try:
-                df = pd.read_excel(file_path, sheet_name=year, header=None)
-                rows = year_data[year]
-                
-                # Row 1 (totals row)
-                try:
-                    ws.cell(row=current_row, column=2, value=float(df.iloc[rows['totals_row'], 7]))
-                    ws.cell(row=current_row, column=4, value=float(df.iloc[rows['totals_row'], 9]))
-                    ws.cell(row=current_row, column=5, value=float(df.iloc[rows['totals_row'], 10]))
-                    ws.cell(row=current_row, column=7, value=float(df.iloc[rows['totals_row'], 12]))
-                    
-                    # Format currency
-                    for col in [2, 4, 5, 7]:
-                        cell = ws.cell(row=current_row, column=col)
-                        cell.number_format = '"$"#,##0.00'
-                        cell.border = regular_border
-                except (ValueError, TypeError, IndexError) as e:
-                    print(f"Warning: Could not convert some values in {year} totals row: {e}")
+                footer = year_data[year]
                 
-                # Add borders to empty cells in row 1
-                for col in range(1, 8):
-                    if ws.cell(row=current_row, column=col).value is None:
-                        ws.cell(row=current_row, column=col, value="").border = regular_border
-                current_row += 1
-                
-                # Row 2 (to invoice row)
-                ws.cell(row=current_row, column=1, value="To Invoice").border = regular_border
-                try:
-                    cell2 = ws.cell(row=current_row, column=2, value=float(df.iloc[rows['to_invoice_row'], 7]))
-                    cell2.number_format = '"$"#,##0.00'
-                    cell2.border = regular_border
-                    
-                    cell7 = ws.cell(row=current_row, column=7, value=float(df.iloc[rows['to_invoice_row'], 12]))
-                    cell7.number_format = '"$"#,##0.00'
-                    cell7.border = regular_border
-                except (ValueError, TypeError, IndexError) as e:
-                    print(f"Warning: Could not convert some values in {year} to invoice row: {e}")
-                
-                # Add borders to empty cells in row 2
-                for col in range(1, 8):
-                    if ws.cell(row=current_row, column=col).value is None:
-                        ws.cell(row=current_row, column=col, value="").border = regular_border
-                current_row += 1
-                
-                # Row 3 (less hold row)
-                ws.cell(row=current_row, column=1, value="To invoice less hold").border = regular_border
-                try:
-                    cell2 = ws.cell(row=current_row, column=2, value=float(df.iloc[rows['less_hold_row'], 7]))
-                    cell2.number_format = '"$"#,##0.00'
-                    cell2.border = regular_border
-                except (ValueError, TypeError, IndexError) as e:
-                    print(f"Warning: Could not convert some values in {year} less hold row: {e}")
-                
-                # Add borders to empty cells in row 3
-                for col in range(1, 8):
-                    if ws.cell(row=current_row, column=col).value is None:
-                        ws.cell(row=current_row, column=col, value="").border = regular_border
-                current_row += 1
+                # Footer rows: (label, footer row, row name, [(column, Project List column), ...])
+                detail_rows = [
+                    ('', 'totals', 'totals', [(2, 7), (4, 9), (5, 10), (7, 12)]),
+                    ("To Invoice", 'to_invoice', 'to invoice', [(2, 7), (7, 12)]),
+                    ("To invoice less hold", 'less_hold', 'less hold', [(2, 7)]),
+                ]
+                for label, footer_row, row_name, columns in detail_rows:
+                    values = [label] + [""] * 6
+                    try:
+                        for col, footer_col in columns:
+                            values[col - 1] = float(footer.value(footer_row, footer_col))
+                    except (ValueError, TypeError, IndexError) as e:
+                        logger.warning("Could not convert some values in %s %s row: %s", year, row_name, e)
+                    sheet.write('details', values)
                 
-                print(f"✓ Added {year} Details table")
+                logger.info("✓ Added %s Details table", year)
                 
             except Exception as e:
-                print(f"Error processing {year} Details: {e}")
-                current_row += 1
-        
-        # Auto-adjust column widths for the entire sheet
-        for col in range(1, 11):  # Covers all columns used
-            column_letter = get_column_letter(col)
-            max_length = 0
-            for row in ws[column_letter]:
-                try:
-                    if len(str(row.value)) > max_length:
-                        max_length = len(str(row.value))
-                except:
-                    pass
-            adjusted_width = max(max_length + 2, 12)
-            ws.column_dimensions[column_letter].width = adjusted_width
+                logger.error("Could not process %s Details: %s", year, e)
+                sheet.skip()
         
         # Save the workbook
         try:
-            wb.save(excel_file)
-            print(f"✓ Successfully created Excel file: {excel_file}")
+            sheet.save(excel_file)
+            logger.info("✓ Successfully created Excel file: %s", excel_file)
         except Exception as e:
-            print(f"Error saving Excel file: {e}")
-            return False
+            logger.error("Could not save Excel file: %s", e)
+            return None
         
-        print(f"\n✓ Summary generated successfully!")
-        print(f"  Excel File (with summary and tables): {excel_file}")
-        if ytd_success:
-            quarter_num = get_quarter_from_date(target_date)
-            print(f"  YTD Sheet: Updated {target_date.year} Q{quarter_num} Quarter YTD")
-        print(f"  Date: {target_date}")
-        print(f"  Today's Total: ${today_total:,.2f}")
-        print(f"  Total Payments Received: ${daily_total:,.2f}")
-        print(f"  Week Total: ${week_total:,.2f}")
-        print(f"  Month Total: ${month_total:,.2f}")
-        
-        return True
+        results = {
+            'date': target_date.isoformat(),
+            'excel_file': excel_file,
+            'ytd_success': ytd_success,
+            'today_total': float(today_total),
+            'daily_total': float(daily_total),
+            'week_total': float(week_total),
+            'month_total': float(month_total),
+        }
+        print_summary_results(results)
+        return results
         
     except Exception as e:
-        print(f"Error generating summary: {str(e)}")
-        return False
+        logger.error("Could not generate summary: %s", str(e))
+        return None
 
 def main():
     """Main function"""
     parser = argparse.ArgumentParser(description='Generate daily invoicing summary reports')
     parser.add_argument('--date', '-d', help='Target date (YYYY-MM-DD)')
+    parser.add_argument('--from', dest='from_date', metavar='YYYY-MM-DD',
+                        help='Batch mode: generate every business day from this date (loads the data once)')
+    parser.add_argument('--to', dest='to_date', metavar='YYYY-MM-DD',
+                        help='With --from, last date to generate (default: today)')
     parser.add_argument('--data-dir', help='Data directory path (default: fwytdreport)')
     parser.add_argument('--output-dir', help='Output directory path (default: reports)')
     parser.add_argument('--years', nargs='+', help='Years to process (e.g., --years 2023 2024 2025)')
@@ -1075,32 +1112,88 @@ def main():
     parser.add_argument('--update-ytd', action='store_true', help='Update quarterly YTD file')
     parser.add_argument('--quarter', type=int, default=2, help='Quarter number (1-4)')
     parser.add_argument('--year', type=int, default=2025, help='Year for quarterly update')
+    parser.add_argument('--no-cache', action='store_true', help='Re-parse Project Lists instead of using the sheet cache')
+    parser.add_argument('--cache-info', action='store_true', help='Show the contents of the sheet cache')
+    parser.add_argument('--clear-cache', action='store_true', help='Remove all entries from the sheet cache')
+    parser.add_argument('--engine', choices=READER_ENGINES, default='openpyxl',
+                        help='Workbook reader engine for Project List reads (default: openpyxl)')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Parse up to N Project Lists in parallel processes (default: 1)')
+    parser.add_argument('--no-mirror', action='store_true', help='Read N: drive files directly instead of the local mirror')
+    parser.add_argument('--sync-mirror', action='store_true',
+                        help='Refresh the local mirror of the N: drive Project Lists and exit')
+    parser.add_argument('--sync-at', metavar='HH:MM', help='With --sync-mirror, wait until this time of day first')
+    parser.add_argument('--force', action='store_true',
+                        help='Regenerate the summary even if its inputs are unchanged since the last run')
+    parser.add_argument('--verbose', '-v', action='store_true', help='Also show debug output')
     
     args = parser.parse_args()
+    configure_logging(verbose=args.verbose)
+    
+    # Handle sheet cache options
+    if args.cache_info:
+        print_cache_info()
+        return
+    
+    if args.clear_cache:
+        removed = SheetCache().purge()
+        logger.info("✓ Removed %s cached sheets", removed)
+        return
+    
+    if args.no_cache:
+        configure_sheet_cache(enabled=False)
+    
+    # Handle network mirror options
+    if args.no_mirror:
+        configure_network_mirror(enabled=False)
+    
+    if args.sync_mirror:
+        if args.sync_at:
+            logger.info("Waiting until %s to refresh the network mirror...", args.sync_at)
+            time.sleep(seconds_until(args.sync_at))
+        mirrored = sync_network_mirror(args.years or ['2023', '2024', '2025'])
+        logger.info("✓ Network mirror up to date (%s files)", sum(1 for path in mirrored.values() if path))
+        return
+    
+    set_reader_engine(args.engine)
     
     # Handle scan files option
     if args.scan_files:
-        print("Scanning for available Project List files...")
-        available_files = scan_available_project_files(2023, 2030)
+        logger.info("Scanning for available Project List files...")
+        available_files = scan_available_project_files()
         if available_files:
-            print(f"Found {len(available_files)} available files:")
+            logger.info("Found %s available files:", len(available_files))
             for year, path in available_files:
-                print(f"  {year}: {path}")
+                logger.info("  %s: %s", year, path)
         else:
-            print("No Project List files found in any location.")
+            logger.info("No Project List files found in any location.")
         return
     
-    if args.interactive or not any([args.date, args.data_dir, args.output_dir]):
+    if args.to_date and not args.from_date:
+        logger.error("--to requires --from")
+        sys.exit(1)
+    
+    if args.interactive or not any([args.date, args.from_date, args.data_dir, args.output_dir]):
         # Interactive mode
         target_date, output_dir = get_user_input()
         selected_years = None  # Use default years in interactive mode
     else:
         # Command line mode
-        if args.date:
+        if args.from_date:
+            try:
+                start_date = datetime.strptime(args.from_date, "%Y-%m-%d").date()
+                end_date = datetime.strptime(args.to_date, "%Y-%m-%d").date() if args.to_date else datetime.now().date()
+            except ValueError:
+                logger.error("Invalid date format. Use YYYY-MM-DD")
+                sys.exit(1)
+            if end_date < start_date:
+                logger.error("--to date is before --from date")
+                sys.exit(1)
+        elif args.date:
             try:
                 target_date = datetime.strptime(args.date, "%Y-%m-%d").date()
             except ValueError:
-                print("Error: Invalid date format. Use YYYY-MM-DD")
+                logger.error("Invalid date format. Use YYYY-MM-DD")
                 sys.exit(1)
         else:
             target_date = datetime.now().date()
@@ -1109,44 +1202,50 @@ def main():
         
         # Validate and convert years to strings
         if args.years:
+            available_years = get_file_locator().project_list_years()
             selected_years = []
             for year in args.years:
                 try:
                     year_int = int(year)
-                    if 2023 <= year_int <= 2030:
+                    if str(year_int) in available_years:
                         selected_years.append(str(year_int))
                     else:
-                        print(f"Error: Year {year} is not in the supported range (2023-2030)")
+                        logger.error("No %s Project List found (available years: %s)", year,
+                                     ', '.join(available_years) or 'none')
                         sys.exit(1)
                 except ValueError:
-                    print(f"Error: '{year}' is not a valid year")
+                    logger.error("'%s' is not a valid year", year)
                     sys.exit(1)
         else:
             selected_years = None  # Use defaults
     
-    # Generate the summary
-    success = generate_summary(target_date, output_dir, selected_years)
+    # Generate the summary (or every summary in the --from/--to range)
+    if args.from_date and not args.interactive:
+        success = generate_summaries(start_date, end_date, output_dir, selected_years, workers=args.workers)
+    else:
+        success = generate_summary(target_date, output_dir, selected_years, workers=args.workers, force=args.force)
     
     if success:
-        print("\nReport generation completed successfully!")
+        logger.info("Report generation completed successfully!", extra=SECTION)
     else:
-        print("\nReport generation failed!")
+        logger.info("Report generation failed!", extra=SECTION)
         sys.exit(1)
 
     # Update quarterly YTD if requested
     if args.update_ytd:
-        print(f"\nUpdating quarterly YTD for Q{args.quarter} {args.year}...")
-        completion_data = collect_completion_data_for_quarter(output_dir, args.year, args.quarter)
+        logger.info("Updating quarterly YTD for Q%s %s...", args.quarter, args.year, extra=SECTION)
+        completion_data = collect_completion_data_for_quarter(output_dir, args.year, args.quarter, workers=args.workers)
         
         if not completion_data.empty:
-            print(f"Found {len(completion_data)} completion records for Q{args.quarter} {args.year}")
+            logger.info("Found %s completion records for Q%s %s", len(completion_data), args.quarter, args.year)
             success = update_quarterly_ytd_file(output_dir, completion_data, args.year, args.quarter)
             if success:
-                print("✓ Quarterly YTD update completed")
+                logger.info("✓ Quarterly YTD update completed")
             else:
-                print("✗ Quarterly YTD update failed")
+                logger.error("Quarterly YTD update failed")
         else:
-            print("No completion data found for the specified quarter")
+            logger.info("No completion data found for the specified quarter")
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     main() 
\ No newline at end of file
@@ -8,12 +8,15 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from datetime import datetime
 import threading
+import multiprocessing
 import os
 import sys
 import subprocess
 
 # Import the main functionality from the original script
 from daily_summary_generator import generate_summary, scan_available_project_files
+from network_mirror import NETWORK_ROOT, get_network_mirror
+from log_config import configure_logging
 
 class DailySummaryGUI:
     def __init__(self, root):
@@ -25,6 +28,7 @@ class DailySummaryGUI:
         # Variables
         self.target_date_var = tk.StringVar(value=datetime.now().strftime("%Y-%m-%d"))
         self.output_dir_var = tk.StringVar(value="reports")
+        self.verbose_var = tk.BooleanVar(value=False)
         self.year_vars = {}  # Will store year checkboxes
         self.available_years = []  # Will store available years
         
@@ -120,6 +124,9 @@ class DailySummaryGUI:
         ttk.Button(button_frame, text="Exit", command=self.root.quit, 
                   width=12).pack(side=tk.LEFT)
         
+        ttk.Checkbutton(button_frame, text="Verbose log", 
+                       variable=self.verbose_var).pack(side=tk.LEFT, padx=(10, 0))
+        
         # Output text area
         output_frame = ttk.LabelFrame(main_frame, text="Output Log", padding="5")
         output_frame.grid(row=9, column=0, columnspan=3, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(20, 0))
@@ -154,9 +161,15 @@ class DailySummaryGUI:
         """Set up year selection checkboxes"""
         # Scan for available files
         try:
-            available_files = scan_available_project_files(2023, 2030)
+            available_files = scan_available_project_files()
             self.available_years = [year for year, _ in available_files]
             
+            # Copy changed N: drive files into the local mirror while the user picks options
+            mirror = get_network_mirror()
+            remote_paths = [path for _, path in available_files if path.startswith(NETWORK_ROOT)]
+            if mirror is not None and remote_paths:
+                mirror.start_prefetch(remote_paths)
+            
             if not self.available_years:
                 ttk.Label(parent_frame, text="No Project List files found in any location.", 
                          foreground='red').pack(pady=10)
@@ -226,6 +239,10 @@ class DailySummaryGUI:
         self.output_text.see(tk.END)
         self.root.update_idletasks()
         
+    def log_record(self, message):
+        """Queue a log record for the output log (called from the generation thread)"""
+        self.root.after(0, self.log_message, message)
+        
     def validate_inputs(self):
         """Validate user inputs"""
         # Validate date
@@ -277,24 +294,9 @@ class DailySummaryGUI:
             self.log_message(f"Selected years: {', '.join(selected_years)}")
             self.log_message("-" * 50)
             
-            # Redirect stdout to capture print statements
-            import io
-            import contextlib
-            
-            old_stdout = sys.stdout
-            captured_output = io.StringIO()
-            
-            with contextlib.redirect_stdout(captured_output):
-                success = generate_summary(target_date, output_dir, selected_years)
-            
-            # Restore stdout
-            sys.stdout = old_stdout
-            
-            # Display captured output
-            output_lines = captured_output.getvalue().split('\n')
-            for line in output_lines:
-                if line.strip():
-                    self.root.after(0, self.log_message, line)
+            # Show log records in the output log as they are written
+            configure_logging(verbose=self.verbose_var.get(), callback=self.log_record)
+            success = generate_summary(target_date, output_dir, selected_years)
             
             # Show result
             if success:
@@ -363,6 +365,8 @@ def main():
     if not check_dependencies():
         return
         
+    configure_logging()
+    
     # Create and run the GUI
     root = tk.Tk()
     app = DailySummaryGUI(root)
@@ -378,4 +382,5 @@ def main():
     root.mainloop()
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     main() 
\ No newline at end of file
@@ -0,0 +1,97 @@
+"""
+Date Columns
+Bulk conversion of Project List date columns. Date cells arrive as
+datetimes (date-formatted cells), Excel serial numbers or typed m/d/Y text;
+each representation is converted column-wide in one call instead of one
+value at a time, and cells that are not dates are summarized in a report.
+"""
+
+from datetime import date
+import pandas as pd
+from pandas.api.types import is_datetime64_any_dtype
+
+# Excel serial day numbers (1900 date system) count from this day
+EXCEL_EPOCH = '1899-12-30'
+
+# Serials outside 1900-01-01 .. 2262-04-11 (the datetime64[ns] limit) are not treated as dates
+MIN_EXCEL_SERIAL = 1
+MAX_EXCEL_SERIAL = 133_769
+
+# Typed dates in the Project Lists are normally m/d/Y
+TEXT_DATE_FORMAT = '%m/%d/%Y'
+
+# Row numbers listed in a report before it is cut short
+REPORT_ROW_LIMIT = 5
+
+
+class DateParseReport:
+    """Unparseable cells of one date column: how many, and the first few rows and values"""
+
+    def __init__(self, label, rows, values, limit=REPORT_ROW_LIMIT):
+        self.label = label
+        self.count = len(rows)
+        self.rows = list(rows[:limit])
+        self.values = list(values[:limit])
+
+    def __bool__(self):
+        return self.count > 0
+
+    def summary(self):
+        """One-line description, e.g. "3 unparseable Invoice Date values (rows 12, 40, 77)" """
+        rows = ', '.join(str(row) for row in self.rows)
+        more = ', ...' if self.count > len(self.rows) else ''
+        examples = ', '.join(repr(value) for value in self.values[:3])
+        noun = 'value' if self.count == 1 else 'values'
+        return f"{self.count} unparseable {self.label} {noun} (rows {rows}{more}; e.g. {examples})"
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def parse_date_column(values, label='date', first_row=None, limit=REPORT_ROW_LIMIT):
+    """
+    Convert a column of date cells to datetime64 in bulk.
+
+    Datetimes are kept, Excel serial numbers are converted from the 1900 date
+    system, and text is read as m/d/Y first and then in any other format pandas
+    recognizes. Blank cells (NaN, empty text) become NaT silently; anything else
+    that is not a date becomes NaT and is listed in the report. With first_row
+    (the sheet row of index label 0) the report cites sheet row numbers.
+    Returns (datetime Series, DateParseReport).
+    """
+    values = pd.Series(values)
+    if is_datetime64_any_dtype(values):
+        return values, DateParseReport(label, [], [], limit)
+
+    result = pd.Series(pd.NaT, index=values.index, dtype='datetime64[ns]')
+    is_datetime = values.map(lambda value: isinstance(value, date)).astype(bool)
+    is_number = values.map(_is_number).astype(bool)
+    is_text = values.map(lambda value: isinstance(value, str)).astype(bool)
+
+    if is_datetime.any():
+        result[is_datetime] = pd.to_datetime(values[is_datetime], errors='coerce')
+
+    numbers = values[is_number].astype(float)
+    serials = numbers[(numbers >= MIN_EXCEL_SERIAL) & (numbers <= MAX_EXCEL_SERIAL)]
+    if len(serials):
+        result[serials.index] = pd.to_datetime(serials, unit='D', origin=EXCEL_EPOCH)
+
+    text = values[is_text].str.strip()
+    text = text[text != '']
+    if len(text):
+        parsed = pd.to_datetime(text, format=TEXT_DATE_FORMAT, errors='coerce')
+        other = text[parsed.isna()]
+        if len(other):
+            # Other spellings: each distinct string is read once, in whatever format it uses
+            distinct = other.unique()
+            lookup = dict(zip(distinct, pd.to_datetime(pd.Series(distinct), format='mixed', errors='coerce')))
+            parsed[other.index] = other.map(lookup)
+        result[parsed.index] = parsed
+
+    blank = values.isna() | (is_text & (values.where(is_text, '').astype(str).str.strip() == ''))
+    failed = result.isna() & ~blank
+    rows = failed[failed].index.tolist()
+    if first_row is not None:
+        rows = [first_row + row for row in rows]
+    return result, DateParseReport(label, rows, values[failed].tolist(), limit)
@@ -0,0 +1,145 @@
+"""
+File Locator
+Resolves Project List and YTD workbooks across the N: drive, the
+'quarterly sheets' folder and the 'reports' folder. Each directory is listed
+once and its listing reused for a TTL, so lookups (including misses) cost no
+extra filesystem probes, and the N: drive is probed with a timeout so a
+disconnected share fails fast instead of hanging.
+"""
+
+import logging
+import os
+import re
+import threading
+import time
+from network_mirror import NETWORK_ROOT
+
+logger = logging.getLogger(__name__)
+
+# Local folders searched after the N: drive, in priority order
+LOCAL_DIRS = ['quarterly sheets', 'reports']
+
+# Seconds a directory listing (hits and misses) is reused before listing again
+DEFAULT_TTL = 300
+
+# Seconds to wait for the N: drive before treating it as offline
+DEFAULT_NETWORK_TIMEOUT = 3.0
+
+PROJECT_LIST_PATTERN = re.compile(r'^(\d{4}) Project List\.(xlsx|xlsm)$', re.IGNORECASE)
+YEAR_FOLDER_PATTERN = re.compile(r'^(\d{4}) Project List$', re.IGNORECASE)
+
+
+def _list_dir(directory):
+    """Map lower-cased entry names of a directory to their paths ({} if unreadable)"""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name.lower(): os.path.join(directory, entry.name) for entry in entries}
+    except OSError:
+        return {}
+
+
+class FileLocator:
+    """
+    Directory-listing index over the N: drive year folders and the local folders.
+
+    listing() lists a directory on first use and caches the result for ttl
+    seconds. Listings under the network root run in a worker thread and are
+    abandoned after timeout seconds; the share is then treated as offline
+    until the TTL expires.
+    """
+
+    def __init__(self, network_root=NETWORK_ROOT, local_dirs=None, ttl=DEFAULT_TTL,
+                 timeout=DEFAULT_NETWORK_TIMEOUT):
+        self.network_root = network_root
+        self.local_dirs = list(local_dirs or LOCAL_DIRS)
+        self.ttl = ttl
+        self.timeout = timeout
+        self._listings = {}  # directory -> (listed at, {lower name: path})
+        self._lock = threading.RLock()
+
+    def year_folder(self, year):
+        """N: drive folder holding a year's Project List and YTD sheets"""
+        return os.path.join(self.network_root, f'{year} Project List')
+
+    def _is_network(self, directory):
+        return directory.lower().startswith(self.network_root.lower())
+
+    def _list_network(self, directory):
+        """List a network directory, giving up after the timeout"""
+        result = {}
+        worker = threading.Thread(target=lambda: result.update(names=_list_dir(directory)), daemon=True)
+        worker.start()
+        worker.join(self.timeout)
+        if worker.is_alive():
+            logger.warning("%s did not respond within %gs, treating the N: drive as offline", directory, self.timeout)
+            return {}
+        return result.get('names', {})
+
+    def listing(self, directory):
+        """Cached {lower name: path} listing of a directory"""
+        with self._lock:
+            cached = self._listings.get(directory)
+            if cached is not None and time.monotonic() - cached[0] < self.ttl:
+                return cached[1]
+
+            if directory == self.network_root:
+                names = self._list_network(directory)
+            elif self._is_network(directory):
+                # Year folders are only listed if the root listing says they exist
+                # (an offline root lists as empty, so nothing else waits on the timeout)
+                if os.path.basename(directory).lower() in self.listing(self.network_root):
+                    names = self._list_network(directory)
+                else:
+                    names = {}
+            else:
+                names = _list_dir(directory)
+            self._listings[directory] = (time.monotonic(), names)
+            return names
+
+    def lookup(self, directory, filename):
+        """Path of filename in directory (case-insensitive), or None"""
+        return self.listing(directory).get(filename.lower())
+
+    def exists(self, path):
+        """Index-backed equivalent of os.path.exists for a file path"""
+        return self.lookup(os.path.dirname(path), os.path.basename(path)) is not None
+
+    def project_list_years(self):
+        """Years with a Project List in any location, from folder and file names"""
+        years = set()
+        for name in self.listing(self.network_root):
+            match = YEAR_FOLDER_PATTERN.match(name)
+            if match:
+                for filename in self.listing(self.year_folder(match.group(1))):
+                    if PROJECT_LIST_PATTERN.match(filename):
+                        years.add(match.group(1))
+        for directory in self.local_dirs:
+            for name in self.listing(directory):
+                match = PROJECT_LIST_PATTERN.match(name)
+                if match:
+                    years.add(match.group(1))
+        return sorted(years)
+
+    def invalidate(self, directory=None):
+        """Forget one directory's listing, or all of them"""
+        with self._lock:
+            if directory is None:
+                self._listings.clear()
+            else:
+                self._listings.pop(directory, None)
+
+
+# Process-wide locator shared by the file lookups
+_file_locator = FileLocator()
+
+
+def get_file_locator():
+    """Get the process-wide file locator"""
+    return _file_locator
+
+
+def configure_file_locator(**options):
+    """Replace the process-wide file locator (see FileLocator for options)"""
+    global _file_locator
+    _file_locator = FileLocator(**options)
+    return _file_locator
@@ -0,0 +1,137 @@
+"""
+Invoice Cube
+Daily aggregate of invoice rows: sums and non-blank counts of Amount and
+Amount Invoiced by day x source year x Dept x Type. Running totals along
+the day axis make any period total two lookups, so reports can ask for
+today/week/month/quarter figures without going back to the raw rows.
+Only days that have rows are stored, so a stray far-off date adds one day
+to the cube rather than every day in between. Period sums are rounded to
+cents, which drops the float noise of differencing running totals.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Amount columns aggregated by default
+MEASURES = ['Amount', 'Amount Invoiced']
+
+# Dimensions after the day axis (columns missing from a frame are collapsed)
+DIMENSIONS = ['Source_Year', 'Dept', 'Type']
+
+
+def _to_day(value):
+    return np.datetime64(pd.Timestamp(value).date(), 'D')
+
+
+def _running(values):
+    """Running totals along the day axis, with a leading zero row"""
+    return np.concatenate([np.zeros((1,) + values.shape[1:], dtype=values.dtype), np.cumsum(values, axis=0)])
+
+
+def _cents(values):
+    return np.round(values, 2)
+
+
+class InvoiceCube:
+    """
+    Sums and counts with shape (days, *dimension labels, measures).
+
+    dates holds the day of each position on the day axis, in order; only
+    days with dated rows are present and rows without a date are left out.
+    Dimension labels are the column values as text ('' for blanks).
+    """
+
+    def __init__(self, dates, labels, measures, sums, counts):
+        self.dates = dates
+        self.labels = labels  # {dimension: [label, ...]} in axis order
+        self.measures = list(measures)
+        self.sums = sums
+        self.counts = counts
+        self._sum_prefix = _running(sums)
+        self._count_prefix = _running(counts)
+
+    @classmethod
+    def build(cls, frame, date_column='Invoice Date', measures=MEASURES, dimensions=DIMENSIONS):
+        """Aggregate a frame of invoice rows by day of date_column"""
+        measures = [measure for measure in measures if measure in frame.columns]
+        dates = pd.to_datetime(frame[date_column], errors='coerce')
+        valid = dates.notna().to_numpy()
+        dates, day_codes = np.unique(dates[valid].to_numpy().astype('datetime64[D]'), return_inverse=True)
+
+        codes = [day_codes]
+        shape = [len(dates)]
+        labels = {}
+        for dimension in dimensions:
+            if dimension in frame.columns:
+                values = frame[dimension][valid].fillna('').astype(str)
+                dimension_codes, uniques = pd.factorize(values, sort=True)
+                labels[dimension] = list(uniques)
+            else:
+                dimension_codes = np.zeros(len(day_codes), dtype=np.int64)
+                labels[dimension] = ['']
+            codes.append(dimension_codes)
+            shape.append(len(labels[dimension]))
+
+        size = int(np.prod(shape))
+        flat = np.ravel_multi_index(codes, shape) if size else np.zeros(0, dtype=np.int64)
+        sums, counts = [], []
+        for measure in measures:
+            values = pd.to_numeric(frame[measure][valid], errors='coerce').to_numpy(dtype=float)
+            present = ~np.isnan(values)
+            sums.append(np.bincount(flat[present], weights=values[present], minlength=size))
+            counts.append(np.bincount(flat[present], minlength=size))
+        sums = np.stack(sums, axis=-1) if sums else np.zeros((size, 0))
+        counts = np.stack(counts, axis=-1) if counts else np.zeros((size, 0), dtype=np.int64)
+        return cls(dates, labels, measures,
+                   sums.reshape(shape + [len(measures)]),
+                   counts.reshape(shape + [len(measures)]).astype(np.int64))
+
+    def _range(self, start, end):
+        """Day positions [lo, hi) of start..end (inclusive, None for open ends)"""
+        lo = 0 if start is None else int(np.searchsorted(self.dates, _to_day(start), side='left'))
+        hi = len(self.dates) if end is None else int(np.searchsorted(self.dates, _to_day(end), side='right'))
+        return lo, max(lo, hi)
+
+    def _slab(self, prefix, measure, start, end, where):
+        """Period totals of one measure, narrowed to the where labels (None if a label is unknown)"""
+        lo, hi = self._range(start, end)
+        column = self.measures.index(measure)
+        slab = prefix[hi, ..., column] - prefix[lo, ..., column]
+        for axis, (dimension, labels) in enumerate(self.labels.items()):
+            if dimension in where:
+                label = str(where[dimension])
+                if label not in labels:
+                    return None
+                slab = np.take(slab, [labels.index(label)], axis=axis)
+        return slab
+
+    def total(self, measure, start=None, end=None, **where):
+        """Sum of a measure over start..end in cents, e.g. total('Amount', day, day, Dept='EL')"""
+        slab = self._slab(self._sum_prefix, measure, start, end, where)
+        return 0.0 if slab is None else float(_cents(slab.sum()))
+
+    def count(self, measure, start=None, end=None, **where):
+        """Number of non-blank values of a measure over start..end"""
+        slab = self._slab(self._count_prefix, measure, start, end, where)
+        return 0 if slab is None else int(slab.sum())
+
+    def by(self, dimension, measure, start=None, end=None):
+        """[(label, count, total)] for each label of a dimension with values in start..end"""
+        axis = list(self.labels).index(dimension)
+        totals = self._slab(self._sum_prefix, measure, start, end, {})
+        counts = self._slab(self._count_prefix, measure, start, end, {})
+        others = tuple(i for i in range(totals.ndim) if i != axis)
+        totals, counts = _cents(totals.sum(axis=others)), counts.sum(axis=others)
+        return [(label, int(counts[i]), float(totals[i]))
+                for i, label in enumerate(self.labels[dimension]) if counts[i]]
+
+    def by_month(self, measure):
+        """[(month Period, count, total)] for each calendar month with values, in date order"""
+        result = []
+        for month in np.unique(self.dates.astype('datetime64[M]')):
+            month = pd.Period(month, freq='M')
+            start, end = month.start_time, month.end_time
+            count = self.count(measure, start, end)
+            if count:
+                result.append((month, count, self.total(measure, start, end)))
+        return result
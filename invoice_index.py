@@ -0,0 +1,72 @@
+"""
+Invoice Index
+Invoices from one or more Project Lists kept sorted by Invoice Date as
+datetime64, so the rows and totals for any date range are found by binary
+search instead of comparing every row's date.
+"""
+
+import logging
+import numpy as np
+import pandas as pd
+from date_columns import parse_date_column
+from project_list_snapshot import FIRST_DATA_ROW
+
+logger = logging.getLogger(__name__)
+
+
+def _day(value):
+    """datetime64[ns] midnight of a date, datetime or Timestamp"""
+    return np.datetime64(pd.Timestamp(value).normalize(), 'ns')
+
+
+class InvoiceIndex:
+    """
+    Invoice rows sorted by Invoice Date (day precision).
+
+    Rows keep their original order within a day (stable sort), so a day's
+    slice lists invoices in Project List order. Rows without a parseable
+    Invoice Date are kept out of the index.
+    """
+
+    def __init__(self, invoices):
+        invoices = invoices[invoices['Invoice Date'].notna()]
+        order = np.argsort(invoices['Invoice Date'].to_numpy(), kind='stable')
+        self.invoices = invoices.iloc[order].reset_index(drop=True)
+        self.dates = self.invoices['Invoice Date'].to_numpy(dtype='datetime64[ns]')
+
+    @classmethod
+    def from_snapshots(cls, snapshots):
+        """Build the index from {year: ProjectListSnapshot}, in the given year order"""
+        frames = []
+        for year, snapshot in snapshots.items():
+            df = snapshot.invoices
+            dates, report = parse_date_column(df['Invoice Date'], 'Invoice Date', first_row=FIRST_DATA_ROW)
+            if report:
+                logger.warning("%s in %s", report.summary(), year)
+            df['Invoice Date'] = dates.dt.normalize()
+            df['Source_Year'] = year
+            frames.append(df)
+        return cls(pd.concat(frames, ignore_index=True))
+
+    def __len__(self):
+        return len(self.dates)
+
+    def bounds(self, start, end):
+        """Positions [lo, hi) of the invoices dated start..end (inclusive)"""
+        lo = np.searchsorted(self.dates, _day(start), side='left')
+        hi = np.searchsorted(self.dates, _day(end), side='right')
+        return lo, max(lo, hi)
+
+    def between(self, start, end):
+        """Invoice rows dated start..end (inclusive)"""
+        lo, hi = self.bounds(start, end)
+        return self.invoices.iloc[lo:hi]
+
+    def on(self, day):
+        """Invoice rows dated on one day"""
+        return self.between(day, day)
+
+    def total(self, column, start, end=None):
+        """Sum of a column over the invoices dated start..end (end defaults to start)"""
+        lo, hi = self.bounds(start, start if end is None else end)
+        return self.invoices[column].iloc[lo:hi].sum()
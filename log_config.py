@@ -0,0 +1,81 @@
+"""
+Log Configuration
+Leveled logging for the report pipeline. Each module logs through
+logging.getLogger(__name__) with lazy %-style arguments, so a disabled
+level costs no formatting. configure_logging() sends the records to the
+console (or to a callback such as the GUI's output pane) at INFO, or at
+DEBUG with --verbose.
+
+Messages carry no level words or spacing of their own: the formatter marks
+debug, warning and error records, and a record logged with extra=SECTION
+starts a new section (preceded by a blank line on the console).
+"""
+
+import logging
+import sys
+
+# Prefix of each level's messages (INFO messages are shown as they are)
+LEVEL_MARKERS = {
+    logging.DEBUG: '[DEBUG] ',
+    logging.WARNING: '⚠ ',
+    logging.ERROR: '✗ ',
+    logging.CRITICAL: '✗ ',
+}
+
+# extra= for a record that starts a new section of the output
+SECTION = {'section': True}
+
+
+class MarkerFormatter(logging.Formatter):
+    """
+    Messages prefixed with their level's marker; with section_breaks, a
+    section record is preceded by a blank line.
+    """
+
+    def __init__(self, section_breaks=True):
+        super().__init__()
+        self.section_breaks = section_breaks
+
+    def format(self, record):
+        message = LEVEL_MARKERS.get(record.levelno, '') + super().format(record)
+        if self.section_breaks and getattr(record, 'section', False):
+            return '\n' + message
+        return message
+
+
+class CallbackHandler(logging.Handler):
+    """Hands each formatted record to a callback (e.g. a GUI text pane)"""
+
+    def __init__(self, callback):
+        super().__init__()
+        self.callback = callback
+
+    def emit(self, record):
+        try:
+            self.callback(self.format(record))
+        except Exception:
+            self.handleError(record)
+
+
+_handler = None
+
+
+def configure_logging(verbose=False, stream=None, callback=None):
+    """
+    Send log records to callback, or to stream (stdout by default), at INFO or,
+    with verbose, at DEBUG. Calling it again replaces the previous destination.
+    A callback receives one line per record, without blank section breaks.
+    """
+    global _handler
+    root = logging.getLogger()
+    if _handler is not None:
+        root.removeHandler(_handler)
+    if callback is not None:
+        _handler = CallbackHandler(callback)
+        _handler.setFormatter(MarkerFormatter(section_breaks=False))
+    else:
+        _handler = logging.StreamHandler(stream or sys.stdout)
+        _handler.setFormatter(MarkerFormatter())
+    root.addHandler(_handler)
+    root.setLevel(logging.DEBUG if verbose else logging.INFO)
+    return _handler
@@ -0,0 +1,186 @@
+"""
+Network Mirror
+Local read-through mirror of the Project List and YTD workbooks on the
+N: drive. A remote file is copied only when its size or modification time
+changed since the last copy, so repeated runs read local disk instead of
+pulling multi-MB workbooks over SMB.
+"""
+
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+logger = logging.getLogger(__name__)
+
+# Network share holding the '<year> Project List' folders
+NETWORK_ROOT = r'N:\Project List'
+
+# Default mirror location (relative to the working directory, like 'sheet cache')
+DEFAULT_MIRROR_DIR = 'network mirror'
+
+# Remote copies running at once (SMB latency, not bandwidth, is the bottleneck)
+DEFAULT_COPY_WORKERS = 4
+
+MANIFEST_FILENAME = 'manifest.json'
+
+
+class NetworkMirror:
+    """
+    Directory of local copies of network files plus a JSON manifest.
+
+    The manifest records the remote size and mtime each local copy was
+    taken from. fetch() compares them with the remote file and copies it
+    again only when they differ or the local copy is missing. If the remote
+    copy fails (for example the file is locked by a colleague) the previous
+    local copy is used.
+    """
+
+    def __init__(self, mirror_dir=DEFAULT_MIRROR_DIR, network_root=NETWORK_ROOT):
+        self.mirror_dir = mirror_dir
+        self.network_root = network_root
+        self.manifest_path = os.path.join(mirror_dir, MANIFEST_FILENAME)
+        self._lock = threading.Lock()
+        self._path_locks = {}  # One lock per remote file so concurrent fetches copy it once
+
+    def _load_manifest(self):
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_manifest(self, manifest):
+        os.makedirs(self.mirror_dir, exist_ok=True)
+        tmp_path = self.manifest_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=1)
+        os.replace(tmp_path, self.manifest_path)
+
+    def mirror_path(self, remote_path):
+        """Local path for a remote file, keeping its folder layout below the network root"""
+        root = self.network_root.rstrip('\\/')
+        if remote_path.lower().startswith(root.lower()):
+            relative = remote_path[len(root):].lstrip('\\/')
+        else:
+            relative = os.path.basename(remote_path)
+        return os.path.join(self.mirror_dir, *relative.replace('\\', '/').split('/'))
+
+    def cached_copy(self, remote_path, local_path=None):
+        """Previously mirrored copy of a remote file, or None (used when the share is offline)"""
+        entry = self._load_manifest().get(remote_path)
+        if entry is None or (local_path and local_path != entry['local']):
+            return None
+        return entry['local'] if os.path.exists(entry['local']) else None
+
+    def is_current(self, remote_path, local_path=None, remote_stat=None):
+        """Check whether the local copy was taken from the remote file's current size and mtime"""
+        entry = self._load_manifest().get(remote_path)
+        if entry is None or (local_path and local_path != entry['local']):
+            return False
+        if not os.path.exists(entry['local']):
+            return False
+        remote_stat = remote_stat or os.stat(remote_path)
+        return entry['size'] == remote_stat.st_size and entry['mtime'] == remote_stat.st_mtime
+
+    def fetch(self, remote_path, local_path=None):
+        """
+        Return a local copy of remote_path, refreshing it only if the remote changed.
+        local_path overrides the mirror location (e.g. the quarterly sheets folder).
+        Returns None if the remote file does not exist and no copy was ever made.
+        """
+        local_path = local_path or self.mirror_path(remote_path)
+        with self._lock:
+            path_lock = self._path_locks.setdefault(remote_path, threading.Lock())
+        with path_lock:
+            return self._refresh(remote_path, local_path)
+
+    def _refresh(self, remote_path, local_path):
+        """Copy remote_path to local_path unless the manifest says the copy is current"""
+        try:
+            remote_stat = os.stat(remote_path)
+        except OSError:
+            return self.cached_copy(remote_path, local_path)
+
+        if self.is_current(remote_path, local_path, remote_stat):
+            return local_path
+
+        try:
+            os.makedirs(os.path.dirname(local_path) or '.', exist_ok=True)
+            tmp_path = local_path + '.tmp'
+            shutil.copy2(remote_path, tmp_path)
+            os.replace(tmp_path, local_path)
+        except Exception as e:
+            if os.path.exists(local_path):
+                logger.warning("Could not refresh %s from the network (%s); using previous copy", os.path.basename(remote_path), e)
+                return local_path
+            logger.error("Could not copy %s: %s", remote_path, e)
+            return None
+
+        with self._lock:
+            manifest = self._load_manifest()
+            manifest[remote_path] = {
+                'local': local_path,
+                'size': remote_stat.st_size,
+                'mtime': remote_stat.st_mtime,
+                'copied_at': time.time(),
+            }
+            self._save_manifest(manifest)
+            logger.info("✓ Mirrored %s to %s", os.path.basename(remote_path), local_path)
+        return local_path
+
+    def fetch_many(self, remote_paths, workers=DEFAULT_COPY_WORKERS):
+        """Fetch several remote files concurrently. Returns {remote path: local path or None}."""
+        remote_paths = list(remote_paths)
+        if not remote_paths:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(workers, len(remote_paths))) as pool:
+            return dict(zip(remote_paths, pool.map(self.fetch, remote_paths)))
+
+    def start_prefetch(self, remote_paths, at=None, workers=DEFAULT_COPY_WORKERS):
+        """
+        Refresh the mirror in a background thread.
+        at is an optional 'HH:MM' time of day to wait for (e.g. before business hours).
+        Returns the started daemon thread.
+        """
+        remote_paths = list(remote_paths)
+
+        def run():
+            if at:
+                time.sleep(seconds_until(at))
+            logger.info("Prefetching %s network files into %s", len(remote_paths), self.mirror_dir)
+            self.fetch_many(remote_paths, workers)
+
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        return thread
+
+
+def seconds_until(time_of_day):
+    """Seconds from now until the next occurrence of an 'HH:MM' time of day"""
+    target_time = datetime.strptime(time_of_day, '%H:%M').time()
+    now = datetime.now()
+    target = datetime.combine(now.date(), target_time)
+    if target <= now:
+        target += timedelta(days=1)
+    return (target - now).total_seconds()
+
+
+# Process-wide mirror used by the file locators (None when disabled)
+_network_mirror = NetworkMirror()
+
+
+def get_network_mirror():
+    """Get the process-wide network mirror, or None if mirroring is disabled"""
+    return _network_mirror
+
+
+def configure_network_mirror(enabled=True, mirror_dir=DEFAULT_MIRROR_DIR):
+    """Enable, disable or relocate the process-wide network mirror"""
+    global _network_mirror
+    _network_mirror = NetworkMirror(mirror_dir) if enabled else None
+    return _network_mirror
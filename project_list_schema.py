@@ -0,0 +1,96 @@
+"""
+Project List Schema
+Resolves the logical fields of a Project List sheet (ACGI #, project, client,
+line, dates, dept, comments, amounts and the vendor payment column) from its
+header row. Header names vary between years, so each field is found by a
+rule rather than a fixed name, and new years need no code changes.
+"""
+
+from openpyxl.utils import get_column_letter
+from vendor_scanner import get_vendor_column
+
+# Column N (0-based 13) holds the Comments field whenever the sheet is that wide
+COMMENTS_COLUMN = 13
+
+
+def _lower(name):
+    return str(name).lower()
+
+
+# Field rules, tried against the header names in sheet order (first match wins)
+FIELD_RULES = {
+    'acgi': lambda name: 'acgi' in _lower(name) and '#' in str(name),
+    'project': lambda name: 'project' in _lower(name) and ('number' in _lower(name) or 'name' in _lower(name)),
+    'client': lambda name: 'client' in _lower(name) and 'po' in _lower(name),
+    'line': lambda name: 'line' in _lower(name) and '#' in str(name),
+    'po_date': lambda name: 'po' in _lower(name) and 'date' in _lower(name),
+    'dept': lambda name: 'dept' in _lower(name) or 'department' in _lower(name),
+    'invoice_date': lambda name: 'invoice' in _lower(name) and 'date' in _lower(name),
+    'comments': lambda name: 'comment' in _lower(name) or 'note' in _lower(name),
+    'type': lambda name: name == 'Type',
+    'amount': lambda name: name == 'Amount',
+    'amount_invoiced': lambda name: name == 'Amount Invoiced',
+    'completion_date': lambda name: name == 'Completion Date',
+}
+
+
+class ProjectListSchema:
+    """
+    Header names of one Project List sheet's logical fields.
+
+    fields maps each FIELD_RULES name to its header name (None if the sheet
+    has no such column); fallbacks lists the fields resolved positionally
+    (ACGI # from the first column when no header matched, Comments from column N).
+    vendor_column is the 1-based vendor payment column, by default the year's
+    column from get_vendor_column.
+    """
+
+    def __init__(self, year, header, fields, fallbacks=None, vendor_column=None):
+        self.year = str(year)
+        self.header = list(header)
+        self.fields = dict(fields)
+        self.fallbacks = set(fallbacks or [])
+        self.vendor_column = vendor_column or self.default_vendor_column(self.year)
+
+    @staticmethod
+    def default_vendor_column(year):
+        """1-based vendor payment column of a year's sheet"""
+        return get_vendor_column(year)[0]
+
+    @property
+    def vendor_column_name(self):
+        return get_column_letter(self.vendor_column)
+
+    @classmethod
+    def resolve(cls, year, header, vendor_column=None):
+        """Resolve every logical field against a header row"""
+        header = list(header)
+        fields = {}
+        for field, matches in FIELD_RULES.items():
+            fields[field] = next((name for name in header if matches(name)), None)
+
+        fallbacks = set()
+        if fields['acgi'] is None and header:
+            fields['acgi'] = header[0]
+            fallbacks.add('acgi')
+        if len(header) > COMMENTS_COLUMN:
+            fields['comments'] = header[COMMENTS_COLUMN]
+            fallbacks.add('comments')
+        return cls(year, header, fields, fallbacks, vendor_column)
+
+    def column(self, field):
+        """Header name of a logical field, or None if the sheet has no such column"""
+        return self.fields[field]
+
+    def position(self, name):
+        """0-based position of a logical field or exact header name, or None"""
+        name = self.fields.get(name, name)
+        return self.header.index(name) if name in self.header else None
+
+    def to_dict(self):
+        return {'year': self.year, 'header': self.header, 'fields': self.fields,
+                'fallbacks': sorted(self.fallbacks), 'vendor_column': self.vendor_column}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data['year'], data['header'], data['fields'], data['fallbacks'], data['vendor_column'])
@@ -0,0 +1,487 @@
+"""
+Project List Snapshot
+Parses each Project List workbook once per process and shares the result
+between the invoice, receivables, vendor payment and YTD consumers.
+Parsed sheets are also kept in the on-disk sheet cache between runs.
+"""
+
+import io
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import pandas as pd
+from pandas import DataFrame
+from pandas.errors import EmptyDataError
+from pandas.io.parsers import TextParser
+from openpyxl import load_workbook
+from openpyxl.cell.cell import TYPE_ERROR, TYPE_NUMERIC
+from sheet_cache import content_hash, get_sheet_cache
+from project_list_schema import ProjectListSchema
+from vendor_scanner import VendorPaymentScan
+from xlsx_reader import READER_ENGINES, XlsxColumnReader
+
+logger = logging.getLogger(__name__)
+
+# Row (0-based) holding the column headers in every Project List sheet
+HEADER_ROW = 5
+
+# 1-based sheet row of the first invoice row (index 0 of the invoice frames)
+FIRST_DATA_ROW = HEADER_ROW + 2
+
+# Column G (0-based 6) holds the Totals / To Invoice / Less hold footer labels
+FOOTER_LABEL_COLUMN = 6
+
+# Engine used to read workbooks: 'openpyxl' (read-only mode) or 'direct' (xlsx_reader)
+_reader_engine = 'openpyxl'
+
+
+def set_reader_engine(engine):
+    """Select the workbook reader engine used for Project List and YTD reads"""
+    global _reader_engine
+    if engine not in READER_ENGINES:
+        raise ValueError(f"Unknown reader engine '{engine}' (choose from {', '.join(READER_ENGINES)})")
+    _reader_engine = engine
+
+
+def get_reader_engine():
+    """Get the selected workbook reader engine"""
+    return _reader_engine
+
+def _convert_cell(cell):
+    """Convert a cell value the same way pandas' openpyxl reader does"""
+    if cell.value is None:
+        return ""
+    if cell.data_type == TYPE_ERROR:
+        return float('nan')
+    if cell.data_type == TYPE_NUMERIC:
+        val = int(cell.value)
+        if val == cell.value:
+            return val
+        return float(cell.value)
+    return cell.value
+
+
+def _parse_rows(rows, header, usecols=None):
+    """
+    Build a DataFrame from converted sheet rows, matching pd.read_excel(header=...).
+    usecols limits parsing to the given 0-based columns (named from the full header).
+    """
+    try:
+        return TextParser(rows, header=header, skip_blank_lines=False, usecols=usecols).read()
+    except EmptyDataError:
+        return DataFrame()
+
+
+# Invoice columns declared by each consumer module: {consumer: [field or header name]}
+_column_requirements = {}
+
+
+def require_invoice_columns(consumer, columns):
+    """
+    Declare the invoice columns a module reads. Each entry is a logical field
+    of project_list_schema.FIELD_RULES (resolved per sheet) or an exact header name.
+    Snapshots load only the union of all declared columns.
+    """
+    _column_requirements[consumer] = list(columns)
+
+
+def declared_invoice_columns():
+    """Sorted union of the declared columns, or None if nothing was declared (every column is loaded)"""
+    if not _column_requirements:
+        return None
+    return sorted({column for columns in _column_requirements.values() for column in columns})
+
+
+def resolve_invoice_columns(schema, warn=False):
+    """
+    0-based positions of the declared columns in a sheet, or None to load every column.
+    With warn, declared columns the sheet does not have are reported.
+    """
+    if not _column_requirements:
+        return None
+    positions = set()
+    missing = set()
+    for columns in _column_requirements.values():
+        for column in columns:
+            position = schema.position(column)
+            if position is not None:
+                positions.add(position)
+            else:
+                missing.add(column)
+    if warn and missing:
+        logger.warning("%s Project List has no column for %s", schema.year, ', '.join(sorted(missing)))
+    return sorted(positions)
+
+
+def _header_names(rows):
+    """Column names of the header row, de-duplicated and named the way pandas does"""
+    return list(_parse_rows(rows[:HEADER_ROW + 1], header=HEADER_ROW).columns)
+
+
+class FooterRows:
+    """
+    Footer rows at the bottom of a Project List sheet.
+    Row numbers are 0-based grid rows (as with pd.read_excel(header=None));
+    each footer row's cell values are kept so no grid is needed afterwards.
+    """
+
+    ROW_NAMES = ['totals', 'to_invoice', 'less_hold']
+
+    def __init__(self, totals_row, to_invoice_row, less_hold_row, row_values):
+        self.totals_row = totals_row
+        self.to_invoice_row = to_invoice_row
+        self.less_hold_row = less_hold_row
+        self._row_values = row_values  # {'totals': [...], 'to_invoice': [...], 'less_hold': [...]}
+
+    def value(self, row_name, column):
+        """Raw cell value of a footer row at a 0-based column (IndexError if missing)"""
+        return self._row_values[row_name][column]
+
+    def label(self, row_name):
+        """Column G label of a footer row"""
+        return str(self.value(row_name, FOOTER_LABEL_COLUMN)).strip()
+
+    def row_positions(self):
+        """Row positions in the format generate_summary keeps per year"""
+        return {
+            'totals_row': self.totals_row,
+            'to_invoice_row': self.to_invoice_row,
+            'less_hold_row': self.less_hold_row
+        }
+
+    def to_dict(self):
+        return dict(self.row_positions(), row_values=self._row_values)
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data['totals_row'], data['to_invoice_row'], data['less_hold_row'], data['row_values'])
+
+
+def locate_footer_rows(grid):
+    """
+    Find the footer rows by scanning column G upward from the sheet's last row.
+    The last two non-empty cells are "To Invoice" and "Less hold"; Totals is the
+    row above "To Invoice". Returns None if column G has fewer than two entries.
+    """
+    if grid.shape[1] <= FOOTER_LABEL_COLUMN:
+        return None
+    labels = grid.iloc[:, FOOTER_LABEL_COLUMN].to_numpy()
+
+    found = []
+    for idx in range(len(labels) - 1, -1, -1):
+        value = labels[idx]
+        if pd.notna(value) and str(value).strip():
+            found.append(idx)
+            if len(found) == 2:
+                break
+    if len(found) < 2:
+        return None
+
+    less_hold_row, to_invoice_row = found
+    totals_row = to_invoice_row - 1
+    row_values = {
+        'totals': grid.iloc[totals_row].tolist(),
+        'to_invoice': grid.iloc[to_invoice_row].tolist(),
+        'less_hold': grid.iloc[less_hold_row].tolist(),
+    }
+    return FooterRows(totals_row, to_invoice_row, less_hold_row, row_values)
+
+
+def _trim_rows(rows, last_row_with_data):
+    """Trim trailing empty rows and pad to a rectangular grid"""
+    rows = rows[:last_row_with_data + 1]
+    if rows:
+        max_width = max(len(row) for row in rows)
+        rows = [row + [""] * (max_width - len(row)) for row in rows]
+    return rows
+
+
+class ProjectListSnapshot:
+    """
+    In-memory view of one year's Project List sheet.
+
+    The workbook is read once (read-only, cached values) and exposes:
+      - invoices: the header-row-5 frame, as pd.read_excel(path, sheet_name=year, header=5),
+        limited to the columns declared with require_invoice_columns()
+      - schema: ProjectListSchema mapping logical fields to header names
+      - columns: every header name of the sheet, in sheet order
+      - footer: FooterRows for the Totals / To Invoice / Less hold rows (None if not found)
+      - vendor_payments: VendorPaymentScan of the cyan vendor payment cells
+      - grid: the raw frame, as pd.read_excel(path, sheet_name=year, header=None);
+        it is not kept after parsing, so it is re-parsed on demand
+    """
+
+    def __init__(self, year, file_path, invoices, footer, vendor_payments, schema=None, grid=None):
+        self.year = str(year)
+        self.file_path = file_path
+        self._invoices = invoices
+        self.schema = schema or ProjectListSchema.resolve(year, invoices.columns)
+        self.footer = footer
+        self.vendor_payments = vendor_payments
+        self._grid = grid
+
+    @classmethod
+    def parse(cls, year, file_path, data=None, engine=None):
+        """Parse the year's sheet from the workbook file (or its raw bytes) in a single pass"""
+        year = str(year)
+        vendor_column = ProjectListSchema.default_vendor_column(year)
+        if (engine or _reader_engine) == 'direct':
+            rows, vendor_payments = cls._read_sheet_direct(year, file_path, vendor_column, data)
+        else:
+            rows, vendor_payments = cls._read_sheet(year, file_path, vendor_column, data)
+        schema = ProjectListSchema.resolve(year, _header_names(rows), vendor_column)
+        usecols = resolve_invoice_columns(schema, warn=True) if schema.header else None
+        # The grid is only needed to locate the footer, so it is not kept
+        return cls(year, file_path,
+                   invoices=_parse_rows(rows, header=HEADER_ROW, usecols=usecols),
+                   footer=locate_footer_rows(_parse_rows(rows, header=None)),
+                   vendor_payments=vendor_payments,
+                   schema=schema)
+
+    @classmethod
+    def from_payload(cls, year, file_path, payload):
+        """Rebuild a snapshot from a sheet cache payload"""
+        footer = FooterRows.from_dict(payload['footer']) if payload['footer'] else None
+        schema = ProjectListSchema.from_dict(payload['schema'])
+        vendor_payments = VendorPaymentScan(schema.vendor_column, payload['vendor_hits'])
+        return cls(year, file_path, payload['invoices'], footer, vendor_payments, schema)
+
+    def to_payload(self):
+        """Payload stored in the sheet cache"""
+        return {
+            'invoices': self._invoices,
+            'schema': self.schema.to_dict(),
+            'footer': self.footer.to_dict() if self.footer else None,
+            'vendor_hits': self.vendor_payments.hits,
+        }
+
+    @property
+    def columns(self):
+        """Every header name of the sheet, in sheet order"""
+        return self.schema.header
+
+    def has_required_columns(self):
+        """Check that the loaded invoice frame holds every currently declared column"""
+        positions = resolve_invoice_columns(self.schema)
+        if positions is None:
+            return len(self._invoices.columns) == len(self.columns)
+        loaded = set(self._invoices.columns)
+        return all(self.columns[i] in loaded for i in positions)
+
+    @property
+    def grid(self):
+        """Raw header=None frame of the sheet (re-reads the workbook on first use)"""
+        if self._grid is None:
+            rows, _ = self._read_sheet(self.year, self.file_path, self.schema.vendor_column)
+            self._grid = _parse_rows(rows, header=None)
+        return self._grid
+
+    @staticmethod
+    def _read_sheet(year, file_path, vendor_column, data=None):
+        """Read every row of the year's sheet, scanning the vendor payment column on the way"""
+        source = io.BytesIO(data) if data is not None else file_path
+        wb = load_workbook(source, read_only=True, data_only=True, keep_links=False)
+        try:
+            if year not in wb.sheetnames:
+                raise ValueError(f"Worksheet named '{year}' not found in {file_path}")
+            ws = wb[year]
+            ws.reset_dimensions()
+
+            vendor_payments = VendorPaymentScan(vendor_column)
+            vendor_index = vendor_payments.column - 1
+            rows = []
+            last_row_with_data = -1
+            for row_number, row in enumerate(ws.rows):
+                converted_row = [_convert_cell(cell) for cell in row]
+                while converted_row and converted_row[-1] == "":
+                    converted_row.pop()
+                if converted_row:
+                    last_row_with_data = row_number
+                rows.append(converted_row)
+
+                if len(row) > vendor_index:
+                    vendor_payments.add_cell(row[vendor_index])
+        finally:
+            wb.close()
+
+        return _trim_rows(rows, last_row_with_data), vendor_payments
+
+    @staticmethod
+    def _read_sheet_direct(year, file_path, vendor_column, data=None):
+        """Same as _read_sheet, using the direct xlsx reader instead of openpyxl"""
+        source = data if data is not None else file_path
+        with XlsxColumnReader(source, use_mmap=data is None) as reader:
+            if year not in reader.sheetnames:
+                raise ValueError(f"Worksheet named '{year}' not found in {file_path}")
+
+            vendor_payments = VendorPaymentScan(vendor_column)
+            rows = []
+            last_row_with_data = -1
+            for row_number, cells in reader.iter_rows(year):
+                # Rows missing from the XML are empty
+                while len(rows) < row_number - 1:
+                    rows.append([])
+                converted_row = [""] * (cells[-1].column if cells else 0)
+                for cell in cells:
+                    converted_row[cell.column - 1] = _convert_cell(cell)
+                    if cell.column == vendor_payments.column:
+                        vendor_payments.add(cell.row, cell.value, reader.fill_id(cell.style_id), reader.fill_rgb)
+                while converted_row and converted_row[-1] == "":
+                    converted_row.pop()
+                if converted_row:
+                    last_row_with_data = len(rows)
+                rows.append(converted_row)
+
+        return _trim_rows(rows, last_row_with_data), vendor_payments
+
+    @property
+    def invoices(self):
+        """Copy of the header-row-5 frame, safe for callers to modify"""
+        return self._invoices.copy()
+
+
+def _read_bytes(file_path):
+    with open(file_path, 'rb') as f:
+        return f.read()
+
+
+def _load_cached_snapshot(year, file_path, size, mtime):
+    """
+    Look the workbook up in the sheet cache.
+    Returns (snapshot or None, raw bytes if they had to be read for the hash check).
+    """
+    cache = get_sheet_cache()
+    if cache is None:
+        return None, None
+
+    data = None
+    payload = None
+    columns = declared_invoice_columns()
+    status = cache.lookup(file_path, year, size, mtime, columns)
+    if status == 'hit':
+        payload = cache.load(file_path, year, size, mtime, columns=columns)
+    elif status == 'check-hash':
+        data = _read_bytes(file_path)
+        payload = cache.load(file_path, year, size, mtime, data_hash=content_hash(data), columns=columns)
+    if payload is None:
+        return None, data
+
+    snapshot = ProjectListSnapshot.from_payload(year, file_path, payload)
+    if not snapshot.has_required_columns():
+        return None, data  # Cached with fewer columns than are now declared
+    logger.info("Using cached %s Project List: %s", year, file_path)
+    return snapshot, data
+
+
+def _store_snapshot(snapshot, size, mtime, data_hash):
+    """Write a freshly parsed snapshot to the sheet cache"""
+    cache = get_sheet_cache()
+    if cache is None:
+        return
+    try:
+        cache.store(snapshot.file_path, snapshot.year, size, mtime, data_hash, snapshot.to_payload(),
+                    columns=declared_invoice_columns())
+    except Exception as e:
+        logger.warning("Could not write sheet cache for %s: %s", snapshot.file_path, e)
+
+
+def _load_snapshot(year, file_path, size, mtime):
+    """Load a snapshot from the sheet cache, or parse the workbook and cache the result"""
+    snapshot, data = _load_cached_snapshot(year, file_path, size, mtime)
+    if snapshot is not None:
+        return snapshot
+
+    logger.info("Parsing %s Project List: %s", year, file_path)
+    if data is None:
+        data = _read_bytes(file_path)
+    snapshot = ProjectListSnapshot.parse(year, file_path, data)
+    _store_snapshot(snapshot, size, mtime, content_hash(data))
+    return snapshot
+
+
+def _parse_in_worker(year, file_path, engine, column_requirements):
+    """
+    Worker process entry point: parse one Project List and return the compact
+    cache payload (invoice frame, footer values, vendor hits) plus its fingerprint.
+    The parent's column declarations are passed in, since spawned workers start fresh.
+    """
+    _column_requirements.update(column_requirements)
+    stat = os.stat(file_path)
+    data = _read_bytes(file_path)
+    snapshot = ProjectListSnapshot.parse(year, file_path, data, engine=engine)
+    return snapshot.to_payload(), stat.st_size, stat.st_mtime, content_hash(data)
+
+
+# Snapshots parsed in this process, keyed by (absolute path, year)
+_snapshots = {}
+
+
+def get_project_list_snapshot(year, file_path):
+    """
+    Get the shared snapshot for a Project List, parsing the file only on first use.
+    A snapshot is reloaded if the file's size or modification time changes.
+    """
+    year = str(year)
+    stat = os.stat(file_path)
+    key = (os.path.abspath(file_path), year)
+    fingerprint = (stat.st_size, stat.st_mtime)
+
+    cached = _snapshots.get(key)
+    if cached is not None and cached[0] == fingerprint and cached[1].has_required_columns():
+        return cached[1]
+
+    snapshot = _load_snapshot(year, file_path, stat.st_size, stat.st_mtime)
+    _snapshots[key] = (fingerprint, snapshot)
+    return snapshot
+
+
+def clear_project_list_snapshots():
+    """Drop all snapshots parsed in this process"""
+    _snapshots.clear()
+
+
+def prefetch_project_list_snapshots(sources, workers=1):
+    """
+    Load the snapshots for [(year, path), ...] into this process's registry,
+    parsing cache misses in up to `workers` separate processes at once.
+    Errors are reported and left for the per-year loaders to raise again.
+    """
+    if workers is None or workers <= 1:
+        return
+
+    pending = []
+    for year, file_path in sources:
+        year = str(year)
+        try:
+            stat = os.stat(file_path)
+            key = (os.path.abspath(file_path), year)
+            fingerprint = (stat.st_size, stat.st_mtime)
+            cached = _snapshots.get(key)
+            if cached is not None and cached[0] == fingerprint and cached[1].has_required_columns():
+                continue
+            snapshot, _ = _load_cached_snapshot(year, file_path, stat.st_size, stat.st_mtime)
+            if snapshot is not None:
+                _snapshots[key] = (fingerprint, snapshot)
+            else:
+                pending.append((year, file_path))
+        except Exception as e:
+            logger.warning("Could not check %s Project List: %s", year, e)
+
+    if len(pending) < 2:
+        return  # Nothing to gain from a process pool
+
+    logger.info("Parsing %s Project Lists with %s worker processes...", len(pending), min(workers, len(pending)))
+    with ProcessPoolExecutor(max_workers=min(workers, len(pending))) as pool:
+        futures = {pool.submit(_parse_in_worker, year, file_path, _reader_engine, _column_requirements): (year, file_path)
+                   for year, file_path in pending}
+        for future in as_completed(futures):
+            year, file_path = futures[future]
+            try:
+                payload, size, mtime, data_hash = future.result()
+            except Exception as e:
+                logger.warning("Worker failed to parse %s Project List: %s", year, e)
+                continue
+            snapshot = ProjectListSnapshot.from_payload(year, file_path, payload)
+            _snapshots[(os.path.abspath(file_path), year)] = ((size, mtime), snapshot)
+            _store_snapshot(snapshot, size, mtime, data_hash)
+            logger.info("✓ Parsed %s Project List: %s", year, file_path)
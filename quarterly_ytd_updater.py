@@ -5,13 +5,34 @@ Updates the quarterly YTD Excel file with completion data from all project lists
 """
 
 import pandas as pd
+import numpy as np
 from datetime import datetime
+import logging
 import os
 import re
-from openpyxl import load_workbook, Workbook
-from openpyxl.utils.dataframe import dataframe_to_rows
-from openpyxl.styles import Font, PatternFill, Border, Side, Alignment
-from openpyxl.utils import get_column_letter
+import argparse
+from openpyxl import load_workbook
+import multiprocessing
+from project_list_snapshot import (FIRST_DATA_ROW, get_project_list_snapshot, get_reader_engine,
+                                   prefetch_project_list_snapshots, require_invoice_columns,
+                                   set_reader_engine)
+from date_columns import parse_date_column
+from invoice_cube import InvoiceCube
+from report_templates import QUARTERLY_YTD_TEMPLATE
+from report_writer import ColumnWidths, MergedRangeIndex, ReportSheet, register_report_styles, write_template_row
+from sheet_cache import content_hash
+from ytd_index import YtdDayIndex
+from xlsx_reader import READER_ENGINES, XlsxColumnReader
+from network_mirror import configure_network_mirror, get_network_mirror
+from file_locator import get_file_locator
+from log_config import SECTION, configure_logging
+
+logger = logging.getLogger(__name__)
+
+# Project List schema fields read by collect_completion_data
+COMPLETION_COLUMNS = ['acgi', 'project', 'client', 'line', 'po_date', 'dept', 'invoice_date', 'comments',
+                      'amount', 'amount_invoiced', 'completion_date']
+require_invoice_columns('quarterly_ytd_updater', COMPLETION_COLUMNS)
 
 def get_quarter_info():
     """
@@ -118,7 +139,7 @@ def get_quarter_info():
         'month_indices': month_indices,
         'quarterly_file': quarterly_file,
         'quarterly_sheets_dir': quarterly_sheets_dir,
-        'project_lists': project_lists  # Use the global configuration
+        'project_lists': resolve_project_lists()  # Global configuration, read through the mirror
     }
     
     print(f"\n✓ Selected: {quarter_name} {year}")
@@ -135,260 +156,246 @@ project_lists = [
     ('2025', r'N:\Project List\2025 Project List\2025 Project List.xlsx'),
 ]
 
-# Add logic to use backup from 'quarterly sheets' if N: drive file is not found
-for idx, (year, n_drive_path) in enumerate(project_lists):
-    if not os.path.exists(n_drive_path):
-        backup_path = os.path.join('quarterly sheets', os.path.basename(n_drive_path))
-        if os.path.exists(backup_path):
-            print(f"N: drive file for {year} not found, using backup in quarterly sheets: {backup_path}")
-            project_lists[idx] = (year, backup_path)
-        else:
-            print(f"Warning: Neither N: drive nor backup found for {year} Project List: {n_drive_path}")
-
-def parse_split_invoices(comments_text, original_amount):
+def resolve_project_lists():
     """
-    Parse split invoice information from comments text.
-    Returns a list of tuples: (percentage, date, description)
+    Local paths for the configured Project Lists.
+    N: drive files are copied concurrently into the network mirror (only when
+    they changed); the backup in 'quarterly sheets' is used if a file is not found.
     """
-    if pd.isna(comments_text) or not str(comments_text).strip():
-        return []
-    
-    comments_str = str(comments_text).strip()
-    
-    # Pattern to match format: "Invoiced at 50% on 4/18/2025. Invoiced rest on 5/13/2025"
-    # First, look for the initial percentage and date
-    initial_pattern = r'Invoiced at (\d+(?:\.\d+)?)%\s*on\s*(\d{1,2}[/-]\d{1,2}[/-]\d{4})'
-    initial_match = re.search(initial_pattern, comments_str, re.IGNORECASE)
-    
-    if not initial_match:
-        # Fallback to old pattern for backwards compatibility
-        old_pattern = r'(\d+(?:\.\d+)?)%\s*(?:invoiced|billed|paid)\s*(\d{1,2}[/-]\d{1,2}[/-]\d{4})'
-        matches = re.findall(old_pattern, comments_str, re.IGNORECASE)
-        
-        if not matches:
-            return []
-        
-        split_invoices = []
-        for percentage_str, date_str in matches:
-            try:
-                percentage = float(percentage_str)
-                # Parse date with flexible format
-                if '/' in date_str:
-                    date_parts = date_str.split('/')
-                else:
-                    date_parts = date_str.split('-')
-                
-                if len(date_parts) == 3:
-                    month, day, year = date_parts
-                    parsed_date = datetime(int(year), int(month), int(day))
-                    
-                    description = f"{percentage}% invoiced {parsed_date.strftime('%m/%d/%Y')}"
-                    split_invoices.append((percentage, parsed_date, description))
-            except ValueError as e:
-                print(f"Warning: Could not parse split invoice '{percentage_str}% {date_str}' from comments: {e}")
-                continue
-        
-        # Validate percentages add up reasonably (allow some tolerance for rounding)
-        total_percentage = sum(p[0] for p in split_invoices)
-        if abs(total_percentage - 100.0) > 1.0:  # Allow 1% tolerance for rounding
-            print(f"Warning: Split invoice percentages don't add up to 100%: {total_percentage}% in '{comments_str}'")
-        
-        return split_invoices
-    
-    # New format processing
-    split_invoices = []
-    
-    try:
-        # Parse the initial percentage and date
-        initial_percentage = float(initial_match.group(1))
-        initial_date_str = initial_match.group(2)
-        
-        # Parse the initial date
-        if '/' in initial_date_str:
-            date_parts = initial_date_str.split('/')
+    locator = get_file_locator()
+    mirror = get_network_mirror()
+    mirrored = mirror.fetch_many([path for _, path in project_lists if locator.exists(path)]) if mirror is not None else {}
+    
+    resolved = []
+    for year, n_drive_path in project_lists:
+        cached_copy = mirror.cached_copy(n_drive_path) if mirror is not None else None
+        if mirrored.get(n_drive_path):
+            resolved.append((year, mirrored[n_drive_path]))
+        elif locator.exists(n_drive_path):
+            resolved.append((year, n_drive_path))
+        elif cached_copy:
+            logger.info("N: drive file for %s not found, using mirrored copy: %s", year, cached_copy)
+            resolved.append((year, cached_copy))
         else:
-            date_parts = initial_date_str.split('-')
-        
-        if len(date_parts) == 3:
-            month, day, year = date_parts
-            initial_date = datetime(int(year), int(month), int(day))
-            
-            initial_description = f"{initial_percentage}% invoiced {initial_date.strftime('%m/%d/%Y')}"
-            split_invoices.append((initial_percentage, initial_date, initial_description))
-        
-        # Look for the "rest" date
-        rest_pattern = r'Invoiced rest on\s*(\d{1,2}[/-]\d{1,2}[/-]\d{4})'
-        rest_match = re.search(rest_pattern, comments_str, re.IGNORECASE)
-        
-        if rest_match:
-            rest_date_str = rest_match.group(1)
-            
-            # Parse the rest date
-            if '/' in rest_date_str:
-                date_parts = rest_date_str.split('/')
+            backup_path = os.path.join('quarterly sheets', os.path.basename(n_drive_path))
+            if locator.exists(backup_path):
+                logger.info("N: drive file for %s not found, using backup in quarterly sheets: %s", year, backup_path)
+                resolved.append((year, backup_path))
             else:
-                date_parts = rest_date_str.split('-')
-            
-            if len(date_parts) == 3:
-                month, day, year = date_parts
-                rest_date = datetime(int(year), int(month), int(day))
-                
-                # Calculate the remaining percentage
-                rest_percentage = 100.0 - initial_percentage
-                
-                rest_description = f"{rest_percentage}% invoiced {rest_date.strftime('%m/%d/%Y')} (rest)"
-                split_invoices.append((rest_percentage, rest_date, rest_description))
-        
-    except ValueError as e:
-        print(f"Warning: Could not parse new format split invoice from comments '{comments_str}': {e}")
-        return []
-    
-    return split_invoices
+                logger.warning("Neither N: drive nor backup found for %s Project List: %s", year, n_drive_path)
+                resolved.append((year, n_drive_path))
+    return resolved
 
-def create_split_records(original_record, split_invoices, original_amount, amount_invoiced):
+# Split invoice comment formats (compiled once, applied column-wide):
+#   "Invoiced at 50% on 4/18/2025. Invoiced rest on 5/13/2025"
+#   legacy "50% invoiced 4/18/2025" (also billed/paid), possibly repeated
+SPLIT_INITIAL_PATTERN = re.compile(r'Invoiced at (\d+(?:\.\d+)?)%\s*on\s*(\d{1,2}[/-]\d{1,2}[/-]\d{4})', re.IGNORECASE)
+SPLIT_REST_PATTERN = re.compile(r'Invoiced rest on\s*(\d{1,2}[/-]\d{1,2}[/-]\d{4})', re.IGNORECASE)
+SPLIT_LEGACY_PATTERN = re.compile(r'(\d+(?:\.\d+)?)%\s*(?:invoiced|billed|paid)\s*(\d{1,2}[/-]\d{1,2}[/-]\d{4})', re.IGNORECASE)
+
+def _parse_split_dates(date_strings):
     """
-    Create multiple records from a single record with split invoicing.
-    For new format: first record gets amount_invoiced, rest gets (original_amount - amount_invoiced)
-    Total across all records should equal original_amount (the "Amount" column)
-    Returns a list of modified records.
+    Parse each distinct m/d/Y (or m-d-Y) split date once.
+    Maps a date string to a datetime, None for mixed separators (skipped),
+    or the ValueError for an impossible date.
     """
-    if not split_invoices:
-        return [original_record]
-    
-    split_records = []
-    
-    for i, (percentage, invoice_date, description) in enumerate(split_invoices):
-        # Create a copy of the original record
-        split_record = original_record.copy()
-        
-        # For new format, calculate amount to ensure total equals original_amount
-        if len(split_invoices) == 2 and "rest" in description.lower():
-            # This is the "rest" invoice - use remaining amount to reach original_amount total
-            proportional_amount = original_amount - amount_invoiced
-        elif len(split_invoices) == 2 and i == 0:
-            # This is the first invoice in new format - use amount_invoiced
-            proportional_amount = amount_invoiced
-        else:
-            # Fallback to percentage calculation based on original_amount (old format or other cases)
-            proportional_amount = original_amount * (percentage / 100.0)
-        
-        # Update the record with split invoice information
-        split_record['Invoice Date'] = invoice_date
-        split_record['Amount Invoiced'] = proportional_amount
-        split_record['Split Invoice Description'] = description
-        split_record['Original Amount'] = original_amount
-        split_record['Split Percentage'] = percentage
-        
-        split_records.append(split_record)
-    
-    # Verify total equals original_amount
-    total_split = sum(record['Amount Invoiced'] for record in split_records)
-    if abs(total_split - original_amount) > 0.01:  # Small tolerance for floating point
-        print(f"Warning: Split invoice total (${total_split:,.2f}) doesn't equal original amount (${original_amount:,.2f})")
-    
-    return split_records
+    parsed = {}
+    for date_str in date_strings.unique():
+        date_parts = date_str.split('/') if '/' in date_str else date_str.split('-')
+        if len(date_parts) != 3:
+            parsed[date_str] = None
+            continue
+        month, day, year = date_parts
+        try:
+            parsed[date_str] = datetime(int(year), int(month), int(day))
+        except ValueError as e:
+            parsed[date_str] = e
+    return parsed
+
+def _extract_split_invoices(comments):
+    """
+    Extract split invoice entries from a column of comment strings.
+    Returns (entries, warnings): entries has one row per split invoice with
+    position (0-based row), percentage, date, rest (True for the "Invoiced rest"
+    entry) and order (0-based within the row), sorted by position and order;
+    warnings maps row positions to their parse warning messages.
+    """
+    initial = comments.str.extract(SPLIT_INITIAL_PATTERN)
+    has_new = initial[0].notna().to_numpy()
+    positions = np.arange(len(comments))
+    initial_pct = initial[0][has_new].astype(float).to_numpy()
+    rest = comments[has_new].str.extract(SPLIT_REST_PATTERN)[0]
+    has_rest = rest.notna().to_numpy()
+    legacy = comments[~has_new].str.extractall(SPLIT_LEGACY_PATTERN)
+    legacy_positions = legacy.index.get_level_values(0).to_numpy()
+    
+    entries = pd.concat([
+        pd.DataFrame({'position': positions[has_new], 'seq': 0, 'percentage': initial_pct,
+                      'date_str': initial[1][has_new].to_numpy(), 'rest': False, 'legacy': False}),
+        pd.DataFrame({'position': positions[has_new][has_rest], 'seq': 1, 'percentage': 100.0 - initial_pct[has_rest],
+                      'date_str': rest[has_rest].to_numpy(), 'rest': True, 'legacy': False}),
+        pd.DataFrame({'position': legacy_positions, 'seq': legacy.index.get_level_values(1).to_numpy(),
+                      'percentage': legacy[0].astype(float).to_numpy(), 'pct_str': legacy[0].to_numpy(),
+                      'date_str': legacy[1].to_numpy(), 'rest': False, 'legacy': True}),
+    ], ignore_index=True).astype({'position': int, 'seq': int}).sort_values(['position', 'seq'], kind='stable')
+    
+    parsed = _parse_split_dates(entries['date_str'])
+    entries['date'] = entries['date_str'].map(parsed)
+    failed = entries['date'].map(lambda value: isinstance(value, ValueError)).astype(bool)
+    
+    # New format: one bad date drops the whole row; legacy: only the bad entry is dropped
+    warnings = {}
+    bad_rows = set()
+    for entry in entries[failed].itertuples():
+        if entry.legacy:
+            warnings.setdefault(entry.position, []).append(
+                f"Could not parse split invoice '{entry.pct_str}% {entry.date_str}' from comments: {entry.date}")
+        elif entry.position not in bad_rows:
+            bad_rows.add(entry.position)
+            warnings.setdefault(entry.position, []).append(
+                f"Could not parse new format split invoice from comments '{comments.iloc[entry.position]}': {entry.date}")
+    keep = ~failed & entries['date'].notna() & ~entries['position'].isin(bad_rows)
+    
+    # Legacy percentages should add up to 100% (1% tolerance for rounding)
+    legacy_kept = entries[keep & entries['legacy']]
+    for position in np.unique(legacy_positions):
+        total_percentage = sum(legacy_kept.loc[legacy_kept['position'] == position, 'percentage'].tolist())
+        if abs(total_percentage - 100.0) > 1.0:
+            warnings.setdefault(position, []).append(
+                f"Split invoice percentages don't add up to 100%: {total_percentage}% in '{comments.iloc[position]}'")
+    
+    entries = entries[keep].reset_index(drop=True)
+    entries['order'] = entries.groupby('position').cumcount()
+    return entries[['position', 'percentage', 'date', 'rest', 'order']], warnings
 
-def collect_completion_data(quarter_info):
+def expand_split_invoices(completion_data):
+    """
+    Expand split invoices described in the Comments column into one row per invoice.
+    Rows with split comments where Amount differs from Amount Invoiced become one
+    row per split; with two splits the first gets Amount Invoiced and the second
+    the remainder, otherwise each gets its percentage of Amount (the "Amount"
+    column total is preserved). Rows with split comments where Amount equals
+    Amount Invoiced keep their Invoice Date with the full Amount.
+    Returns (expanded DataFrame, number of rows split).
+    """
+    row_count = len(completion_data)
+    if 'Comments' in completion_data.columns:
+        comments = completion_data['Comments'].reset_index(drop=True)
+        is_text = comments.map(lambda value: isinstance(value, str)).astype(bool)
+        comments = comments.where(is_text, '').astype(str).str.strip()
+    else:
+        comments = pd.Series([''] * row_count, dtype=object)
+    
+    original_amount = completion_data['Amount'].to_numpy()
+    amount_invoiced = completion_data['Amount Invoiced'].to_numpy()
+    difference = original_amount - amount_invoiced
+    mismatch = np.abs(difference.astype(float)) > 0.01  # Small tolerance for floating point
+    
+    entries, warnings = _extract_split_invoices(comments)
+    split_counts = np.bincount(entries['position'], minlength=row_count)
+    has_split = split_counts > 0
+    is_split = has_split & mismatch
+    
+    # Amounts per split: Amount Invoiced then the remainder for two-way splits, else a percentage of Amount
+    entries = entries[is_split[entries['position']]].reset_index(drop=True)
+    positions = entries['position'].to_numpy()
+    two_way = split_counts[positions] == 2
+    entry_amount = original_amount[positions]
+    entry_invoiced = amount_invoiced[positions]
+    entries['amount'] = np.where(two_way & entries['rest'].to_numpy(), entry_amount - entry_invoiced,
+                                 np.where(two_way & (entries['order'].to_numpy() == 0), entry_invoiced,
+                                          entry_amount * (entries['percentage'].to_numpy() / 100.0)))
+    entries['description'] = [f"{percentage}% invoiced {date.strftime('%m/%d/%Y')}" + (' (rest)' if rest else '')
+                              for percentage, date, rest in zip(entries['percentage'], entries['date'], entries['rest'])]
+    
+    # Warnings, and with DEBUG the details of each affected row, in sheet order
+    debug = logger.isEnabledFor(logging.DEBUG)
+    acgi = completion_data['ACGI #'].to_numpy() if 'ACGI #' in completion_data.columns else np.full(row_count, 'Unknown')
+    split_totals = entries.groupby('position')['amount'].sum()
+    for position in sorted(set(np.flatnonzero(has_split | mismatch)) | set(warnings)):
+        for warning in warnings.get(position, []):
+            logger.warning(warning)
+        if is_split[position] and abs(split_totals[position] - original_amount[position]) > 0.01:
+            logger.warning("Split invoice total ($%s) doesn't equal original amount ($%s)",
+                           format(split_totals[position], ",.2f"), format(original_amount[position], ",.2f"))
+        if not debug:
+            continue
+        if is_split[position]:
+            logger.debug("  Split invoice found for %s:", acgi[position])
+            logger.debug("    Total project amount: $%s", format(original_amount[position], ",.2f"))
+            logger.debug("    Amount invoiced so far: $%s", format(amount_invoiced[position], ",.2f"))
+            logger.debug("    Difference: $%s", format(difference[position], ",.2f"))
+            logger.debug("    Comments: %s", comments.iloc[position])
+            for split in entries[entries['position'] == position].itertuples():
+                logger.debug("    Split %s: %s = $%s on %s", split.order + 1, split.description,
+                             format(split.amount, ",.2f"), split.date.strftime('%m/%d/%Y'))
+        elif has_split[position]:
+            logger.debug("  %s: Split comments but Amount Invoiced = Amount ($%s), using full amount on Invoice Date",
+                         acgi[position], format(original_amount[position], ",.2f"))
+        elif mismatch[position]:
+            logger.debug("  %s: No split comments, using Amount Invoiced ($%s) despite Amount being ($%s)",
+                         acgi[position], format(amount_invoiced[position], ",.2f"), format(original_amount[position], ",.2f"))
+    
+    # Explode: split rows repeat once per split invoice, in place
+    repeats = np.where(is_split, split_counts, 1)
+    expanded = completion_data.iloc[np.repeat(np.arange(row_count), repeats)].copy()
+    split_rows = np.repeat(is_split, repeats)
+    full_amount_rows = np.repeat(has_split & ~mismatch, repeats)
+    
+    if full_amount_rows.any():
+        expanded.loc[full_amount_rows, 'Amount Invoiced'] = np.repeat(original_amount, repeats)[full_amount_rows]
+    if split_rows.any():
+        expanded['Invoice Date'] = expanded['Invoice Date'].astype(object)
+        expanded.loc[split_rows, 'Invoice Date'] = entries['date'].to_numpy()
+        expanded.loc[split_rows, 'Amount Invoiced'] = entries['amount'].to_numpy()
+        expanded['Split Invoice Description'] = np.nan
+        expanded['Original Amount'] = np.nan
+        expanded['Split Percentage'] = np.nan
+        expanded['Split Invoice Description'] = expanded['Split Invoice Description'].astype(object)
+        expanded.loc[split_rows, 'Split Invoice Description'] = entries['description'].to_numpy()
+        expanded.loc[split_rows, 'Original Amount'] = original_amount[positions]
+        expanded.loc[split_rows, 'Split Percentage'] = entries['percentage'].to_numpy()
+    
+    # Re-infer column types the way a frame rebuilt from rows would
+    return expanded.infer_objects(), int(is_split.sum())
+
+def collect_completion_data(quarter_info, workers=1):
     """
     Collect all completion data from project lists across all years.
+    workers > 1 parses uncached Project Lists in parallel processes.
     Returns a DataFrame with completion dates and amounts.
     """
-    print(f"Collecting completion data from project lists for {quarter_info['quarter_name']} {quarter_info['year']}...")
+    logger.info("Collecting completion data from project lists for %s %s...", quarter_info['quarter_name'], quarter_info['year'])
     
     all_completion_data = []
+    prefetch_project_list_snapshots(quarter_info['project_lists'], workers)
     
     for year, file_path in quarter_info['project_lists']:
-        print(f"\nProcessing {year} Project List...")
+        logger.info("Processing %s Project List...", year, extra=SECTION)
         
         try:
-            # Read the project list
-            df = pd.read_excel(file_path, sheet_name=year, header=5)
-            
-            # Handle different ACGI column names across years
-            acgi_col = None
-            for col in df.columns:
-                if 'acgi' in str(col).lower() and '#' in str(col):
-                    acgi_col = col
-                    break
-            
-            if acgi_col is None:
-                print(f"Warning: Could not find ACGI column in {year}, using first column")
-                acgi_col = df.columns[0]
+            # Read the project list (shared per-process snapshot, projected to COMPLETION_COLUMNS)
+            snapshot = get_project_list_snapshot(year, file_path)
+            df = snapshot.invoices
             
-            # Handle different project name column variations
-            project_col = None
-            for col in df.columns:
-                if 'project' in str(col).lower() and ('number' in str(col).lower() or 'name' in str(col).lower()):
-                    project_col = col
-                    break
-            if project_col is None:
-                project_col = 'Project Number/Name'  # fallback
+            # Column names vary across years: resolved once per sheet by the shared schema
+            schema = snapshot.schema
+            acgi_col = schema.column('acgi')
+            if 'acgi' in schema.fallbacks:
+                logger.warning("Could not find ACGI column in %s, using first column", year)
+            project_col = schema.column('project') or 'Project Number/Name'  # fallback
+            client_col = schema.column('client') or 'Client / PO #'  # fallback
+            line_col = schema.column('line') or 'Line #'  # fallback
+            po_date_col = schema.column('po_date') or 'PO Date'  # fallback
+            dept_col = schema.column('dept') or 'Dept'  # fallback
+            invoice_date_col = schema.column('invoice_date') or 'Invoice Date'  # fallback
             
-            # Handle different client PO column variations
-            client_col = None
-            for col in df.columns:
-                if 'client' in str(col).lower() and 'po' in str(col).lower():
-                    client_col = col
-                    break
-            if client_col is None:
-                client_col = 'Client / PO #'  # fallback
-            
-            # Handle different Line # column variations
-            line_col = None
-            for col in df.columns:
-                if 'line' in str(col).lower() and '#' in str(col):
-                    line_col = col
-                    break
-            if line_col is None:
-                line_col = 'Line #'  # fallback
-            
-            # Handle different PO Date column variations  
-            po_date_col = None
-            for col in df.columns:
-                col_lower = str(col).lower()
-                if 'po' in col_lower and 'date' in col_lower:
-                    po_date_col = col
-                    break
-            if po_date_col is None:
-                po_date_col = 'PO Date'  # fallback
-            
-            # Handle different Dept column variations
-            dept_col = None
-            for col in df.columns:
-                col_lower = str(col).lower()
-                if 'dept' in col_lower or 'department' in col_lower:
-                    dept_col = col
-                    break
-            if dept_col is None:
-                dept_col = 'Dept'  # fallback
-            
-            # Handle different Invoice Date column variations
-            invoice_date_col = None
-            for col in df.columns:
-                col_lower = str(col).lower()
-                if 'invoice' in col_lower and 'date' in col_lower:
-                    invoice_date_col = col
-                    break
-            if invoice_date_col is None:
-                invoice_date_col = 'Invoice Date'  # fallback
-            
-            # Handle different Comments column variations
-            comments_col = None
-            
-            # First try to find column N specifically (Comments field is in column N)
-            if len(df.columns) >= 14:  # Column N is the 14th column (0-indexed = 13)
-                comments_col = df.columns[13]  # Column N (0-indexed)
-                print(f"Using column N ({comments_col}) as Comments field")
+            # Comments field is in column N; search by name if column N doesn't exist
+            comments_col = schema.column('comments') or 'Comments'  # fallback
+            if 'comments' in schema.fallbacks:
+                logger.info("Using column N (%s) as Comments field", comments_col)
             else:
-                # Fallback: search by name if column N doesn't exist
-                for col in df.columns:
-                    col_lower = str(col).lower()
-                    if 'comment' in col_lower or 'note' in col_lower:
-                        comments_col = col
-                        break
-                if comments_col is None:
-                    comments_col = 'Comments'  # fallback
-                print(f"Column N not available, using {comments_col} as Comments field")
+                logger.info("Column N not available, using %s as Comments field", comments_col)
             
             # Select columns with fallback handling
             required_cols = ['Amount Invoiced', 'Amount']  # Need both Amount and Amount Invoiced for split calculation
@@ -400,10 +407,10 @@ def collect_completion_data(quarter_info):
                 if col in df.columns:
                     available_cols.append(col)
                 else:
-                    print(f"Warning: Column '{col}' not found in {year}")
+                    logger.warning("Column '%s' not found in %s", col, year)
             
             # Debug: Print all available columns to help identify columns
-            print(f"Available columns in {year}: {list(df.columns)}")
+            logger.debug("Available columns in %s: %s", year, snapshot.columns)
             
             completion_data = df[available_cols].copy()
             
@@ -430,131 +437,67 @@ def collect_completion_data(quarter_info):
             completion_data = completion_data.dropna(subset=['Amount Invoiced', 'Amount'])
             
             # Debug: Check for specific record before any filtering
+            debug = logger.isEnabledFor(logging.DEBUG)
             acgi_col_name = acgi_col if acgi_col in df.columns else 'ACGI #'
-            if acgi_col_name in df.columns:
+            if debug and acgi_col_name in df.columns:
                 try:
                     # Check for 25-1376
                     mask = df[acgi_col_name].astype(str).str.contains('25-1376', na=False)
                     specific_record = df[mask]
                     if not specific_record.empty:
                         record = specific_record.iloc[0]
-                        print(f"  *** Found 25-1376 in raw data: ***")
-                        print(f"      ACGI #: {record.get(acgi_col_name, 'N/A')}")
-                        print(f"      Invoice Date (raw): {record.get(invoice_date_col, 'N/A')}")
-                        print(f"      Completion Date (raw): {record.get('Completion Date', 'N/A')}")
-                        print(f"      Amount Invoiced (raw): {record.get('Amount Invoiced', 'N/A')}")
-                        print(f"      Comments (raw): {record.get(comments_col, 'N/A')}")
+                        logger.debug("  *** Found 25-1376 in raw data: ***")
+                        logger.debug("      ACGI #: %s", record.get(acgi_col_name, 'N/A'))
+                        logger.debug("      Invoice Date (raw): %s", record.get(invoice_date_col, 'N/A'))
+                        logger.debug("      Completion Date (raw): %s", record.get('Completion Date', 'N/A'))
+                        logger.debug("      Amount Invoiced (raw): %s", record.get('Amount Invoiced', 'N/A'))
+                        logger.debug("      Comments (raw): %s", record.get(comments_col, 'N/A'))
                     
                     # Check for 24-3163
                     mask_3163 = df[acgi_col_name].astype(str).str.contains('24-3163', na=False)
                     specific_record_3163 = df[mask_3163]
                     if not specific_record_3163.empty:
                         record = specific_record_3163.iloc[0]
-                        print(f"  *** Found 24-3163 in raw data: ***")
-                        print(f"      ACGI #: {record.get(acgi_col_name, 'N/A')}")
-                        print(f"      Invoice Date (raw): {record.get(invoice_date_col, 'N/A')}")
-                        print(f"      Completion Date (raw): {record.get('Completion Date', 'N/A')}")
-                        print(f"      Amount Invoiced (raw): {record.get('Amount Invoiced', 'N/A')}")
-                        print(f"      Comments (raw): {record.get(comments_col, 'N/A')}")
+                        logger.debug("  *** Found 24-3163 in raw data: ***")
+                        logger.debug("      ACGI #: %s", record.get(acgi_col_name, 'N/A'))
+                        logger.debug("      Invoice Date (raw): %s", record.get(invoice_date_col, 'N/A'))
+                        logger.debug("      Completion Date (raw): %s", record.get('Completion Date', 'N/A'))
+                        logger.debug("      Amount Invoiced (raw): %s", record.get('Amount Invoiced', 'N/A'))
+                        logger.debug("      Comments (raw): %s", record.get(comments_col, 'N/A'))
                     else:
-                        print(f"  *** 24-3163 NOT found in raw {year} data ***")
+                        logger.debug("  *** 24-3163 NOT found in raw %s data ***", year)
                 except Exception as e:
-                    print(f"  Debug search for records failed: {e}")
-            
-            # Handle problematic date entries
-            def safe_date_parse(date_val):
-                if pd.isna(date_val):
-                    return pd.NaT
-                if isinstance(date_val, str) and date_val.strip() == '':
-                    return pd.NaT
-                try:
-                    parsed_date = pd.to_datetime(date_val)
-                    return parsed_date
-                except:
-                    print(f"Warning: Could not parse date '{date_val}' in {year}")
-                    return pd.NaT
+                    logger.debug("  Debug search for records failed: %s", e)
             
             # Parse Completion Date (optional - we don't filter on this anymore)
-            print(f"Parsing completion dates in {year} (optional)...")
-            completion_data['Completion Date'] = completion_data['Completion Date'].apply(safe_date_parse)
+            logger.info("Parsing completion dates in %s (optional)...", year)
+            completion_data['Completion Date'], report = parse_date_column(
+                completion_data['Completion Date'], 'Completion Date', first_row=FIRST_DATA_ROW)
+            if report:
+                logger.warning("%s in %s", report.summary(), year)
             
             # Parse Invoice Date for filtering (REQUIRED)
-            print(f"Parsing invoice dates in {year} (required)...")
-            completion_data['Invoice Date'] = completion_data['Invoice Date'].apply(safe_date_parse)
+            logger.info("Parsing invoice dates in %s (required)...", year)
+            completion_data['Invoice Date'], report = parse_date_column(
+                completion_data['Invoice Date'], 'Invoice Date', first_row=FIRST_DATA_ROW)
+            if report:
+                logger.warning("%s in %s", report.summary(), year)
             
             # Clean and prepare data for split invoice processing
             completion_data['Amount Invoiced'] = pd.to_numeric(completion_data['Amount Invoiced'], errors='coerce')
-            print(f"Records before amount filtering: {len(completion_data)}")
+            logger.info("Records before amount filtering: %s", len(completion_data))
             completion_data = completion_data.dropna(subset=['Amount Invoiced'])  # Remove non-numeric amounts
-            print(f"Records after amount filtering: {len(completion_data)}")
+            logger.info("Records after amount filtering: %s", len(completion_data))
             
             # *** SPLIT INVOICE PROCESSING ***
-            print(f"Processing split invoices from comments in {year}...")
-            expanded_records = []
-            split_count = 0
-            
-            for idx, row in completion_data.iterrows():
-                original_amount = row['Amount']  # Total project amount - this is what should go in the sheet
-                amount_invoiced = row['Amount Invoiced']  # Amount actually invoiced so far
-                comments = row.get('Comments', '')
-                
-                # Safely handle comments that might be NaN or other non-string types
-                if pd.isna(comments) or not isinstance(comments, str):
-                    comments = ''
-                else:
-                    comments = str(comments).strip()
-                
-                # First check if there are split invoice patterns in comments
-                split_invoices = parse_split_invoices(comments, original_amount)
-                
-                if split_invoices:
-                    # Split comments found - now check if we need to split based on Amount vs Amount Invoiced
-                    should_split = abs(original_amount - amount_invoiced) > 0.01  # Use small tolerance for floating point comparison
-                    
-                    if should_split:
-                        # Create multiple records for split invoices
-                        split_records = create_split_records(row, split_invoices, original_amount, amount_invoiced)
-                        expanded_records.extend(split_records)
-                        split_count += 1
-                        
-                        # Debug: Show split invoice processing
-                        acgi_num = row.get('ACGI #', 'Unknown')
-                        print(f"  Split invoice found for {acgi_num}:")
-                        print(f"    Total project amount: ${original_amount:,.2f}")
-                        print(f"    Amount invoiced so far: ${amount_invoiced:,.2f}")
-                        print(f"    Difference: ${original_amount - amount_invoiced:,.2f}")
-                        print(f"    Comments: {comments}")
-                        for i, (percentage, date, desc) in enumerate(split_invoices):
-                            if len(split_invoices) == 2 and "rest" in desc.lower():
-                                amount = original_amount - amount_invoiced
-                            elif len(split_invoices) == 2 and i == 0:
-                                amount = amount_invoiced
-                            else:
-                                amount = original_amount * (percentage / 100.0)
-                            print(f"    Split {i+1}: {desc} = ${amount:,.2f} on {date.strftime('%m/%d/%Y')}")
-                    else:
-                        # Split comments but Amount = Amount Invoiced, use full Amount on Invoice Date
-                        row_copy = row.copy()
-                        row_copy['Amount Invoiced'] = original_amount  # Use full Amount value
-                        expanded_records.append(row_copy)
-                        print(f"  {row.get('ACGI #', 'Unknown')}: Split comments but Amount Invoiced = Amount (${original_amount:,.2f}), using full amount on Invoice Date")
-                else:
-                    # No split comments found - just use Amount Invoiced as-is, regardless of Amount mismatch
-                    expanded_records.append(row)
-                    
-                    # Optional debug for large mismatches (but we won't change the amount)
-                    if abs(original_amount - amount_invoiced) > 0.01:
-                        acgi_num = row.get('ACGI #', 'Unknown')
-                        print(f"  {acgi_num}: No split comments, using Amount Invoiced (${amount_invoiced:,.2f}) despite Amount being (${original_amount:,.2f})")
-            
-            # Convert back to DataFrame
-            completion_data = pd.DataFrame(expanded_records)
-            print(f"Split invoice processing complete: {split_count} records split into {len(completion_data)} total records")
+            logger.info("Processing split invoices from comments in %s...", year)
+            completion_data, split_count = expand_split_invoices(completion_data)
+            logger.info("Split invoice processing complete: %s records split into %s total records", split_count, len(completion_data))
             
             # Now filter by Invoice Date after split processing
-            print(f"Records before invoice date filtering: {len(completion_data)}")
+            logger.info("Records before invoice date filtering: %s", len(completion_data))
             completion_data = completion_data.dropna(subset=['Invoice Date'])  # Remove unparseable invoice dates
-            print(f"Records after invoice date filtering: {len(completion_data)}")
+            logger.info("Records after invoice date filtering: %s", len(completion_data))
             
             # Filter for the selected quarter dates based on INVOICE DATE
             quarter_start = quarter_info['start_date']
@@ -562,58 +505,60 @@ def collect_completion_data(quarter_info):
             quarter_name = quarter_info['quarter_name']
             year_selected = quarter_info['year']
             
-            print(f"Records before {quarter_name} date filtering: {len(completion_data)}")
+            logger.info("Records before %s date filtering: %s", quarter_name, len(completion_data))
             
             # Debug: Check for specific records before quarter filtering
-            specific_record_before_quarter = completion_data[completion_data.get('ACGI #', pd.Series()).astype(str).str.contains('25-1376', na=False)]
-            if not specific_record_before_quarter.empty:
-                record = specific_record_before_quarter.iloc[0]
-                invoice_date = record.get('Invoice Date', 'N/A')
-                print(f"  *** 25-1376 before {quarter_name} filtering: ***")
-                print(f"      Invoice Date: {invoice_date}")
-                print(f"      Is in {quarter_name} range ({quarter_start.date()} to {quarter_end.date()}): {quarter_start <= invoice_date <= quarter_end if pd.notna(invoice_date) else 'N/A'}")
-            
-            # Debug: Check for 24-3163 before quarter filtering
-            specific_record_3163_before_quarter = completion_data[completion_data.get('ACGI #', pd.Series()).astype(str).str.contains('24-3163', na=False)]
-            if not specific_record_3163_before_quarter.empty:
-                record = specific_record_3163_before_quarter.iloc[0]
-                invoice_date = record.get('Invoice Date', 'N/A')
-                print(f"  *** 24-3163 before {quarter_name} filtering: ***")
-                print(f"      Invoice Date: {invoice_date}")
-                print(f"      Is in {quarter_name} range ({quarter_start.date()} to {quarter_end.date()}): {quarter_start <= invoice_date <= quarter_end if pd.notna(invoice_date) else 'N/A'}")
-            else:
-                print(f"  *** 24-3163 not found before {quarter_name} filtering ***")
+            if debug:
+                specific_record_before_quarter = completion_data[completion_data.get('ACGI #', pd.Series()).astype(str).str.contains('25-1376', na=False)]
+                if not specific_record_before_quarter.empty:
+                    record = specific_record_before_quarter.iloc[0]
+                    invoice_date = record.get('Invoice Date', 'N/A')
+                    logger.debug("  *** 25-1376 before %s filtering: ***", quarter_name)
+                    logger.debug("      Invoice Date: %s", invoice_date)
+                    logger.debug("      Is in %s range (%s to %s): %s", quarter_name, quarter_start.date(), quarter_end.date(), quarter_start <= invoice_date <= quarter_end if pd.notna(invoice_date) else 'N/A')
+                
+                # Debug: Check for 24-3163 before quarter filtering
+                specific_record_3163_before_quarter = completion_data[completion_data.get('ACGI #', pd.Series()).astype(str).str.contains('24-3163', na=False)]
+                if not specific_record_3163_before_quarter.empty:
+                    record = specific_record_3163_before_quarter.iloc[0]
+                    invoice_date = record.get('Invoice Date', 'N/A')
+                    logger.debug("  *** 24-3163 before %s filtering: ***", quarter_name)
+                    logger.debug("      Invoice Date: %s", invoice_date)
+                    logger.debug("      Is in %s range (%s to %s): %s", quarter_name, quarter_start.date(), quarter_end.date(), quarter_start <= invoice_date <= quarter_end if pd.notna(invoice_date) else 'N/A')
+                else:
+                    logger.debug("  *** 24-3163 not found before %s filtering ***", quarter_name)
             
             quarter_data = completion_data[
                 (completion_data['Invoice Date'] >= quarter_start) & 
                 (completion_data['Invoice Date'] <= quarter_end)
             ].copy()
             
-            print(f"Records after {quarter_name} date filtering: {len(quarter_data)}")
+            logger.info("Records after %s date filtering: %s", quarter_name, len(quarter_data))
             
             # Debug: Check for 25-1376 after quarter filtering
-            specific_record_after_quarter = quarter_data[quarter_data.get('ACGI #', pd.Series()).astype(str).str.contains('25-1376', na=False)]
-            if not specific_record_after_quarter.empty:
-                print(f"  *** 25-1376 found in final {quarter_name} data ***")
-            elif not specific_record_before_quarter.empty:
-                print(f"  *** 25-1376 was filtered OUT by {quarter_name} date range ***")
+            if debug:
+                specific_record_after_quarter = quarter_data[quarter_data.get('ACGI #', pd.Series()).astype(str).str.contains('25-1376', na=False)]
+                if not specific_record_after_quarter.empty:
+                    logger.debug("  *** 25-1376 found in final %s data ***", quarter_name)
+                elif not specific_record_before_quarter.empty:
+                    logger.debug("  *** 25-1376 was filtered OUT by %s date range ***", quarter_name)
             
             if not quarter_data.empty:
                 quarter_data['Source_Year'] = year
                 all_completion_data.append(quarter_data)
-                print(f"Found {len(quarter_data)} {quarter_name} {year_selected} completion records from {year}")
+                logger.info("Found %s %s %s completion records from %s", len(quarter_data), quarter_name, year_selected, year)
             else:
-                print(f"No {quarter_name} {year_selected} completion records found in {year}")
+                logger.info("No %s %s completion records found in %s", quarter_name, year_selected, year)
                 
         except Exception as e:
-            print(f"Error processing {year} Project List: {e}")
+            logger.error("Could not process %s Project List: %s", year, e)
     
     if all_completion_data:
         combined_data = pd.concat(all_completion_data, ignore_index=True)
-        print(f"\nTotal {quarter_info['quarter_name']} {quarter_info['year']} completion records collected: {len(combined_data)}")
+        logger.info("Total %s %s completion records collected: %s", quarter_info['quarter_name'], quarter_info['year'], len(combined_data), extra=SECTION)
         return combined_data
     else:
-        print(f"\nNo completion data found for {quarter_info['quarter_name']} {quarter_info['year']}")
+        logger.info("No completion data found for %s %s", quarter_info['quarter_name'], quarter_info['year'], extra=SECTION)
         return pd.DataFrame()
 
 def calculate_monthly_totals(completion_data):
@@ -637,12 +582,147 @@ def calculate_monthly_totals(completion_data):
     
     return totals_dict
 
-def update_quarterly_ytd(completion_data, quarter_info):
+# Row 1 month headers and the sheet row of the first day block (after the totals row and 3 blank rows)
+YTD_MONTH_HEADERS = ['January', 'February', 'March', 'April', 'May', 'June', 
+                     'July', 'August', 'September', 'October', 'November', 'December', 'YTD Totals']
+YTD_FIRST_BLOCK_ROW = 6
+
+# Column headers repeated under each day header
+YTD_COLUMN_HEADERS = ['ACGI Project/ Invoice #', 'Dept', 'Project Number/ Name', 'Type', 
+                      'Client / PO #', 'Line #', 'PO Date', 'Amount', 'Invoice Date', 'Amount Invoiced']
+
+# ACGI project numbers sort by (year, number): '24-0123' -> (24, 123), '1234' -> (0, 1234)
+ACGI_SORT_PATTERN = r'^\+?(\d+)\s*-\s*(\d*)$|^\+?(\d+)$'
+
+def acgi_sort_keys(acgi):
+    """(year, number) sort key arrays of a column of ACGI project numbers; (0, 0) when unparseable"""
+    parts = acgi.astype(str).str.strip().str.extract(ACGI_SORT_PATTERN)
+    year = pd.to_numeric(parts[0], errors='coerce').fillna(0)
+    number = pd.to_numeric(parts[1].fillna(parts[2]), errors='coerce').fillna(0)
+    return year.to_numpy(dtype=float), number.to_numpy(dtype=float)
+
+def format_po_date(po_date):
+    """PO Date cell text (m/d/Y), or the raw value if it is not a date"""
+    if pd.isna(po_date) or po_date == '':
+        return ''
+    try:
+        if isinstance(po_date, str):
+            po_date = pd.to_datetime(po_date)
+        return po_date.strftime('%m/%d/%Y')
+    except:
+        return str(po_date)
+
+def ytd_day_blocks(completion_data):
+    """
+    Cell values of the YTD sheet's day blocks, in date order.
+    Each block is {'date': date, 'rows': [[values of columns A-J], ...], 'total': daily total}.
+    
+    The quarter is ordered once by (invoice date, ACGI year, ACGI number) and
+    the day blocks are slices of that order.
+    """
+    if completion_data.empty:
+        return []
+    
+    def column(name, default=''):
+        if name in completion_data.columns:
+            return completion_data[name]
+        return pd.Series(default, index=completion_data.index, dtype=object)
+    
+    days = completion_data['Invoice Date'].dt.normalize().to_numpy()
+    acgi_year, acgi_number = acgi_sort_keys(column('ACGI #'))
+    order = np.lexsort((acgi_number, acgi_year, days))
+    ordered = completion_data.iloc[order]
+    days = days[order]
+    starts = np.flatnonzero(np.r_[True, days[1:] != days[:-1]])
+    ends = np.r_[starts[1:], len(days)]
+    
+    def text(name, default=''):
+        return [str(value) for value in column(name, default).iloc[order]]
+    
+    # Project Number/Name (with split info if applicable)
+    project_names = text('Project Number/Name')
+    split_descriptions = column('Split Invoice Description', None).iloc[order]
+    for i, description in enumerate(split_descriptions):
+        if pd.notna(description):
+            project_names[i] += f" [{description}]"
+    
+    amounts = [float(amount) if pd.notna(amount) else 0 for amount in ordered['Amount Invoiced']]
+    columns = [
+        text('ACGI #'),
+        text('Dept'),
+        project_names,
+        text('Type', 'Completion'),
+        text('Client / PO #'),
+        text('Line #'),
+        [format_po_date(po_date) for po_date in column('PO Date').iloc[order]],
+        amounts,
+        list(ordered['Invoice Date'].dt.strftime('%m/%d/%Y')),
+        amounts,  # Amount Invoiced
+    ]
+    rows = [list(values) for values in zip(*columns)]
+    
+    return [{'date': pd.Timestamp(days[start]).date(),
+             'rows': rows[start:end],
+             'total': sum(amounts[start:end])}
+            for start, end in zip(starts, ends)]
+
+def day_block_labels(date_only):
+    """Day header and daily total labels of a day block"""
+    day_of_week = date_only.strftime('%A')
+    header = f"{day_of_week} {date_only.month}-{date_only.day}-{date_only.year} (Invoice Date)"
+    total_label = f"Daily Total for {date_only.strftime('%m/%d/%Y')} (Invoice Date)"
+    return header, total_label
+
+def day_block_widths(block):
+    """Longest rendered value in each of columns A-J of a day block"""
+    widths = ColumnWidths(10)
+    for _, values, _ in day_block_rows(block):
+        widths.update(values)
+    return widths.lengths
+
+def day_index_entry(block, first_row=None, last_row=None):
+    """YtdDayIndex entry of a day block written at first_row..last_row"""
+    return {
+        'date': block['date'].isoformat(),
+        'fingerprint': content_hash(repr(block['rows']).encode('utf-8')),
+        'first_row': first_row,
+        'last_row': last_row,
+        'widths': day_block_widths(block),
+    }
+
+def ytd_header_rows(monthly_totals):
+    """(kind, values, styles) of row 1 (month headers) and row 2 (monthly totals) of the YTD sheet"""
+    # Zero months are left unformatted
+    total_styles = ['month total' if total > 0 else 'centered' for total in monthly_totals]
+    return [('month headers', YTD_MONTH_HEADERS, None),
+            ('monthly totals', list(monthly_totals), total_styles)]
+
+def day_block_rows(block):
+    """(kind, values, styles) of a day block's rows: date header, column headers, transactions, daily total"""
+    header, total_label = day_block_labels(block['date'])
+    rows = [('day header', [header], None), ('header', YTD_COLUMN_HEADERS, None)]
+    rows.extend(('invoice', values, None) for values in block['rows'])
+    total_row = [total_label] + [None] * 9
+    total_row[7] = total_row[9] = block['total']  # Amount and Amount Invoiced totals
+    rows.append(('day total', total_row, None))
+    return rows
+
+def write_day_block(ws, first_row, block, merged_ranges=None):
+    """Write a day block into a loaded worksheet from first_row; returns its last row"""
+    rows = day_block_rows(block)
+    for offset, row in enumerate(rows):
+        write_template_row(ws, first_row + offset, QUARTERLY_YTD_TEMPLATE, *row, merged_ranges=merged_ranges)
+    return first_row + len(rows) - 1
+
+def update_quarterly_ytd(completion_data, quarter_info, cube=None, incremental=True):
     """
     Update the quarterly YTD Excel file with new completion data and detailed formatting.
+    cube is the InvoiceCube of completion_data (built here if not given). With
+    incremental, a file whose YTD index is current only has its changed day
+    blocks and monthly totals rewritten; otherwise the file is rebuilt.
     """
     quarterly_file = quarter_info['quarterly_file']
-    print(f"\nUpdating {quarterly_file}...")
+    logger.info("Updating %s...", quarterly_file, extra=SECTION)
     
     # Read existing monthly totals from previous quarter file or current file if it exists
     existing_monthly_totals = [0] * 13  # Initialize all to 0
@@ -658,33 +738,38 @@ def update_quarterly_ytd(completion_data, quarter_info):
     
     # Try to read from previous quarter file first
     if previous_quarter_file and os.path.exists(previous_quarter_file):
-        print(f"Reading monthly totals from previous quarter: {previous_quarter_file}")
+        logger.info("Reading monthly totals from previous quarter: %s", previous_quarter_file)
         try:
-            previous_wb = load_workbook(previous_quarter_file)
-            previous_ws = previous_wb.active
-            
             # Read monthly totals from row 2 (columns 1-13)
+            if get_reader_engine() == 'direct':
+                with XlsxColumnReader(previous_quarter_file) as reader:
+                    totals_row = reader.read_row(reader.active_sheet, 2, columns=range(1, 14))
+            else:
+                previous_wb = load_workbook(previous_quarter_file)
+                previous_ws = previous_wb.active
+                totals_row = {col: previous_ws.cell(row=2, column=col).value for col in range(1, 14)}
+                previous_wb.close()
+            
             for col in range(1, 14):  # Columns A-M (1-13)
                 try:
-                    cell_value = previous_ws.cell(row=2, column=col).value
+                    cell_value = totals_row.get(col)
                     if cell_value is not None and isinstance(cell_value, (int, float)):
-                        existing_monthly_totals[col-1] = float(cell_value)
+                        existing_monthly_totals[col-1] = round(float(cell_value), 2)
                         if col <= 12:  # Don't show YTD in the list
                             month_names = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
                                          'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-                            print(f"  {month_names[col-1]}: ${cell_value:,.2f}")
+                            logger.info("  %s: $%s", month_names[col-1], format(cell_value, ",.2f"))
                 except Exception as e:
-                    print(f"  Warning: Could not read previous quarter value for column {col}: {e}")
+                    logger.warning("Could not read previous quarter value for column %s: %s", col, e)
             
-            previous_wb.close()
-            print(f"✓ Successfully loaded totals from previous quarter")
+            logger.info("✓ Successfully loaded totals from previous quarter")
             
         except Exception as e:
-            print(f"Warning: Could not read previous quarter file: {e}")
-            print("Will start with zero values for all months")
+            logger.warning("Could not read previous quarter file: %s", e)
+            logger.info("Will start with zero values for all months")
     elif quarter_info['quarter_num'] > 1:
-        print(f"Previous quarter file not found: {previous_quarter_file}")
-        print("Using hardcoded Q1 values as baseline:")
+        logger.info("Previous quarter file not found: %s", previous_quarter_file)
+        logger.info("Using hardcoded Q1 values as baseline:")
         # Hardcode Q1 2025 values when previous quarter file is not available
         existing_monthly_totals[0] = 872459.74   # January
         existing_monthly_totals[1] = 609301.81   # February  
@@ -692,9 +777,9 @@ def update_quarterly_ytd(completion_data, quarter_info):
         month_names = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
                       'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
         for i in range(3):  # Show Q1 months
-            print(f"  {month_names[i]}: ${existing_monthly_totals[i]:,.2f}")
+            logger.info("  %s: $%s", month_names[i], format(existing_monthly_totals[i], ",.2f"))
     else:
-        print("Q1 - no previous quarter, starting with zero values")
+        logger.info("Q1 - no previous quarter, starting with zero values")
     
     # Create backup of current quarter file if it exists
     if os.path.exists(quarterly_file):
@@ -702,85 +787,23 @@ def update_quarterly_ytd(completion_data, quarter_info):
         try:
             import shutil
             shutil.copy2(quarterly_file, backup_file)
-            print(f"Backup of current file saved as: {backup_file}")
+            logger.info("Backup of current file saved as: %s", backup_file)
         except Exception as backup_error:
-            print(f"Warning: Could not create backup: {backup_error}")
-    
-    # Create new workbook
-    wb = Workbook()
-    ws = wb.active
-    ws.title = f"Q{quarter_info['quarter_num']} {quarter_info['year']} YTD"
-    
-    # Define styles
-    # Month header style (bold, green background)
-    month_style = Font(bold=True, color="FFFFFF")
-    month_fill = PatternFill(start_color="00AA00", end_color="00AA00", fill_type="solid")
-    
-    # Total style (bold, red font)
-    total_style = Font(bold=True, color="FF0000")
-    
-    # Day header style (bold, black border)
-    day_style = Font(bold=True)
-    day_border = Border(
-        left=Side(border_style="thick", color="000000"),
-        right=Side(border_style="thick", color="000000"),
-        top=Side(border_style="thick", color="000000"),
-        bottom=Side(border_style="thick", color="000000")
-    )
-    
-    # Column header style (bold, gray background)
-    header_style = Font(bold=True)
-    header_fill = PatternFill(start_color="D3D3D3", end_color="D3D3D3", fill_type="solid")
-    
-    # Regular border
-    regular_border = Border(
-        left=Side(border_style="thin", color="000000"),
-        right=Side(border_style="thin", color="000000"),
-        top=Side(border_style="thin", color="000000"),
-        bottom=Side(border_style="thin", color="000000")
-    )
-    
-    # Center alignment
-    center_align = Alignment(horizontal='center', vertical='center')
-    
-    # Current row tracker
-    current_row = 1
+            logger.warning("Could not create backup: %s", backup_error)
     
-    # --- HEADER SECTION ---
-    # Row 1: Month headers
-    month_names = ['January', 'February', 'March', 'April', 'May', 'June', 
-                  'July', 'August', 'September', 'October', 'November', 'December', 'YTD Totals']
-    
-    for col, month in enumerate(month_names, 1):
-        cell = ws.cell(row=current_row, column=col, value=month)
-        cell.font = month_style
-        cell.fill = month_fill
-        cell.alignment = center_align
-        cell.border = regular_border
-    
-    current_row += 1
-    
-    # Row 2: Monthly totals (calculate Q2 totals, preserve existing values for other months)
+    # Monthly totals (calculate the quarter's totals, preserve existing values for other months)
     daily_totals = {}
     if not completion_data.empty:
-        # Group by date and calculate daily totals
-        completion_data_sorted = completion_data.sort_values('Invoice Date').reset_index(drop=True)
-        completion_data_sorted['Date_Only'] = completion_data_sorted['Invoice Date'].dt.date
-        grouped_by_date = completion_data_sorted.groupby('Date_Only')
-        
-        # Calculate monthly totals from daily totals
-        for date_only, date_group in grouped_by_date:
-            month = date_only.month
-            daily_total = date_group['Amount Invoiced'].sum()
-            if month not in daily_totals:
-                daily_totals[month] = 0
-            daily_totals[month] += daily_total
+        # Monthly totals come from the daily invoice cube
+        cube = cube or InvoiceCube.build(completion_data)
+        for month, count, total in cube.by_month('Amount Invoiced'):
+            daily_totals[month.month] = total
     
     # Start with existing monthly totals and only update the selected quarter months
     monthly_totals = existing_monthly_totals.copy()
     
     # Update only the selected quarter months with calculated values
-    print(f"Updating {quarter_info['quarter_name']} monthly totals:")
+    logger.info("Updating %s monthly totals:", quarter_info['quarter_name'])
     month_indices = quarter_info['month_indices']
     for month_num, total in daily_totals.items():
         if month_num in month_indices:
@@ -788,318 +811,254 @@ def update_quarterly_ytd(completion_data, quarter_info):
             monthly_totals[month_indices[month_num]] = total
             month_names = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
                           'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-            print(f"  {month_names[month_indices[month_num]]}: ${old_value:,.2f} → ${total:,.2f}")
+            logger.info("  %s: $%s → $%s", month_names[month_indices[month_num]], format(old_value, ",.2f"), format(total, ",.2f"))
     
-    # Calculate YTD total from all months (existing + updated)
-    ytd_total = sum(monthly_totals[:12])  # Sum first 12 months, exclude old YTD
+    # Calculate YTD total from all months (existing + updated), in cents like the months
+    ytd_total = round(sum(monthly_totals[:12]), 2)  # Sum first 12 months, exclude old YTD
     monthly_totals[12] = ytd_total
-    print(f"  YTD Total: ${ytd_total:,.2f}")
+    logger.info("  YTD Total: $%s", format(ytd_total, ",.2f"))
     
-    # Write monthly totals with formatting
-    for col, total in enumerate(monthly_totals, 1):
-        cell = ws.cell(row=current_row, column=col, value=total)
-        if total > 0:
-            cell.number_format = '"$"#,##0.00'
-            cell.font = total_style
-        cell.alignment = center_align
-        cell.border = regular_border
+    blocks = ytd_day_blocks(completion_data)
     
-    current_row += 1
+    # Incremental mode: rewrite only what changed since the index was recorded
+    index = YtdDayIndex.load(quarterly_file) if incremental else None
+    if index is not None and update_quarterly_ytd_incrementally(quarterly_file, index, monthly_totals, blocks):
+        return True
+    if incremental and os.path.exists(quarterly_file):
+        logger.info("No up-to-date YTD index for this file - rebuilding it in full")
+    
+    # Build the sheet row by row; it is streamed into a write-only workbook on save
+    sheet = ReportSheet(f"Q{quarter_info['quarter_num']} {quarter_info['year']} YTD", QUARTERLY_YTD_TEMPLATE)
     
-    # Empty separator rows
-    for _ in range(3):
-        current_row += 1
+    # --- HEADER SECTION ---
+    for row in ytd_header_rows(monthly_totals):
+        sheet.write(*row)
+    sheet.skip(YTD_FIRST_BLOCK_ROW - sheet.next_row)
     
     # --- DATA SECTION ---
+    index = YtdDayIndex(quarterly_file, monthly_totals=monthly_totals)
     if not completion_data.empty:
-        print(f"\nAdding {len(completion_data)} completion records with formatting...")
-        
-        # Sort and group completion data by invoice date
-        completion_data_sorted = completion_data.sort_values('Invoice Date').reset_index(drop=True)
-        completion_data_sorted['Date_Only'] = completion_data_sorted['Invoice Date'].dt.date
-        grouped_by_date = completion_data_sorted.groupby('Date_Only')
-        
-        date_groups = list(grouped_by_date)
+        logger.info("Adding %s completion records with formatting...", len(completion_data), extra=SECTION)
         
-        for i, (date_only, date_group) in enumerate(date_groups):
-            # Add date header
-            day_of_week = date_only.strftime('%A')
-            date_header = f"{day_of_week} {date_only.month}-{date_only.day}-{date_only.year} (Invoice Date)"
-            
-            date_cell = ws.cell(row=current_row, column=1, value=date_header)
-            date_cell.font = day_style
-            date_cell.border = day_border
-            date_cell.alignment = center_align
-            
-            # Merge cells for date header (columns A-J)
-            ws.merge_cells(f'A{current_row}:J{current_row}')
-            current_row += 1
-            
-            # Add column headers for this day
-            headers = ['ACGI Project/ Invoice #', 'Dept', 'Project Number/ Name', 'Type', 
-                      'Client / PO #', 'Line #', 'PO Date', 'Amount', 'Invoice Date', 'Amount Invoiced']
-            
-            for col, header in enumerate(headers, 1):
-                header_cell = ws.cell(row=current_row, column=col, value=header)
-                header_cell.font = header_style
-                header_cell.fill = header_fill
-                header_cell.alignment = center_align
-                header_cell.border = regular_border
-            
-            current_row += 1
-            
-            # Sort this day's transactions by Project Number
-            date_group_sorted = date_group.copy()
-            
-            def parse_project_number_for_sort(project_num):
-                if pd.isna(project_num) or project_num == '':
-                    return (0, 0)
-                try:
-                    project_str = str(project_num).strip()
-                    if '-' in project_str:
-                        year_part, num_part = project_str.split('-', 1)
-                        year = int(year_part)
-                        num = int(num_part.lstrip('0') or '0')
-                        return (year, num)
-                    else:
-                        return (0, int(project_str))
-                except:
-                    return (0, 0)
-            
-            date_group_sorted['Project_Sort_Key'] = date_group_sorted['ACGI #'].apply(parse_project_number_for_sort)
-            date_group_sorted = date_group_sorted.sort_values('Project_Sort_Key')
-            
-            # Add transaction rows
-            daily_total = 0
-            for _, row in date_group_sorted.iterrows():
-                # Column 1: ACGI #
-                ws.cell(row=current_row, column=1, value=str(row.get('ACGI #', ''))).border = regular_border
-                
-                # Column 2: Dept
-                ws.cell(row=current_row, column=2, value=str(row.get('Dept', ''))).border = regular_border
-                
-                # Column 3: Project Number/Name (with split info if applicable)
-                project_name = str(row.get('Project Number/Name', ''))
-                if 'Split Invoice Description' in row and pd.notna(row['Split Invoice Description']):
-                    project_name += f" [{row['Split Invoice Description']}]"
-                ws.cell(row=current_row, column=3, value=project_name).border = regular_border
-                
-                # Column 4: Type
-                ws.cell(row=current_row, column=4, value=str(row.get('Type', 'Completion'))).border = regular_border
-                
-                # Column 5: Client/PO #
-                ws.cell(row=current_row, column=5, value=str(row.get('Client / PO #', ''))).border = regular_border
-                
-                # Column 6: Line #
-                ws.cell(row=current_row, column=6, value=str(row.get('Line #', ''))).border = regular_border
-                
-                # Column 7: PO Date
-                po_date = row.get('PO Date', '')
-                if pd.notna(po_date) and po_date != '':
-                    try:
-                        if isinstance(po_date, str):
-                            po_date_parsed = pd.to_datetime(po_date)
-                        else:
-                            po_date_parsed = po_date
-                        po_date_str = po_date_parsed.strftime('%m/%d/%Y')
-                    except:
-                        po_date_str = str(po_date)
-                else:
-                    po_date_str = ''
-                ws.cell(row=current_row, column=7, value=po_date_str).border = regular_border
-                
-                # Column 8: Amount (with currency formatting)
-                amount = float(row['Amount Invoiced']) if pd.notna(row['Amount Invoiced']) else 0
-                amount_cell = ws.cell(row=current_row, column=8, value=amount)
-                amount_cell.number_format = '"$"#,##0.00'
-                amount_cell.border = regular_border
-                daily_total += amount
-                
-                # Column 9: Invoice Date
-                try:
-                    invoice_date = row['Invoice Date']
-                    invoice_date_str = invoice_date.strftime('%m/%d/%Y')
-                except:
-                    invoice_date_str = str(row['Invoice Date'])
-                ws.cell(row=current_row, column=9, value=invoice_date_str).border = regular_border
-                
-                # Column 10: Amount Invoiced (with currency formatting)
-                amount_invoiced_cell = ws.cell(row=current_row, column=10, value=amount)
-                amount_invoiced_cell.number_format = '"$"#,##0.00'
-                amount_invoiced_cell.border = regular_border
-                
-                current_row += 1
-            
-            # Add daily total row
-            total_label_cell = ws.cell(row=current_row, column=1, value=f"Daily Total for {date_only.strftime('%m/%d/%Y')} (Invoice Date)")
-            total_label_cell.font = total_style
-            total_label_cell.border = regular_border
-            
-            # Amount total
-            amount_total_cell = ws.cell(row=current_row, column=8, value=daily_total)
-            amount_total_cell.number_format = '"$"#,##0.00'
-            amount_total_cell.font = total_style
-            amount_total_cell.border = regular_border
-            
-            # Amount Invoiced total
-            amount_invoiced_total_cell = ws.cell(row=current_row, column=10, value=daily_total)
-            amount_invoiced_total_cell.number_format = '"$"#,##0.00'
-            amount_invoiced_total_cell.font = total_style
-            amount_invoiced_total_cell.border = regular_border
-            
-            # Empty cells for other columns
-            for col in [2, 3, 4, 5, 6, 7, 9]:
-                ws.cell(row=current_row, column=col).border = regular_border
-            
-            current_row += 1
+        for i, block in enumerate(blocks):
+            first_row = sheet.next_row
+            for row in day_block_rows(block):
+                sheet.write(*row)
+            index.days.append(day_index_entry(block, first_row, sheet.next_row - 1))
             
             # Add empty row between days (except for last day)
-            if i < len(date_groups) - 1:
-                current_row += 1
-    
-    # Auto-adjust column widths
-    for col in range(1, 14):  # Extended to include all 13 columns (YTD column is 13)
-        column_letter = get_column_letter(col)
-        max_length = 0
-        
-        for row in ws[column_letter]:
-            try:
-                if len(str(row.value)) > max_length:
-                    max_length = len(str(row.value))
-            except:
-                pass
-        
-        # Set minimum width and add padding, with extra width for YTD column
-        if col == 13:  # YTD column needs extra width for large numbers
-            adjusted_width = max(max_length + 2, 18)  # Minimum 18 for YTD
-        else:
-            adjusted_width = max(max_length + 2, 12)
-        ws.column_dimensions[column_letter].width = adjusted_width
+            if i < len(blocks) - 1:
+                sheet.skip()
     
     # Save the workbook
     try:
-        print("Saving formatted file...")
-        wb.save(quarterly_file)
-        print(f"✓ Successfully updated {quarterly_file} with formatting")
+        logger.info("Saving formatted file...")
+        sheet.save(quarterly_file)
+        index.save()
+        logger.info("✓ Successfully updated %s with formatting", quarterly_file)
         return True
         
     except Exception as e:
-        print(f"Error saving file: {e}")
+        logger.error("Could not save file: %s", e)
+        index.discard()
         
         # Try saving with a different name
         try:
             alt_file = quarterly_file.replace('.xlsx', '_formatted.xlsx')
-            wb.save(alt_file)
-            print(f"✓ Saved as {alt_file}")
+            sheet.save(alt_file)
+            logger.info("✓ Saved as %s", alt_file)
             return True
         except Exception as final_error:
-            print(f"Final attempt failed: {final_error}")
+            logger.error("Final attempt failed: %s", final_error)
             return False
 
-def print_summary(completion_data):
+def update_quarterly_ytd_incrementally(quarterly_file, index, monthly_totals, blocks):
+    """
+    Bring an existing quarterly YTD file up to date using its day index.
+    Changed monthly totals are rewritten in place, a changed day block with the
+    same number of rows is rewritten in place, and from the first day whose
+    rows were added, removed or resized onward the blocks are re-rendered.
+    """
+    logger.info("Updating %s incrementally...", quarterly_file)
+    try:
+        wb = load_workbook(quarterly_file)
+        register_report_styles(wb)
+        ws = wb.active
+        merged_ranges = MergedRangeIndex(ws)
+        
+        # Row 2: rewritten only if a monthly total changed
+        if index.monthly_totals != list(monthly_totals):
+            write_template_row(ws, 2, QUARTERLY_YTD_TEMPLATE, *ytd_header_rows(monthly_totals)[1])
+        
+        new_entries = [day_index_entry(block) for block in blocks]
+        old_days = index.days
+        
+        # Unchanged and same-size changed blocks keep their rows
+        days = []
+        rewritten = 0
+        first_changed = min(len(old_days), len(blocks))
+        for i in range(min(len(old_days), len(blocks))):
+            old, new = old_days[i], new_entries[i]
+            if old['date'] != new['date'] or old['last_row'] - old['first_row'] != len(blocks[i]['rows']) + 2:
+                first_changed = i
+                break
+            if old['fingerprint'] != new['fingerprint']:
+                for bounds in merged_ranges.overlapping(old['first_row'], old['first_row']):
+                    merged_ranges.unmerge(bounds)
+                write_day_block(ws, old['first_row'], blocks[i], merged_ranges)
+                rewritten += 1
+            days.append(day_index_entry(blocks[i], old['first_row'], old['last_row']))
+        
+        # Everything from the first added, removed or resized day is re-rendered
+        if first_changed < len(old_days):
+            start_row = old_days[first_changed]['first_row']
+        elif old_days:
+            start_row = old_days[-1]['last_row'] + 2
+        else:
+            start_row = YTD_FIRST_BLOCK_ROW
+        for bounds in merged_ranges.below(start_row - 1):
+            merged_ranges.unmerge(bounds)
+        if ws.max_row >= start_row:
+            ws.delete_rows(start_row, ws.max_row - start_row + 1)
+        
+        current_row = start_row
+        for i in range(first_changed, len(blocks)):
+            last_row = write_day_block(ws, current_row, blocks[i], merged_ranges)
+            days.append(day_index_entry(blocks[i], current_row, last_row))
+            current_row = last_row + 2
+            rewritten += 1
+        
+        # Column widths from the header rows and the recorded widths of every block
+        widths = ColumnWidths(13)
+        for _, values, _ in ytd_header_rows(monthly_totals):
+            widths.update(values)
+        for day in days:
+            widths.merge(day['widths'])
+        widths.apply(ws, QUARTERLY_YTD_TEMPLATE.min_widths)
+        
+        logger.info("Rewrote %s of %s day blocks", rewritten, len(blocks))
+        logger.info("Saving formatted file...")
+        wb.save(quarterly_file)
+        YtdDayIndex(quarterly_file, days, monthly_totals).save()
+        logger.info("✓ Successfully updated %s with formatting", quarterly_file)
+        return True
+    except Exception as e:
+        logger.error("Could not update %s incrementally: %s", quarterly_file, e)
+        index.discard()
+        return False
+
+def print_summary(completion_data, cube=None):
     """
     Print a summary of the completion data.
+    cube is the InvoiceCube of completion_data (built here if not given).
     """
     if completion_data.empty:
-        print("\nNo completion data to summarize.")
+        logger.info("No completion data to summarize.", extra=SECTION)
         return
     
-    print("\n" + "="*60)
-    print("COMPLETION DATA SUMMARY")
-    print("="*60)
+    logger.info("=" * 60, extra=SECTION)
+    logger.info("COMPLETION DATA SUMMARY")
+    logger.info("=" * 60)
     
-    # Summary by month
-    monthly_summary = completion_data.groupby(completion_data['Invoice Date'].dt.strftime('%B %Y')).agg({
-        'Amount Invoiced': ['count', 'sum']
-    }).round(2)
+    cube = cube or InvoiceCube.build(completion_data)
     
-    print("\nBy Month:")
-    for month in monthly_summary.index:
-        count = monthly_summary.loc[month, ('Amount Invoiced', 'count')]
-        total = monthly_summary.loc[month, ('Amount Invoiced', 'sum')]
-        print(f"  {month}: {count} records, ${total:,.2f}")
+    # Summary by month
+    logger.info("By Month:", extra=SECTION)
+    for month, count, total in cube.by_month('Amount Invoiced'):
+        logger.info("  %s: %s records, $%s", month.strftime('%B %Y'), count, format(total, ",.2f"))
     
     # Summary by source year
-    print("\nBy Source Year:")
-    source_summary = completion_data.groupby('Source_Year').agg({
-        'Amount Invoiced': ['count', 'sum']
-    }).round(2)
-    
-    for year in source_summary.index:
-        count = source_summary.loc[year, ('Amount Invoiced', 'count')]
-        total = source_summary.loc[year, ('Amount Invoiced', 'sum')]
-        print(f"  {year}: {count} records, ${total:,.2f}")
+    logger.info("By Source Year:", extra=SECTION)
+    for year, count, total in cube.by('Source_Year', 'Amount Invoiced'):
+        logger.info("  %s: %s records, $%s", year, count, format(total, ",.2f"))
     
     # Overall total
     total_amount = completion_data['Amount Invoiced'].sum()
     total_count = len(completion_data)
-    print(f"\nOverall Total: {total_count} records, ${total_amount:,.2f}")
+    logger.info("Overall Total: %s records, $%s", total_count, format(total_amount, ",.2f"), extra=SECTION)
     
     # Split invoice summary
     if 'Split Invoice Description' in completion_data.columns:
         split_records = completion_data[completion_data['Split Invoice Description'].notna()]
         if not split_records.empty:
-            print(f"\nSplit Invoice Summary:")
-            print(f"  Total split invoice records: {len(split_records)}")
+            logger.info("Split Invoice Summary:", extra=SECTION)
+            logger.info("  Total split invoice records: %s", len(split_records))
             
             # Group by original project to show split details
             if 'Original Amount' in completion_data.columns:
                 # Count unique projects that were split
                 unique_split_projects = split_records['ACGI #'].nunique()
-                print(f"  Projects with split invoicing: {unique_split_projects}")
+                logger.info("  Projects with split invoicing: %s", unique_split_projects)
                 
                 # Show some examples
-                print(f"  Example split invoices:")
+                logger.info("  Example split invoices:")
                 for acgi_num in split_records['ACGI #'].unique()[:3]:  # Show first 3 examples
                     project_splits = split_records[split_records['ACGI #'] == acgi_num]
                     if not project_splits.empty:
                         original_amount = project_splits.iloc[0].get('Original Amount', 0)
-                        print(f"    {acgi_num}: ${original_amount:,.2f} split into {len(project_splits)} invoices")
+                        logger.info("    %s: $%s split into %s invoices", acgi_num, format(original_amount, ",.2f"), len(project_splits))
                         for _, split_row in project_splits.iterrows():
                             desc = split_row.get('Split Invoice Description', 'N/A')
                             amount = split_row.get('Amount Invoiced', 0)
-                            print(f"      - {desc}: ${amount:,.2f}")
+                            logger.info("      - %s: $%s", desc, format(amount, ",.2f"))
 
 def main():
     """
     Main function to update the quarterly YTD file.
     """
+    parser = argparse.ArgumentParser(description='Update the quarterly YTD file from the Project Lists')
+    parser.add_argument('--engine', choices=READER_ENGINES, default='openpyxl',
+                        help='Workbook reader engine (default: openpyxl)')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Parse up to N Project Lists in parallel processes (default: 1)')
+    parser.add_argument('--no-mirror', action='store_true', help='Read N: drive files directly instead of the local mirror')
+    parser.add_argument('--rebuild', action='store_true',
+                        help='Rebuild the whole YTD file instead of rewriting only the days that changed')
+    parser.add_argument('--verbose', '-v', action='store_true', help='Also show debug output')
+    args = parser.parse_args()
+    configure_logging(verbose=args.verbose)
+    set_reader_engine(args.engine)
+    if args.no_mirror:
+        configure_network_mirror(enabled=False)
+    
     # Get quarter information from user
     quarter_info = get_quarter_info()
     
     quarterly_file = quarter_info['quarterly_file']
     
-    print("\n" + "="*60)
-    print("QUARTERLY YTD UPDATER")
-    print("="*60)
-    print(f"Target file: {quarterly_file}")
+    logger.info("=" * 60, extra=SECTION)
+    logger.info("QUARTERLY YTD UPDATER")
+    logger.info("=" * 60)
+    logger.info("Target file: %s", quarterly_file)
     
     # Check if quarterly file exists
     if not os.path.exists(quarterly_file):
-        print(f"Warning: {quarterly_file} not found!")
-        print("A new file will be created.")
+        logger.warning("%s not found!", quarterly_file)
+        logger.info("A new file will be created.")
     
     # Collect completion data from all project lists
-    completion_data = collect_completion_data(quarter_info)
+    completion_data = collect_completion_data(quarter_info, workers=args.workers)
     
     if completion_data.empty:
-        print("No new completion data found. Nothing to update.")
+        logger.info("No new completion data found. Nothing to update.")
         return
     
-    # Print summary
-    print_summary(completion_data)
+    # Print summary (the cube is shared with the monthly totals update)
+    cube = InvoiceCube.build(completion_data)
+    print_summary(completion_data, cube)
     
     # Ask for confirmation
     response = input(f"\nDo you want to update {quarterly_file} with this data? (y/n): ").lower().strip()
     
     if response == 'y':
-        success = update_quarterly_ytd(completion_data, quarter_info)
+        success = update_quarterly_ytd(completion_data, quarter_info, cube, incremental=not args.rebuild)
         if success:
-            print(f"\n✓ {quarter_info['quarter_name']} {quarter_info['year']} YTD file updated successfully!")
+            logger.info("✓ %s %s YTD file updated successfully!", quarter_info['quarter_name'], quarter_info['year'], extra=SECTION)
         else:
-            print(f"\n✗ Failed to update {quarter_info['quarter_name']} {quarter_info['year']} YTD file.")
+            logger.error("Failed to update %s %s YTD file.", quarter_info['quarter_name'], quarter_info['year'], extra=SECTION)
     else:
-        print("Update cancelled.")
+        logger.info("Update cancelled.")
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     main() 
\ No newline at end of file
@@ -0,0 +1,39 @@
+"""
+Report Templates
+Layouts of the daily summary sheet and the quarterly YTD sheet: which
+palette styles each kind of row uses, which rows are merged and the
+column layout. The report code streams values into these row kinds.
+"""
+
+from report_writer import ReportTemplate
+
+# Invoice table rows (columns A-J): currency in Amount and Amount Invoiced
+INVOICE_ROW_STYLES = ['bordered'] * 7 + ['currency', 'bordered', 'currency']
+
+# Daily summary: summary block, then the day's invoices, receivables by year and per-year details
+DAILY_SUMMARY_TEMPLATE = ReportTemplate(columns=10, rows={
+    'summary title': ('summary title', 10),
+    'summary': (['summary label', 'summary value'] + ['bordered'] * 8, None),
+    # Invoice tables (also written into the quarterly YTD sheet for each day)
+    'table title': ('title', 10),
+    'header': ('header', None),
+    'invoice': (INVOICE_ROW_STYLES, None),
+    'invoice total': (['total'] + ['bordered'] * 8 + ['total currency'], None),
+    # Receivables vs. vendors to be paid by year
+    'receivables title': ('title', 3),
+    'receivables': (['bordered', 'currency', 'currency'], None),
+    'receivables total': (['total', 'total currency', 'total currency'], None),
+    # Project List footer rows of each year (amounts in B, D, E and G)
+    'details title': ('title', 7),
+    'details': (['bordered', 'currency', 'bordered', 'currency', 'currency', 'bordered', 'currency'], None),
+})
+
+# Quarterly YTD: month headers and monthly totals (columns A-M), then one block per invoice day (A-J)
+QUARTERLY_YTD_TEMPLATE = ReportTemplate(columns=13, min_widths={13: 18}, rows={  # YTD column needs extra width
+    'month headers': ('title', None),
+    'monthly totals': ('month total', None),
+    'day header': ('day header', 10),
+    'header': ('header', None),
+    'invoice': (INVOICE_ROW_STYLES, None),
+    'day total': (['total'] + ['bordered'] * 6 + ['total currency', 'bordered', 'total currency'], None),
+})
@@ -0,0 +1,271 @@
+"""
+Report Writer
+Named cell styles shared by the daily summary and quarterly YTD workbooks,
+report templates (the styled row kinds of a sheet layout) and a report
+sheet whose rows are streamed into an openpyxl write-only workbook when it
+is saved. Each template row kind is resolved to cell styles once per
+workbook, so writing a row only streams its values. Loaded worksheets that
+are rewritten in place keep their merged ranges in a row-ordered index.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+
+from openpyxl import Workbook
+from openpyxl.cell import Cell
+from openpyxl.styles import Alignment, Border, Font, NamedStyle, PatternFill, Side
+from openpyxl.styles.fonts import DEFAULT_FONT
+from openpyxl.utils import get_column_letter
+
+CURRENCY_FORMAT = '"$"#,##0.00'
+
+_THIN = Side(border_style="thin", color="000000")
+_THICK = Side(border_style="thick", color="000000")
+_BORDERED = Border(left=_THIN, right=_THIN, top=_THIN, bottom=_THIN)
+_CENTER = Alignment(horizontal='center', vertical='center')
+_TOTAL_FONT = Font(bold=True, color="FF0000")
+
+# Style palette: registry key -> NamedStyle attributes (every style has a thin black border)
+REPORT_STYLES = {
+    'bordered': {},
+    'currency': {'number_format': CURRENCY_FORMAT},
+    'centered': {'alignment': _CENTER},
+    # Table titles and YTD month headers (bold white on green)
+    'title': {'font': Font(bold=True, color="FFFFFF"),
+              'fill': PatternFill(start_color="00AA00", end_color="00AA00", fill_type="solid"),
+              'alignment': _CENTER},
+    # Column headers (bold, gray background)
+    'header': {'font': Font(bold=True),
+               'fill': PatternFill(start_color="D3D3D3", end_color="D3D3D3", fill_type="solid"),
+               'alignment': _CENTER},
+    # Totals (bold red)
+    'total': {'font': _TOTAL_FONT},
+    'total currency': {'font': _TOTAL_FONT, 'number_format': CURRENCY_FORMAT},
+    'month total': {'font': _TOTAL_FONT, 'number_format': CURRENCY_FORMAT, 'alignment': _CENTER},
+    # Daily summary heading and figures
+    'summary title': {'font': Font(bold=True, size=16, color="FFFFFF"),
+                      'fill': PatternFill(start_color="003366", end_color="003366", fill_type="solid"),
+                      'alignment': _CENTER},
+    'summary label': {'font': Font(bold=True)},
+    'summary value': {'font': Font(bold=True, color="0000AA")},
+    # YTD day headers (bold, thick border)
+    'day header': {'font': Font(bold=True), 'border': Border(left=_THICK, right=_THICK, top=_THICK, bottom=_THICK),
+                   'alignment': _CENTER},
+}
+
+STYLE_NAME_PREFIX = 'Report '
+
+
+def style_name(key):
+    """Workbook name of a palette style ('total' -> 'Report total')"""
+    if key not in REPORT_STYLES:
+        raise KeyError(f"Unknown report style: {key}")
+    return STYLE_NAME_PREFIX + key
+
+
+def register_report_styles(wb):
+    """Add the palette's named styles a workbook does not have yet; returns {key: NamedStyle} of those added"""
+    existing = set(wb.named_styles)
+    added = {}
+    for key, attributes in REPORT_STYLES.items():
+        if style_name(key) not in existing:
+            added[key] = NamedStyle(name=style_name(key), font=attributes.get('font', DEFAULT_FONT),
+                                    fill=attributes.get('fill'), border=attributes.get('border', _BORDERED),
+                                    alignment=attributes.get('alignment'),
+                                    number_format=attributes.get('number_format', 'General'))
+            wb.add_named_style(added[key])
+    return added
+
+
+def row_styles(values, styles, merge=None):
+    """Style key of each column of a row: styles is one key for the row (and its merged cells) or a list"""
+    width = max(len(values), merge or 0)
+    if styles is None or isinstance(styles, str):
+        return [styles] * width
+    if len(styles) >= width:
+        return styles
+    return list(styles) + [None] * (width - len(styles))
+
+
+def write_row(ws, row, values, styles=None, merge=None, merged_ranges=None):
+    """
+    Write one row into a loaded (random-access) worksheet with palette styles.
+    merge is the last column the row's first cell is merged across; the merge
+    is recorded in merged_ranges (the sheet's MergedRangeIndex) if given.
+    """
+    for col, (value, key) in enumerate(zip(values, row_styles(values, styles)), 1):
+        cell = ws.cell(row=row, column=col)
+        cell.value = value
+        if key is not None:
+            cell.style = style_name(key)
+    if merge:
+        if merged_ranges is not None:
+            merged_ranges.merge(row, 1, row, merge)
+        else:
+            ws.merge_cells(start_row=row, start_column=1, end_row=row, end_column=merge)
+
+
+def write_template_row(ws, row, template, kind, values, styles=None, merged_ranges=None):
+    """Write a row of one of a template's row kinds into a loaded worksheet (styles overrides the kind's)"""
+    kind_styles, merge = template.row(kind)
+    write_row(ws, row, values, styles or kind_styles, merge, merged_ranges)
+
+
+class MergedRangeIndex:
+    """
+    Merged ranges of a loaded worksheet as (min_row, max_row, min_col, max_col)
+    bounds sorted by row, so the ranges overlapping a few rows are found without
+    walking every merged range of the sheet. Merges and unmerges made through
+    the index update it in place.
+    """
+
+    def __init__(self, ws):
+        self.ws = ws
+        self.bounds = sorted((rng.min_row, rng.max_row, rng.min_col, rng.max_col) for rng in ws.merged_cells.ranges)
+        # Tallest range: a range overlapping row r starts no earlier than r - max_height
+        self.max_height = max((max_row - min_row for min_row, max_row, _, _ in self.bounds), default=0)
+
+    @staticmethod
+    def coord(bounds):
+        """'A24:J24'-style coordinate of a range's bounds"""
+        min_row, max_row, min_col, max_col = bounds
+        return f"{get_column_letter(min_col)}{min_row}:{get_column_letter(max_col)}{max_row}"
+
+    def overlapping(self, min_row, max_row):
+        """Bounds of the ranges that overlap rows min_row..max_row"""
+        start = bisect_left(self.bounds, (min_row - self.max_height,))
+        end = bisect_right(self.bounds, (max_row, float('inf')))
+        return [bounds for bounds in self.bounds[start:end] if bounds[1] >= min_row]
+
+    def below(self, row):
+        """Bounds of the ranges that start after row"""
+        return self.bounds[bisect_right(self.bounds, (row, float('inf'))):]
+
+    def merge(self, min_row, min_col, max_row, max_col):
+        """Merge a range of the sheet and record it"""
+        self.ws.merge_cells(start_row=min_row, start_column=min_col, end_row=max_row, end_column=max_col)
+        insort(self.bounds, (min_row, max_row, min_col, max_col))
+        self.max_height = max(self.max_height, max_row - min_row)
+
+    def unmerge(self, bounds):
+        """Unmerge a recorded range of the sheet and drop it"""
+        min_row, max_row, min_col, max_col = bounds
+        self.ws.unmerge_cells(start_row=min_row, start_column=min_col, end_row=max_row, end_column=max_col)
+        del self.bounds[bisect_left(self.bounds, bounds)]
+
+
+class ReportTemplate:
+    """
+    Layout of a report sheet: its column count, minimum column widths and
+    the style keys and merge of each kind of row (e.g. 'header', 'invoice').
+
+    rows maps a row kind to (styles, merge): styles is one palette key for
+    the whole row or a list with one key per column; merge is the last column
+    the row's first cell is merged across, or None.
+    """
+
+    def __init__(self, columns, rows, min_widths=None):
+        self.columns = columns
+        self.rows = rows
+        self.min_widths = min_widths or {}
+
+    def row(self, kind):
+        """(styles, merge) of a row kind"""
+        return self.rows[kind]
+
+
+class ColumnWidths:
+    """
+    Longest rendered value (len(str(value))) of each column, updated as rows
+    are written so the auto-fit widths are known without reading the sheet back.
+    """
+
+    def __init__(self, columns):
+        self.lengths = [0] * columns
+
+    def update(self, values):
+        """Account for one row of values (None cells are ignored)"""
+        lengths = self.lengths
+        for col, value in enumerate(values[:len(lengths)]):
+            if value is not None:
+                length = len(str(value))
+                if length > lengths[col]:
+                    lengths[col] = length
+
+    def merge(self, lengths):
+        """Account for lengths recorded elsewhere (e.g. an unchanged block's widths)"""
+        for col, length in enumerate(lengths[:len(self.lengths)]):
+            if length > self.lengths[col]:
+                self.lengths[col] = length
+
+    def widths(self, min_widths=None):
+        """{column: width}: longest value + 2 padding, at least 12 or the column's minimum"""
+        min_widths = min_widths or {}
+        return {col: max(length + 2, min_widths.get(col, 12)) for col, length in enumerate(self.lengths, 1)}
+
+    def apply(self, ws, min_widths=None):
+        """Set a worksheet's column widths (before the first row of a write-only sheet)"""
+        for col, width in self.widths(min_widths).items():
+            ws.column_dimensions[get_column_letter(col)].width = width
+
+
+class ReportSheet:
+    """
+    One worksheet of a report, written row by row and saved through openpyxl's
+    write-only mode.
+
+    Column widths must be known before a write-only sheet's first row is
+    streamed, so rows are kept as (values, style keys) until save(); the
+    widths are tracked as rows are appended.
+    """
+
+    def __init__(self, title, template):
+        self.title = title
+        self.template = template
+        self.widths = ColumnWidths(template.columns)
+        self.rows = []
+        self.merges = []
+
+    @property
+    def next_row(self):
+        """Sheet row number the next appended row will get"""
+        return len(self.rows) + 1
+
+    def append(self, values=(), styles=None, merge=None):
+        """Append a row of values; styles and merge as for write_row(). Returns its row number."""
+        row = self.next_row
+        values = list(values)
+        self.rows.append((values, row_styles(values, styles, merge)))
+        self.widths.update(values)
+        if merge:
+            self.merges.append(f"A{row}:{get_column_letter(merge)}{row}")
+        return row
+
+    def write(self, kind, values, styles=None):
+        """Append a row of one of the template's row kinds (styles overrides the kind's). Returns its row number."""
+        kind_styles, merge = self.template.row(kind)
+        return self.append(values, styles or kind_styles, merge)
+
+    def skip(self, count=1):
+        """Append blank rows"""
+        for _ in range(count):
+            self.rows.append(([], []))
+
+    def save(self, path):
+        """Stream the rows into a write-only workbook and save it to path"""
+        wb = Workbook(write_only=True)
+        style_arrays = {key: style.as_tuple() for key, style in register_report_styles(wb).items()}
+        ws = wb.create_sheet(self.title)
+        self.widths.apply(ws, self.template.min_widths)
+        for merge in self.merges:
+            ws.merged_cells.add(merge)
+
+        for values, styles in self.rows:
+            cells = []
+            for col, key in enumerate(styles):
+                value = values[col] if col < len(values) else None
+                if key is None:
+                    cells.append(value)
+                else:
+                    cells.append(Cell(ws, row=1, column=1, value=value, style_array=style_arrays[key]))
+            ws.append(cells)
+        wb.save(path)
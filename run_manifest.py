@@ -0,0 +1,105 @@
+"""
+Run Manifest
+Records, next to the daily summary outputs, the inputs each report was
+generated from (Project List and YTD sheet fingerprints, selected years,
+code version) and its results. A run whose inputs match a recorded run
+reuses the finished report instead of generating it again.
+"""
+
+import hashlib
+import json
+import os
+import sys
+import time
+
+MANIFEST_FILENAME = 'run_manifest.json'
+
+_code_version = None
+
+
+def code_version():
+    """Fingerprint of the running code: the executable when frozen, otherwise the .py sources"""
+    global _code_version
+    if _code_version is None:
+        if getattr(sys, 'frozen', False):
+            stat = os.stat(sys.executable)
+            _code_version = f"exe:{stat.st_size}:{stat.st_mtime}"
+        else:
+            digest = hashlib.sha1()
+            source_dir = os.path.dirname(os.path.abspath(__file__))
+            for name in sorted(os.listdir(source_dir)):
+                if name.endswith('.py'):
+                    with open(os.path.join(source_dir, name), 'rb') as f:
+                        digest.update(name.encode('utf-8'))
+                        digest.update(f.read())
+            _code_version = digest.hexdigest()
+    return _code_version
+
+
+def file_fingerprint(path):
+    """[absolute path, size, mtime] of a file, or None if it does not exist"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [os.path.abspath(path), stat.st_size, stat.st_mtime]
+
+
+class RunManifest:
+    """
+    JSON manifest of finished daily summaries in one output directory, keyed by target date.
+
+    Each entry holds the run's inputs, its results and fingerprints of the files it
+    wrote. lookup() returns the results only if the inputs are identical and the
+    written files have not changed since.
+    """
+
+    def __init__(self, output_dir):
+        self.output_dir = output_dir
+        self.path = os.path.join(output_dir, MANIFEST_FILENAME)
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self, manifest):
+        os.makedirs(self.output_dir, exist_ok=True)
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=1)
+        os.replace(tmp_path, self.path)
+
+    @staticmethod
+    def inputs(target_date, selected_years, invoice_sources, ytd_paths):
+        """Fingerprint of everything a daily summary is generated from"""
+        return {
+            'target_date': target_date.isoformat(),
+            'years': list(selected_years),
+            'project_lists': {year: file_fingerprint(path) for year, path in invoice_sources},
+            'ytd_sheets': [file_fingerprint(path) for path in ytd_paths],
+            'code_version': code_version(),
+        }
+
+    def lookup(self, target_date, inputs):
+        """Results of a recorded run with identical inputs whose outputs are unchanged, or None"""
+        entry = self._load().get(target_date.isoformat())
+        if entry is None or entry['inputs'] != inputs:
+            return None
+        for path, fingerprint in entry['outputs'].items():
+            if file_fingerprint(path) != fingerprint:
+                return None
+        return entry['results']
+
+    def record(self, target_date, inputs, results, output_paths):
+        """Record a finished run; output_paths are the files it wrote (fingerprinted now)"""
+        manifest = self._load()
+        manifest[target_date.isoformat()] = {
+            'inputs': inputs,
+            'results': results,
+            'outputs': {os.path.abspath(path): file_fingerprint(path) for path in output_paths},
+            'generated_at': time.time(),
+        }
+        self._save(manifest)
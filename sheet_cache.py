@@ -0,0 +1,194 @@
+"""
+Sheet Cache
+Persistent on-disk cache of parsed Project List sheets, so workbooks that
+have not changed since the last run are never re-parsed from xlsx.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import time
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Default cache location (relative to the working directory, like 'reports')
+DEFAULT_CACHE_DIR = 'sheet cache'
+
+# Least-recently-used entries are evicted once the cache grows past this size
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+# Bump when the layout of cached payloads changes
+CACHE_FORMAT_VERSION = 6
+
+INDEX_FILENAME = 'index.json'
+
+
+def content_hash(data):
+    """SHA-1 hex digest of a file's raw bytes"""
+    return hashlib.sha1(data).hexdigest()
+
+
+def _entry_key(file_path, year, columns=None):
+    """Stable cache key for one sheet of one workbook, parsed with the given column set (None for all)"""
+    column_set = ','.join(sorted(columns)) if columns is not None else '*'
+    raw = f"{os.path.abspath(file_path).lower()}|{year}|{column_set}|{CACHE_FORMAT_VERSION}|{pd.__version__}"
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+
+class SheetCache:
+    """
+    Directory of pickled sheet payloads plus a JSON index.
+
+    Each entry is keyed by workbook path, sheet name and the set of columns
+    the payload was parsed with (so tools declaring different columns keep
+    separate entries instead of overwriting each other's), and records the
+    workbook's size, mtime and content hash. An entry is a hit when size
+    and mtime match; if only the mtime moved (file copied or re-saved
+    without changes) the content hash decides.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.index_path = os.path.join(cache_dir, INDEX_FILENAME)
+
+    def _load_index(self):
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_index(self, index):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = self.index_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(index, f, indent=1)
+        os.replace(tmp_path, self.index_path)
+
+    def _payload_path(self, key):
+        return os.path.join(self.cache_dir, f'{key}.pkl')
+
+    def lookup(self, file_path, year, size, mtime, columns=None):
+        """
+        Check for an entry matching the workbook's size and mtime.
+        Returns 'hit', 'check-hash' (same size, different mtime) or None.
+        """
+        entry = self._load_index().get(_entry_key(file_path, year, columns))
+        if entry is None or entry['size'] != size:
+            return None
+        if entry['mtime'] == mtime:
+            return 'hit'
+        return 'check-hash'
+
+    def load(self, file_path, year, size, mtime, data_hash=None, columns=None):
+        """
+        Load a cached payload. When data_hash is given it must match the
+        stored content hash. Returns None on a miss.
+        """
+        key = _entry_key(file_path, year, columns)
+        index = self._load_index()
+        entry = index.get(key)
+        if entry is None or entry['size'] != size:
+            return None
+        if entry['mtime'] != mtime and (data_hash is None or entry['hash'] != data_hash):
+            return None
+
+        try:
+            with open(self._payload_path(key), 'rb') as f:
+                payload = pickle.load(f)
+        except Exception as e:
+            logger.warning("Discarding unreadable cache entry for %s: %s", file_path, e)
+            self._remove(index, key)
+            self._save_index(index)
+            return None
+
+        entry['mtime'] = mtime
+        entry['last_used'] = time.time()
+        self._save_index(index)
+        return payload
+
+    def store(self, file_path, year, size, mtime, data_hash, payload, columns=None):
+        """Write a payload for the workbook and evict old entries if over the size cap"""
+        key = _entry_key(file_path, year, columns)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        payload_path = self._payload_path(key)
+        tmp_path = payload_path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, payload_path)
+
+        index = self._load_index()
+        index[key] = {
+            'path': os.path.abspath(file_path),
+            'year': str(year),
+            'size': size,
+            'mtime': mtime,
+            'hash': data_hash,
+            'bytes': os.path.getsize(payload_path),
+            'last_used': time.time(),
+        }
+        self._evict(index)
+        self._save_index(index)
+
+    def _remove(self, index, key):
+        index.pop(key, None)
+        try:
+            os.remove(self._payload_path(key))
+        except OSError:
+            pass
+
+    def _evict(self, index):
+        """Drop least-recently-used entries until the cache fits under max_bytes"""
+        total = sum(entry['bytes'] for entry in index.values())
+        for key, entry in sorted(index.items(), key=lambda item: item[1]['last_used']):
+            if total <= self.max_bytes:
+                break
+            logger.info("Evicting cached sheet %s of %s", entry['year'], entry['path'])
+            total -= entry['bytes']
+            self._remove(index, key)
+
+    def entries(self):
+        """List index entries, most recently used first"""
+        return sorted(self._load_index().values(), key=lambda entry: entry['last_used'], reverse=True)
+
+    def purge(self):
+        """Remove every cached entry. Returns the number of entries removed."""
+        index = self._load_index()
+        count = len(index)
+        for key in list(index):
+            self._remove(index, key)
+        if os.path.isdir(self.cache_dir):
+            self._save_index(index)
+        return count
+
+
+# Process-wide cache used by the Project List loaders (None when disabled)
+_sheet_cache = SheetCache()
+
+
+def get_sheet_cache():
+    """Get the process-wide sheet cache, or None if caching is disabled"""
+    return _sheet_cache
+
+
+def configure_sheet_cache(enabled=True, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+    """Enable, disable or relocate the process-wide sheet cache"""
+    global _sheet_cache
+    _sheet_cache = SheetCache(cache_dir, max_bytes) if enabled else None
+    return _sheet_cache
+
+
+def print_cache_info(cache=None):
+    """Print the contents of the sheet cache"""
+    cache = cache or SheetCache()
+    entries = cache.entries()
+    total = sum(entry['bytes'] for entry in entries)
+    print(f"Sheet cache: {os.path.abspath(cache.cache_dir)}")
+    print(f"  {len(entries)} entries, {total / (1024 * 1024):,.1f} MB of {cache.max_bytes / (1024 * 1024):,.0f} MB")
+    for entry in entries:
+        last_used = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(entry['last_used']))
+        print(f"  {entry['year']}: {entry['path']} ({entry['bytes'] / 1024:,.0f} KB, last used {last_used})")
@@ -0,0 +1,70 @@
+"""
+InvoiceCube period totals, counts and breakdowns against pandas groupby
+over the same rows.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from invoice_cube import InvoiceCube
+
+
+@pytest.fixture
+def invoices():
+    rng = np.random.default_rng(7)
+    n = 2000
+    dates = pd.Series(pd.Timestamp('2025-07-01') + pd.to_timedelta(rng.integers(0, 120, n), unit='D'))
+    dates[rng.random(n) < 0.05] = pd.NaT
+    dates.iloc[0] = pd.Timestamp('2031-01-15')  # A stray far-off date
+    amounts = rng.uniform(10, 5000, n).round(2)
+    amounts[rng.random(n) < 0.1] = np.nan
+    return pd.DataFrame({
+        'Invoice Date': dates,
+        'Source_Year': rng.choice(['2024', '2025'], n),
+        'Dept': rng.choice(['ENG', 'FAB', 'QA', None], n),
+        'Type': rng.choice(['Completion', 'Partial'], n),
+        'Amount': amounts,
+        'Amount Invoiced': rng.uniform(0.01, 0.1, n).round(2),
+    })
+
+
+def test_only_days_with_rows_are_stored(invoices):
+    cube = InvoiceCube.build(invoices)
+    assert len(cube.dates) == invoices['Invoice Date'].dt.normalize().nunique()
+
+
+@pytest.mark.parametrize('start, end', [(None, None), ('2025-07-01', '2025-07-01'), ('2025-07-14', '2025-08-03'),
+                                        ('2025-09-01', None), (None, '2025-06-30'), ('2025-12-01', '2030-12-31')])
+def test_totals_match_pandas(invoices, start, end):
+    cube = InvoiceCube.build(invoices)
+    dates = invoices['Invoice Date']
+    rows = invoices[dates.notna()]
+    if start is not None:
+        rows = rows[rows['Invoice Date'] >= start]
+    if end is not None:
+        rows = rows[rows['Invoice Date'] <= end]
+
+    for measure in ('Amount', 'Amount Invoiced'):
+        assert cube.total(measure, start, end) == round(rows[measure].sum(), 2)
+        assert cube.count(measure, start, end) == rows[measure].count()
+        eng = rows[rows['Dept'] == 'ENG']
+        assert cube.total(measure, start, end, Dept='ENG') == round(eng[measure].sum(), 2)
+        assert cube.count(measure, start, end, Dept='ENG', Type='Partial') == \
+            eng.loc[eng['Type'] == 'Partial', measure].count()
+    assert cube.total('Amount', start, end, Dept='nope') == 0.0
+
+
+def test_breakdowns_match_pandas(invoices):
+    cube = InvoiceCube.build(invoices)
+    rows = invoices[invoices['Invoice Date'].notna()]
+
+    grouped = rows.groupby(rows['Dept'].fillna(''))['Amount']
+    expected = [(dept, int(count), round(total, 2))
+                for dept, count, total in zip(grouped.count().index, grouped.count(), grouped.sum()) if count]
+    assert cube.by('Dept', 'Amount') == expected
+
+    months = rows.groupby(rows['Invoice Date'].dt.to_period('M'))['Amount Invoiced']
+    expected = [(month, int(count), round(total, 2))
+                for month, count, total in zip(months.count().index, months.count(), months.sum())]
+    assert cube.by_month('Amount Invoiced') == expected
@@ -0,0 +1,104 @@
+"""
+Project List snapshots: the direct xlsx reader against openpyxl, and the
+sheet cache hit / check-hash / miss paths.
+"""
+
+import os
+
+import pandas as pd
+import pytest
+from openpyxl import load_workbook
+
+from project_list_snapshot import (ProjectListSnapshot, clear_project_list_snapshots,
+                                   get_project_list_snapshot, require_invoice_columns)
+from sheet_cache import SheetCache
+
+
+def assert_same_snapshot(left, right):
+    pd.testing.assert_frame_equal(left.invoices, right.invoices)
+    assert left.schema.to_dict() == right.schema.to_dict()
+    left_footer, right_footer = left.footer.to_dict(), right.footer.to_dict()
+    # Footer rows hold NaN for blank cells, so they are compared as frames
+    pd.testing.assert_frame_equal(pd.DataFrame(left_footer.pop('row_values')),
+                                  pd.DataFrame(right_footer.pop('row_values')))
+    assert left_footer == right_footer
+    assert left.vendor_payments.hits == right.vendor_payments.hits
+
+
+@pytest.mark.parametrize('year', ['2024', '2025'])
+def test_direct_engine_matches_openpyxl(project_list, year):
+    path = project_list(year)
+    direct = ProjectListSnapshot.parse(year, path, engine='direct')
+    assert_same_snapshot(direct, ProjectListSnapshot.parse(year, path, engine='openpyxl'))
+    assert direct.vendor_payments.count > 0
+    assert direct.vendor_payments.column_name == direct.schema.vendor_column_name
+
+
+def test_direct_engine_matches_openpyxl_with_declared_columns(project_list):
+    path = project_list('2025')
+    require_invoice_columns('test', ['acgi', 'invoice_date', 'amount_invoiced'])
+    direct = ProjectListSnapshot.parse('2025', path, engine='direct')
+    assert_same_snapshot(direct, ProjectListSnapshot.parse('2025', path, engine='openpyxl'))
+    assert list(direct.invoices.columns) == ['ACGI #', 'Invoice Date', 'Amount Invoiced']
+
+
+def test_sheet_cache_paths(tmp_path):
+    cache = SheetCache(str(tmp_path / 'cache'))
+    workbook = str(tmp_path / 'book.xlsx')
+    payload = {'rows': [1, 2, 3]}
+    cache.store(workbook, '2025', 100, 1.0, 'abc', payload, columns=['b', 'a'])
+
+    assert cache.lookup(workbook, '2025', 100, 1.0, columns=['a', 'b']) == 'hit'
+    assert cache.load(workbook, '2025', 100, 1.0, columns=['a', 'b']) == payload
+
+    # Only the mtime moved: the content hash decides
+    assert cache.lookup(workbook, '2025', 100, 2.0, columns=['a', 'b']) == 'check-hash'
+    assert cache.load(workbook, '2025', 100, 2.0, data_hash='other', columns=['a', 'b']) is None
+    assert cache.load(workbook, '2025', 100, 2.0, data_hash='abc', columns=['a', 'b']) == payload
+    assert cache.lookup(workbook, '2025', 100, 2.0, columns=['a', 'b']) == 'hit'
+
+    # Misses: another size, another column set, another sheet
+    assert cache.lookup(workbook, '2025', 101, 2.0, columns=['a', 'b']) is None
+    assert cache.lookup(workbook, '2025', 100, 2.0, columns=['a']) is None
+    assert cache.lookup(workbook, '2025', 100, 2.0) is None
+    assert cache.lookup(workbook, '2024', 100, 2.0, columns=['a', 'b']) is None
+
+
+def test_snapshots_come_from_the_sheet_cache(project_list, monkeypatch):
+    path = project_list('2025')
+    require_invoice_columns('test', ['acgi', 'invoice_date', 'amount_invoiced'])
+    parsed = get_project_list_snapshot('2025', path)
+
+    parse = ProjectListSnapshot.parse
+    calls = []
+    def counting_parse(*args, **kwargs):
+        calls.append(args[:2])
+        return parse(*args, **kwargs)
+    monkeypatch.setattr(ProjectListSnapshot, 'parse', counting_parse)
+
+    # Hit: same size and mtime
+    clear_project_list_snapshots()
+    assert_same_snapshot(get_project_list_snapshot('2025', path), parsed)
+    assert calls == []
+
+    # Check-hash: the file was touched but not changed
+    stat = os.stat(path)
+    os.utime(path, (stat.st_atime, stat.st_mtime + 60))
+    clear_project_list_snapshots()
+    assert_same_snapshot(get_project_list_snapshot('2025', path), parsed)
+    assert calls == []
+
+    # Miss: more columns are declared than were cached
+    require_invoice_columns('other', ['dept'])
+    clear_project_list_snapshots()
+    assert 'Dept' in get_project_list_snapshot('2025', path).invoices.columns
+    assert len(calls) == 1
+
+    # Miss: the workbook changed
+    wb = load_workbook(path)
+    wb['2025']['J7'] = 12345.67
+    wb.save(path)
+    clear_project_list_snapshots()
+    snapshot = get_project_list_snapshot('2025', path)
+    assert len(calls) == 2
+    assert snapshot.invoices['Amount Invoiced'].iloc[0] == 12345.67
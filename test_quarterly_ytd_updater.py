@@ -0,0 +1,87 @@
+"""
+Incremental quarterly YTD updates against full rebuilds of the same data.
+"""
+
+import logging
+import os
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+from openpyxl import Workbook, load_workbook
+
+from quarterly_ytd_updater import update_quarterly_ytd
+
+
+def quarter_info(folder, name):
+    return {'quarter_num': 4, 'quarter_name': '4th Quarter', 'year': 2025,
+            'start_date': datetime(2025, 10, 1), 'end_date': datetime(2025, 12, 31),
+            'start_month': 10, 'end_month': 12, 'month_names': ['October', 'November', 'December'],
+            'month_abbrevs': ['Oct', 'Nov', 'Dec'], 'month_indices': {10: 9, 11: 10, 12: 11},
+            'quarterly_file': os.path.join(folder, name), 'quarterly_sheets_dir': folder}
+
+
+@pytest.fixture
+def completion_data():
+    rng = np.random.default_rng(3)
+    n = 300
+    invoice_dates = pd.Timestamp('2025-10-01') + pd.to_timedelta(rng.integers(0, 60, n), unit='D')
+    amounts = rng.uniform(100, 5000, n).round(2)
+    return pd.DataFrame({
+        'ACGI #': [f'{rng.choice([24, 25])}-{rng.integers(1, 3000):04d}' for _ in range(n)],
+        'Dept': rng.choice(['ENG', 'FAB', 'QA'], n),
+        'Project Number/Name': [f'Project {i}' for i in range(n)],
+        'Type': rng.choice(['Completion', 'Partial'], n),
+        'Client / PO #': [f'PO-{i}' for i in range(n)],
+        'Line #': rng.integers(1, 9, n),
+        'PO Date': invoice_dates - pd.Timedelta(days=30),
+        'Amount': amounts,
+        'Invoice Date': invoice_dates,
+        'Amount Invoiced': amounts,
+        'Completion Date': invoice_dates,
+        'Source_Year': '2025',
+    })
+
+
+@pytest.fixture
+def previous_quarter(tmp_path):
+    """3rd quarter YTD sheet whose monthly totals carry float noise"""
+    totals = [872459.74, 609301.81, 463345.08, 2751568.136999999, 512345.1000000001, 0.1 + 0.2,
+              700000.0, 650000.0049999, 0, 0, 0, 0]
+    wb = Workbook()
+    for column, total in enumerate(totals + [sum(totals)], 1):
+        wb.active.cell(row=2, column=column, value=total)
+    wb.save(tmp_path / '2025 3rd Quarter YTD.xlsx')
+
+
+def test_incremental_updates_match_full_rebuilds(tmp_path, completion_data, previous_quarter, sheet_dump, caplog):
+    caplog.set_level(logging.INFO)
+    folder = str(tmp_path)
+    dates = completion_data['Invoice Date']
+    changed = completion_data[dates <= '2025-11-10'].copy()
+    changed.iloc[5, changed.columns.get_loc('Amount Invoiced')] = 12345.67
+    grown = pd.concat([changed, changed.iloc[[5]].assign(**{'ACGI #': '25-9999'})], ignore_index=True)
+    stages = [
+        ('first', completion_data[dates <= '2025-10-20']),
+        ('unchanged', completion_data[dates <= '2025-10-20']),
+        ('appended', completion_data[dates <= '2025-11-10']),
+        ('changed', changed),
+        ('grown', grown),
+        ('shrunk', grown[grown['Invoice Date'] <= '2025-10-15']),
+        ('empty', completion_data.iloc[:0]),
+        ('all', completion_data),
+    ]
+    for name, data in stages:
+        incremental = quarter_info(folder, '2025 4th Quarter YTD.xlsx')
+        full = quarter_info(folder, f'full {name}.xlsx')
+        caplog.clear()
+        assert update_quarterly_ytd(data.copy(), incremental, incremental=True)
+        assert ('Rewrote' in caplog.text) == (name != 'first'), name
+        assert update_quarterly_ytd(data.copy(), full, incremental=False)
+        assert sheet_dump(incremental['quarterly_file']) == sheet_dump(full['quarterly_file']), name
+
+    # Monthly totals are written in cents, whatever noise the previous quarter's totals carried
+    totals = [cell.value for cell in load_workbook(incremental['quarterly_file']).active[2]]
+    assert totals[3] == 2751568.14
+    assert totals == [round(total, 2) for total in totals]
@@ -0,0 +1,68 @@
+"""
+Daily tables appended to a YTD sheet by patching its XML against the same
+tables written by loading and saving the workbook.
+"""
+
+import shutil
+from datetime import date
+
+import pandas as pd
+import pytest
+from openpyxl import Workbook
+
+import daily_summary_generator
+from daily_summary_generator import update_ytd_sheet
+
+
+def daily_invoices(day, count):
+    return pd.DataFrame({
+        'ACGI #': [f'25-{1000 + i}' for i in range(count)],
+        'Dept': ['ENG'] * count,
+        'Project Number/Name': [f'Project {i}' for i in range(count)],
+        'Type': ['Completion'] * count,
+        'Client / PO #': [f'PO-{i}' for i in range(count)],
+        'Line # ': [i + 1 for i in range(count)],
+        'PO Date': [pd.Timestamp(day) - pd.Timedelta(days=30)] * count,
+        'Amount': [100.25 * (i + 1) for i in range(count)],
+        'Invoice Date': [pd.Timestamp(day)] * count,
+        'Amount Invoiced': [100.25 * (i + 1) for i in range(count)],
+    })
+
+
+@pytest.fixture
+def ytd_sheets(tmp_path):
+    """The same empty YTD sheet in two report folders (reports are saved without backups)"""
+    paths = []
+    for name in ('patched', 'loaded'):
+        folder = tmp_path / name / 'reports'
+        folder.mkdir(parents=True)
+        paths.append(str(folder / '2025 4th Quarter YTD.xlsx'))
+    Workbook().save(paths[0])
+    shutil.copy(paths[0], paths[1])
+    return paths
+
+
+def test_appended_tables_match_a_full_save(ytd_sheets, sheet_dump, monkeypatch):
+    patched, loaded = ytd_sheets
+    first = [(date(2025, 10, 13), daily_invoices('2025-10-13', 3))]
+    later = [(date(2025, 10, 14), daily_invoices('2025-10-14', 5)),
+             (date(2025, 10, 15), daily_invoices('2025-10-15', 1))]
+
+    append = daily_summary_generator.append_daily_tables
+    appended = []
+    def recording_append(ytd_file_path, daily_tables):
+        appended.append(append(ytd_file_path, daily_tables))
+        return appended[-1]
+    monkeypatch.setattr(daily_summary_generator, 'append_daily_tables', recording_append)
+
+    monkeypatch.setattr(daily_summary_generator, 'find_ytd_sheet', lambda year, quarter: patched)
+    assert update_ytd_sheet(2025, 4, first)
+    assert update_ytd_sheet(2025, 4, later)
+    assert appended == [False, True]  # The empty sheet has no date block index yet
+
+    monkeypatch.setattr(daily_summary_generator, 'append_daily_tables', lambda ytd_file_path, daily_tables: False)
+    monkeypatch.setattr(daily_summary_generator, 'find_ytd_sheet', lambda year, quarter: loaded)
+    assert update_ytd_sheet(2025, 4, first)
+    assert update_ytd_sheet(2025, 4, later)
+
+    assert sheet_dump(patched) == sheet_dump(loaded)
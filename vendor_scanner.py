@@ -0,0 +1,91 @@
+"""
+Vendor Payment Scanner
+Finds the vendors-to-be-paid amounts in a Project List: numeric cells of the
+vendor payment column (V or W) highlighted with the cyan/aqua fill.
+"""
+
+from openpyxl.utils import get_column_letter
+
+# Target cyan/aqua fill for vendors to be paid: rgb(3,255,255) = 03FFFF
+# plus the close variants rgb(0-10,255,255)
+TARGET_CYAN_COLORS = {f'{n:02X}FFFF' for n in range(0, 11)}
+
+
+def get_vendor_column(year):
+    """
+    Get the vendor payment column for a Project List year.
+    2023 & 2024 use Column V (22), 2025 and later use Column W (23).
+    Returns a tuple (1-based column number, column letter).
+    """
+    if str(year) in ['2023', '2024']:
+        return 22, 'V'
+    return 23, 'W'
+
+
+def is_cyan_color(color_rgb):
+    """Check if an RGB or ARGB color string matches the vendors-to-be-paid cyan"""
+    if not isinstance(color_rgb, str):
+        return False
+    color_rgb = color_rgb.upper()
+    if color_rgb in TARGET_CYAN_COLORS:
+        return True
+    # Handle ARGB format (FF + RGB)
+    return len(color_rgb) == 8 and color_rgb.startswith('FF') and color_rgb[2:] in TARGET_CYAN_COLORS
+
+
+def _fill_rgb(fill):
+    """Start color RGB of an openpyxl fill, or None for theme/indexed/no color"""
+    if fill and fill.start_color and isinstance(fill.start_color.rgb, str):
+        return fill.start_color.rgb
+    return None
+
+
+class VendorPaymentScan:
+    """
+    Collects cyan vendor payment cells of one Project List's vendor column
+(1-based, normally ProjectListSchema.vendor_column).
+
+    Workbooks share a small table of fills between thousands of cells, so
+    the cyan check runs once per distinct fill index and is memoized.
+    """
+
+    def __init__(self, column, hits=None):
+        self.column = column
+        self.column_name = get_column_letter(column)
+        self.hits = list(hits or [])  # (row number, amount, fill RGB)
+        self._fill_memo = {}
+
+    @property
+    def total(self):
+        return sum(amount for _, amount, _ in self.hits)
+
+    @property
+    def count(self):
+        return len(self.hits)
+
+    def add(self, row_number, value, fill_id, get_fill_rgb):
+        """
+        Record a vendor column value if its fill is cyan and it is numeric.
+        get_fill_rgb(fill_id) is only called the first time a fill index is seen.
+        """
+        if value is None:
+            return
+        if fill_id not in self._fill_memo:
+            color_rgb = get_fill_rgb(fill_id)
+            self._fill_memo[fill_id] = color_rgb if is_cyan_color(color_rgb) else None
+        color_rgb = self._fill_memo[fill_id]
+        if color_rgb is None:
+            return
+        try:
+            amount = float(value)
+        except (ValueError, TypeError):
+            return  # Skip non-numeric values
+        self.hits.append((row_number, amount, color_rgb))
+
+    def add_cell(self, cell):
+        """Record an openpyxl read-only vendor column cell"""
+        if cell.value is None:
+            return
+        fill_id = cell.style_array.fillId if cell.has_style else 0
+        self.add(cell.row, cell.value, fill_id, lambda _: _fill_rgb(cell.fill))
+
@@ -0,0 +1,140 @@
+"""
+Append-only XLSX Patcher
+Appends rows to the end of a worksheet inside an existing xlsx archive by
+splicing them into the sheet XML, instead of loading the whole workbook
+into openpyxl and serializing all of it again.
+"""
+
+import os
+import re
+import zipfile
+from openpyxl import Workbook
+from openpyxl.cell._writer import etree_write_cell
+from openpyxl.styles.stylesheet import apply_stylesheet
+from openpyxl.utils import get_column_letter
+from openpyxl.xml.functions import tostring
+
+from xlsx_reader import XlsxColumnReader, column_index
+
+DIMENSION_PATTERN = re.compile(rb'<dimension ref="([A-Z]+)(\d+)(?::([A-Z]+)(\d+))?"')
+ROW_NUMBER_PATTERN = re.compile(rb'<row [^>]*?\br="(\d+)"')
+MERGE_CELLS_PATTERN = re.compile(rb'<mergeCells count="(\d+)"')
+
+# Worksheet elements the schema places between sheetData and mergeCells
+BEFORE_MERGE_CELLS = (b'sheetCalcPr', b'sheetProtection', b'protectedRanges', b'scenarios', b'autoFilter',
+                      b'sortState', b'dataConsolidate', b'customSheetViews')
+
+
+class _ElementList(list):
+    """Collects the elements openpyxl's cell writer emits (it only calls write())"""
+
+    def write(self, element):
+        self.append(element)
+
+
+class XlsxRowAppender:
+    """
+    Append rows below the last row of an xlsx file's active sheet.
+
+    Rows are written into `worksheet`, a scratch sheet of a workbook carrying
+    the file's stylesheet, using the sheet's real row numbers. save() turns
+    them into row elements with openpyxl's own cell writer, so values and
+    style indices are exactly what a full load and save would write. Only the
+    sheet XML member is rewritten; every other member is copied as is.
+
+    save() raises ValueError if the rows cannot be appended by patching (they
+    overlap existing rows, need a cell style the file does not have yet, or
+    the sheet XML is not laid out as expected).
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with XlsxColumnReader(path) as reader:
+            self.sheet_member = reader.sheet_member(reader.active_sheet)
+            self.style_count = len(reader.stylesheet.cell_styles)
+            self.workbook = Workbook()
+            apply_stylesheet(reader.archive, self.workbook)
+        self.worksheet = self.workbook.active
+        self._patched = None
+
+    def _row_elements(self):
+        """Serialized <row> elements of the scratch sheet; returns (xml, first row, last row, last column)"""
+        ws = self.worksheet
+        first_row, last_row, last_column = None, None, 1
+        chunks = []
+        for row in ws.iter_rows(min_row=ws.min_row):
+            elements = _ElementList()
+            for cell in row:
+                if cell.value is None and not cell.has_style:
+                    continue
+                if cell.has_style and cell.style_id >= self.style_count:
+                    raise ValueError(f"{cell.coordinate} needs a cell style the workbook does not have yet")
+                etree_write_cell(elements, ws, cell, cell.has_style)
+                last_column = max(last_column, cell.column)
+            if elements:
+                first_row = first_row or row[0].row
+                last_row = row[0].row
+                chunks.append(f'<row r="{row[0].row}">'.encode('utf-8'))
+                chunks.extend(tostring(element) for element in elements)
+                chunks.append(b'</row>')
+        if first_row is None:
+            raise ValueError("No rows to append")
+        return b''.join(chunks), first_row, last_row, last_column
+
+    def _patch(self, data):
+        """Sheet XML with the scratch rows, their merged ranges and the new dimension spliced in"""
+        rows, first_row, last_row, last_column = self._row_elements()
+
+        end = data.rfind(b'</sheetData>')
+        if end == -1:
+            empty = re.search(rb'<sheetData\s*/>', data)
+            if empty is None:
+                raise ValueError("Sheet XML has no sheetData element")
+            data = data[:empty.start()] + b'<sheetData></sheetData>' + data[empty.end():]
+            end = data.rfind(b'</sheetData>')
+        last_existing = data.rfind(b'<row ', 0, end)
+        if last_existing != -1:
+            match = ROW_NUMBER_PATTERN.match(data, last_existing)
+            if match is None or int(match.group(1)) >= first_row:
+                raise ValueError(f"Sheet already has rows at or below row {first_row}")
+        data = data[:end] + rows + data[end:]
+
+        merges = [rng.coord for rng in self.worksheet.merged_cells.ranges]
+        if merges:
+            entries = b''.join(f'<mergeCell ref="{coord}"/>'.encode('utf-8') for coord in sorted(merges))
+            match = MERGE_CELLS_PATTERN.search(data)
+            if match is not None:
+                close = data.index(b'</mergeCells>', match.end())
+                count = str(int(match.group(1)) + len(merges)).encode('utf-8')
+                data = data[:match.start(1)] + count + data[match.end(1):close] + entries + data[close:]
+            else:
+                after = data.index(b'</sheetData>') + len(b'</sheetData>')
+                if data[after:].lstrip().startswith(tuple(b'<' + name for name in BEFORE_MERGE_CELLS)):
+                    raise ValueError("Sheet XML has elements between sheetData and mergeCells")
+                data = (data[:after] + f'<mergeCells count="{len(merges)}">'.encode('utf-8') + entries
+                        + b'</mergeCells>' + data[after:])
+
+        match = DIMENSION_PATTERN.search(data)
+        if match is not None:
+            start_column, start_row, end_column = match.group(1), match.group(2), match.group(3) or match.group(1)
+            end_column = get_column_letter(max(column_index(end_column.decode('ascii')), last_column))
+            ref = start_column + start_row + b':' + end_column.encode('ascii') + str(last_row).encode('ascii')
+            data = data[:match.start(1)] + ref + data[match.end(0) - 1:]
+        return data
+
+    def save(self, path):
+        """Write the file with the appended rows to path (through a temporary file)"""
+        tmp_path = path + '.tmp'
+        try:
+            with zipfile.ZipFile(self.path) as source, zipfile.ZipFile(tmp_path, 'w', zipfile.ZIP_DEFLATED) as target:
+                for info in source.infolist():
+                    if info.filename == self.sheet_member:
+                        if self._patched is None:
+                            self._patched = self._patch(source.read(info))
+                        target.writestr(info, self._patched)
+                    else:
+                        target.writestr(info, source.read(info))
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
@@ -0,0 +1,331 @@
+"""
+Direct XLSX Column Reader
+Lightweight reader that pulls selected columns straight out of an xlsx
+archive with an incremental XML parser, instead of building a full
+pandas/openpyxl object model of every sheet.
+"""
+
+import io
+import mmap
+import posixpath
+import zipfile
+import xml.etree.ElementTree as ET
+from openpyxl.styles.stylesheet import Stylesheet
+from openpyxl.xml.functions import fromstring
+from openpyxl.utils.datetime import from_excel, MAC_EPOCH, WINDOWS_EPOCH
+
+MAIN_NS = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+REL_NS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+PKG_REL_NS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+
+ROW_TAG = f'{{{MAIN_NS}}}row'
+CELL_TAG = f'{{{MAIN_NS}}}c'
+VALUE_TAG = f'{{{MAIN_NS}}}v'
+INLINE_STRING_TAG = f'{{{MAIN_NS}}}is'
+STRING_ITEM_TAG = f'{{{MAIN_NS}}}si'
+TEXT_TAG = f'{{{MAIN_NS}}}t'
+RUN_TAG = f'{{{MAIN_NS}}}r'
+
+# Available reader engines for Project List and YTD sheet reads
+READER_ENGINES = ['openpyxl', 'direct']
+
+
+def column_index(letters):
+    """Convert column letters ('A', 'W', 'AB') to a 1-based column number"""
+    index = 0
+    for char in letters:
+        index = index * 26 + (ord(char) - 64)
+    return index
+
+
+def _split_coordinate(coordinate):
+    """Split 'W123' into (123, 23) without regex overhead"""
+    for i, char in enumerate(coordinate):
+        if char.isdigit():
+            return int(coordinate[i:]), column_index(coordinate[:i])
+    raise ValueError(f"Invalid cell coordinate: {coordinate}")
+
+
+def _text_content(node):
+    """Plain text of a shared/inline string item (ignores phonetic runs)"""
+    snippets = []
+    for child in node:
+        if child.tag == TEXT_TAG:
+            snippets.append(child.text or '')
+        elif child.tag == RUN_TAG:
+            text = child.find(TEXT_TAG)
+            if text is not None:
+                snippets.append(text.text or '')
+    return ''.join(snippets)
+
+
+def _cast_number(value):
+    """Convert a numeric cell string to int or float"""
+    if '.' in value or 'E' in value or 'e' in value:
+        return float(value)
+    return int(value)
+
+
+class _MappedFile:
+    """Read-only file object over a memory-mapped workbook (mmap lacks seekable() before 3.13)"""
+
+    def __init__(self, mapped):
+        self._mapped = mapped
+
+    def read(self, size=-1):
+        return self._mapped.read(size)
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        self._mapped.seek(offset, whence)
+        return self._mapped.tell()
+
+    def tell(self):
+        return self._mapped.tell()
+
+    def seekable(self):
+        return True
+
+
+class _SharedStrings:
+    """
+    Shared string table decoded on demand.
+    The XML is parsed incrementally only as far as the highest index requested.
+    """
+
+    def __init__(self, archive, member):
+        self._archive = archive
+        self._member = member
+        self._strings = []
+        self._stream = None
+        self._events = None
+        self._done = member is None
+
+    def __getitem__(self, index):
+        while index >= len(self._strings) and not self._done:
+            self._advance()
+        return self._strings[index]
+
+    def _advance(self):
+        if self._events is None:
+            self._stream = self._archive.open(self._member)
+            self._events = ET.iterparse(self._stream, events=('end',))
+        for _, node in self._events:
+            if node.tag == STRING_ITEM_TAG:
+                self._strings.append(_text_content(node).replace('x005F_', ''))
+                node.clear()
+                return
+        self._done = True
+
+    def close(self):
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+        self._events = None
+        self._done = True
+
+
+class XlsxCell:
+    """A decoded cell: value plus the raw style index"""
+
+    __slots__ = ('row', 'column', 'value', 'data_type', 'style_id')
+
+    def __init__(self, row, column, value, data_type, style_id):
+        self.row = row
+        self.column = column
+        self.value = value
+        self.data_type = data_type
+        self.style_id = style_id
+
+
+class XlsxColumnReader:
+    """
+    Read cell values and style indices for selected columns of an xlsx workbook.
+
+    source is a file path, raw bytes or a binary file object. With
+    use_mmap=True a path is memory-mapped instead of read through buffered I/O.
+    Values are converted the same way openpyxl does in read-only, cached-value
+    mode (numbers, dates by number format, booleans, shared/inline strings).
+    """
+
+    def __init__(self, source, use_mmap=False):
+        self._file = None
+        self._mmap = None
+        if isinstance(source, (bytes, bytearray)):
+            source = io.BytesIO(source)
+        elif isinstance(source, str) and use_mmap:
+            self._file = open(source, 'rb')
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            source = _MappedFile(self._mmap)
+        self.archive = zipfile.ZipFile(source)
+
+        self._sheet_paths = self._read_sheet_paths()
+        self._epoch = WINDOWS_EPOCH
+        self._active_tab = 0
+        self._read_workbook_properties()
+        self._stylesheet = None
+        self._shared_strings = _SharedStrings(self.archive, self._find_member('xl/sharedStrings.xml'))
+
+    def close(self):
+        self._shared_strings.close()
+        self.archive.close()
+        if self._mmap is not None:
+            self._mmap.close()
+        if self._file is not None:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _find_member(self, name):
+        """Find an archive member case-insensitively (some writers vary the case)"""
+        names = {member.lower(): member for member in self.archive.namelist()}
+        return names.get(name.lower())
+
+    def _read_sheet_paths(self):
+        """Map sheet names to worksheet XML members"""
+        rels = ET.fromstring(self.archive.read(self._find_member('xl/_rels/workbook.xml.rels')))
+        targets = {}
+        for rel in rels.iter(f'{{{PKG_REL_NS}}}Relationship'):
+            target = rel.get('Target')
+            if target.startswith('/'):
+                target = target[1:]
+            else:
+                target = posixpath.normpath(posixpath.join('xl', target))
+            targets[rel.get('Id')] = target
+
+        workbook = ET.fromstring(self.archive.read(self._find_member('xl/workbook.xml')))
+        sheet_paths = {}
+        for sheet in workbook.iter(f'{{{MAIN_NS}}}sheet'):
+            sheet_paths[sheet.get('name')] = targets[sheet.get(f'{{{REL_NS}}}id')]
+        return sheet_paths
+
+    def _read_workbook_properties(self):
+        workbook = ET.fromstring(self.archive.read(self._find_member('xl/workbook.xml')))
+        properties = workbook.find(f'{{{MAIN_NS}}}workbookPr')
+        if properties is not None and properties.get('date1904') in ('1', 'true'):
+            self._epoch = MAC_EPOCH
+        view = workbook.find(f'{{{MAIN_NS}}}bookViews/{{{MAIN_NS}}}workbookView')
+        if view is not None and view.get('activeTab'):
+            self._active_tab = int(view.get('activeTab'))
+
+    @property
+    def sheetnames(self):
+        return list(self._sheet_paths)
+
+    def sheet_member(self, sheet_name):
+        """Archive member holding a sheet's XML"""
+        if sheet_name not in self._sheet_paths:
+            raise ValueError(f"Worksheet named '{sheet_name}' not found")
+        return self._find_member(self._sheet_paths[sheet_name])
+
+    @property
+    def active_sheet(self):
+        """Name of the sheet that opens by default (openpyxl's wb.active)"""
+        names = self.sheetnames
+        return names[self._active_tab] if self._active_tab < len(names) else names[0]
+
+    @property
+    def stylesheet(self):
+        """Workbook stylesheet, parsed on first use (styles.xml is small)"""
+        if self._stylesheet is None:
+            member = self._find_member('xl/styles.xml')
+            if member is None:
+                self._stylesheet = Stylesheet()
+            else:
+                self._stylesheet = Stylesheet.from_tree(fromstring(self.archive.read(member)))
+        return self._stylesheet
+
+    def fill_id(self, style_id):
+        """Fill index referenced by a cell style index"""
+        cell_styles = self.stylesheet.cell_styles
+        if style_id < len(cell_styles):
+            return cell_styles[style_id].fillId
+        return 0
+
+    def fill_rgb(self, fill_id):
+        """Foreground (start) color RGB of a fill, or None for theme/indexed/no color"""
+        fills = self.stylesheet.fills
+        if fill_id >= len(fills):
+            return None
+        fill = fills[fill_id]
+        color = getattr(fill, 'start_color', None)
+        rgb = getattr(color, 'rgb', None) if color is not None else None
+        return rgb if isinstance(rgb, str) else None
+
+    def _convert(self, raw, data_type, style_id, inline):
+        """Decode a raw cell value the way openpyxl's worksheet parser does"""
+        if data_type == 'inlineStr':
+            return (_text_content(inline) if inline is not None else None), 's'
+        if raw is None:
+            return None, data_type
+        if data_type == 'n':
+            value = _cast_number(raw)
+            if style_id in self.stylesheet.date_formats:
+                try:
+                    return from_excel(value, self._epoch,
+                                      timedelta=style_id in self.stylesheet.timedelta_formats), 'd'
+                except (OverflowError, ValueError):
+                    return '#VALUE!', 'e'
+            return value, 'n'
+        if data_type == 's':
+            return self._shared_strings[int(raw)], 's'
+        if data_type == 'b':
+            return bool(int(raw)), 'b'
+        if data_type == 'str':
+            return raw, 's'
+        return raw, data_type
+
+    def iter_rows(self, sheet_name, columns=None, max_row=None):
+        """
+        Stream a sheet row by row.
+        columns is an optional iterable of 1-based column numbers to extract;
+        other cells are skipped before their values are decoded.
+        Yields (row number, list of XlsxCell) for rows that exist in the XML.
+        """
+        wanted = set(columns) if columns is not None else None
+
+        source = self.archive.open(self.sheet_member(sheet_name))
+        try:
+            row_counter = 0
+            for _, node in ET.iterparse(source, events=('end',)):
+                if node.tag != ROW_TAG:
+                    continue
+                row_number = int(node.get('r')) if node.get('r') else row_counter + 1
+                row_counter = row_number
+                if max_row is not None and row_number > max_row:
+                    break
+
+                cells = []
+                col_counter = 0
+                for element in node.iter(CELL_TAG):
+                    coordinate = element.get('r')
+                    if coordinate:
+                        _, column = _split_coordinate(coordinate)
+                    else:
+                        column = col_counter + 1
+                    col_counter = column
+                    if wanted is not None and column not in wanted:
+                        continue
+
+                    style = element.get('s')
+                    style_id = int(style) if style else 0
+                    data_type = element.get('t', 'n')
+                    raw = element.findtext(VALUE_TAG) or None
+                    inline = element.find(INLINE_STRING_TAG) if data_type == 'inlineStr' else None
+                    value, data_type = self._convert(raw, data_type, style_id, inline)
+                    cells.append(XlsxCell(row_number, column, value, data_type, style_id))
+
+                node.clear()
+                yield row_number, cells
+        finally:
+            source.close()
+
+    def read_row(self, sheet_name, row_number, columns=None):
+        """Values of one row as {column number: value}"""
+        for current_row, cells in self.iter_rows(sheet_name, columns, max_row=row_number):
+            if current_row == row_number:
+                return {cell.column: cell.value for cell in cells}
+        return {}
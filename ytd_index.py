@@ -0,0 +1,209 @@
+"""
+YTD Index
+Sidecar records of a quarterly YTD workbook's layout, trusted only while the
+workbook's size and modification time match what was recorded:
+- YtdDayIndex: how quarterly_ytd_updater last wrote it (row range, content
+  fingerprint and rendered column widths of each day block, plus the monthly
+  totals row), so a workbook changed by anything else is rebuilt from scratch.
+- YtdDateBlockIndex: the row range of each date block as the daily summary's
+  table writer sees it, so a day is found, replaced or appended without
+  scanning the sheet; a stale record is rebuilt with one pass over the sheet.
+"""
+
+import json
+import os
+import re
+
+INDEX_SUFFIX = '.index.json'
+INDEX_FORMAT_VERSION = 1
+
+BLOCKS_SUFFIX = '.blocks.json'
+BLOCKS_FORMAT_VERSION = 1
+
+# Date header of a block in column A, e.g. "Tuesday 10-14-2025 (Invoice Date)"
+DATE_HEADER_PATTERN = re.compile(r'(?:Mon|Tues|Wednes|Thurs|Fri|Satur|Sun)day \d{1,2}-\d{1,2}-\d{4}')
+WEEKDAYS = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+
+def index_path(workbook_path):
+    """Sidecar path for a workbook ('2025 2nd Quarter YTD.xlsx' -> '2025 2nd Quarter YTD.index.json')"""
+    return os.path.splitext(workbook_path)[0] + INDEX_SUFFIX
+
+
+def blocks_path(workbook_path):
+    """Date block sidecar path ('2025 2nd Quarter YTD.xlsx' -> '2025 2nd Quarter YTD.blocks.json')"""
+    return os.path.splitext(workbook_path)[0] + BLOCKS_SUFFIX
+
+
+def _load_sidecar(path, workbook_path, version):
+    """Sidecar data if it has the given version and matches the workbook's size and mtime, else None"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        stat = os.stat(workbook_path)
+    except (OSError, ValueError):
+        return None
+    if data.get('version') != version:
+        return None
+    if data.get('size') != stat.st_size or data.get('mtime') != stat.st_mtime:
+        return None
+    return data
+
+
+def _save_sidecar(path, workbook_path, version, data):
+    """Write sidecar data recorded against the workbook's current size and mtime"""
+    stat = os.stat(workbook_path)
+    data = dict(data, version=version, size=stat.st_size, mtime=stat.st_mtime)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=1)
+    os.replace(tmp_path, path)
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+class YtdDayIndex:
+    """
+    Day blocks of one quarterly YTD workbook, in sheet order.
+
+    Each entry of days is {'date': 'YYYY-MM-DD', 'fingerprint': ..., 'first_row': ...,
+    'last_row': ..., 'widths': [rendered width of columns A-J]}.
+    """
+
+    def __init__(self, workbook_path, days=None, monthly_totals=None):
+        self.workbook_path = workbook_path
+        self.days = list(days or [])
+        self.monthly_totals = list(monthly_totals or [])
+
+    @property
+    def path(self):
+        return index_path(self.workbook_path)
+
+    @classmethod
+    def load(cls, workbook_path):
+        """Index of a workbook, or None if there is none or the workbook changed since it was written"""
+        data = _load_sidecar(index_path(workbook_path), workbook_path, INDEX_FORMAT_VERSION)
+        if data is None:
+            return None
+        return cls(workbook_path, data['days'], data['monthly_totals'])
+
+    def save(self):
+        """Record the index against the workbook's current size and mtime"""
+        _save_sidecar(self.path, self.workbook_path, INDEX_FORMAT_VERSION,
+                      {'monthly_totals': self.monthly_totals, 'days': self.days})
+
+    def discard(self):
+        """Remove the sidecar (e.g. after the workbook was written without recording an index)"""
+        _remove(self.path)
+
+
+class YtdDateBlockIndex:
+    """
+    Date blocks of a quarterly YTD sheet: {date header: [first_row, last_row]}
+    in sheet order, plus the last row with a value in columns A-J (last_row)
+    and the sheet's last row (max_row).
+
+    The date header key is the "%A %m-%d-%Y"-style text at the start of the
+    block's column A header (the quarterly updater writes months and days
+    without leading zeros). Row ranges follow the daily table writer's rules:
+    a block ends before the next row naming a weekday in column A, or before
+    the first empty column A cell after its first three rows. Only block
+    headers match the date pattern, so the monthly summary rows are never
+    taken for a block.
+    """
+
+    def __init__(self, workbook_path, blocks=None, last_row=0, max_row=0):
+        self.workbook_path = workbook_path
+        self.blocks = dict(blocks or {})
+        self.last_row = last_row
+        self.max_row = max_row
+
+    @property
+    def path(self):
+        return blocks_path(self.workbook_path)
+
+    @classmethod
+    def load(cls, workbook_path):
+        """Index of a workbook, or None if there is none or the workbook changed since it was written"""
+        data = _load_sidecar(blocks_path(workbook_path), workbook_path, BLOCKS_FORMAT_VERSION)
+        if data is None:
+            return None
+        return cls(workbook_path, data['blocks'], data['last_row'], data['max_row'])
+
+    @classmethod
+    def scan(cls, workbook_path, ws):
+        """Build the index of a loaded worksheet with one pass over its rows"""
+        index = cls(workbook_path)
+        column_a = []
+        for row, values in enumerate(ws.iter_rows(min_col=1, max_col=10, values_only=True), 1):
+            column_a.append(values[0])
+            if any(values):
+                index.last_row = row
+        index.max_row = len(column_a)
+
+        open_header, open_row = None, None
+        for row in range(1, len(column_a) + 1):
+            value = column_a[row - 1]
+            if open_header is not None:
+                names_weekday = value and any(day in str(value) for day in WEEKDAYS)
+                if names_weekday or (not value and row > open_row + 3):
+                    index.blocks.setdefault(open_header, [open_row, row - 1])
+                    open_header = None
+            if open_header is None and value:
+                match = DATE_HEADER_PATTERN.search(str(value))
+                if match:
+                    open_header, open_row = match.group(0), row
+        if open_header is not None:
+            index.blocks.setdefault(open_header, [open_row, len(column_a)])
+        return index
+
+    def find(self, date_header):
+        """[first_row, last_row] of a date's block, or None"""
+        return self.blocks.get(date_header)
+
+    def append_row(self, first_row):
+        """
+        Header row for a new block: two blank rows after the last used row, or
+        first_row if nothing is used from there on (right after the sheet's last
+        row while that is above first_row).
+        """
+        if self.max_row < first_row:
+            return self.max_row + 1
+        insert_row = max(self.last_row + 1, first_row)
+        return insert_row + 2 if insert_row > first_row else insert_row
+
+    def following(self, row):
+        """Headers of the blocks that start after row"""
+        return [header for header, (first, _) in self.blocks.items() if first > row]
+
+    def record(self, date_header, first_row, last_row):
+        """Record a block written at first_row..last_row"""
+        self.blocks[date_header] = [first_row, last_row]
+        self.blocks = dict(sorted(self.blocks.items(), key=lambda item: item[1][0]))
+        self.last_row = max(self.last_row, last_row)
+        self.max_row = max(self.max_row, last_row)
+
+    def shift(self, after_row, delta):
+        """Move the blocks (and last rows) below after_row by delta rows"""
+        for rows in self.blocks.values():
+            if rows[0] > after_row:
+                rows[0] += delta
+                rows[1] += delta
+        if self.last_row > after_row:
+            self.last_row += delta
+        if self.max_row > after_row:
+            self.max_row += delta
+
+    def save(self):
+        """Record the index against the workbook's current size and mtime"""
+        _save_sidecar(self.path, self.workbook_path, BLOCKS_FORMAT_VERSION,
+                      {'last_row': self.last_row, 'max_row': self.max_row, 'blocks': self.blocks})
+
+    def discard(self):
+        """Remove the sidecar"""
+        _remove(self.path)